@@ -0,0 +1,552 @@
+"""
+Addons path indexer for the Odoo MCP Server
+
+Parses the manifests and Python models of every addon under the configured
+addons paths with `ast` (never importing them) and streams the XML data files
+their manifests load with `iterparse`, caches the result per file by mtime and
+size, and answers model, field, inheritance, module dependency and external
+ID lookups from memory.
+
+Kept free of the `mcp` import so process-pool workers start quickly.
+"""
+
+import ast
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from xml.etree.ElementTree import ParseError, iterparse
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+ADDONS_PATH_ENV = "ODOO_MCP_ADDONS_PATH"
+CACHE_FORMAT = 3
+PARALLEL_MIN_FILES = 64
+PARSE_CHUNK_SIZE = 32
+SKIPPED_DIRS = {"tests", "migrations", "upgrades", "static", "__pycache__"}
+MODEL_BASES = {"Model", "TransientModel", "AbstractModel"}
+RELATIONAL_TYPES = {"Many2one", "One2many", "Many2many"}
+AUTOMATIC_FIELDS = {"id", "display_name", "create_uid", "create_date", "write_uid", "write_date"}
+XML_CONTAINER_TAGS = {"odoo", "openerp", "data"}
+XML_RECORD_TAGS = {
+    "record": None,
+    "template": "ir.ui.view",
+    "menuitem": "ir.ui.menu",
+    "act_window": "ir.actions.act_window",
+    "report": "ir.actions.report",
+}
+
+
+def addons_paths() -> list[Path]:
+    value = os.environ.get(ADDONS_PATH_ENV, "")
+    return [Path(path).expanduser() for path in value.replace(os.pathsep, ",").split(",") if path.strip()]
+
+
+def _literal(node: ast.AST | None) -> Any:
+    if node is None:
+        return None
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return None
+
+
+def _parse_field(call: ast.Call) -> dict[str, Any] | None:
+    function = call.func
+    if not (isinstance(function, ast.Attribute) and isinstance(function.value, ast.Name) and function.value.id == "fields"):
+        return None
+
+    field = {"type": function.attr}
+    keywords = {keyword.arg: keyword.value for keyword in call.keywords if keyword.arg}
+    if function.attr in RELATIONAL_TYPES:
+        comodel = _literal(call.args[0]) if call.args else _literal(keywords.get("comodel_name"))
+        if isinstance(comodel, str):
+            field["comodel"] = comodel
+    related = _literal(keywords.get("related"))
+    if isinstance(related, str):
+        field["related"] = related
+    return field
+
+
+def _parse_model_class(node: ast.ClassDef) -> dict[str, Any] | None:
+    if not any(isinstance(base, ast.Attribute) and base.attr in MODEL_BASES for base in node.bases):
+        return None
+
+    attributes: dict[str, Any] = {}
+    fields: dict[str, dict[str, Any]] = {}
+    for statement in node.body:
+        if isinstance(statement, ast.Assign) and len(statement.targets) == 1:
+            target, value = statement.targets[0], statement.value
+        elif isinstance(statement, ast.AnnAssign) and statement.value is not None:
+            target, value = statement.target, statement.value
+        else:
+            continue
+        if not isinstance(target, ast.Name):
+            continue
+        if target.id in ("_name", "_inherit", "_inherits", "_description"):
+            attributes[target.id] = _literal(value)
+        elif isinstance(value, ast.Call):
+            field = _parse_field(value)
+            if field is not None:
+                field["line"] = statement.lineno
+                fields[target.id] = field
+
+    inherit = attributes.get("_inherit") or []
+    parents = [inherit] if isinstance(inherit, str) else [parent for parent in inherit if isinstance(parent, str)]
+    name = attributes.get("_name")
+    if not isinstance(name, str):
+        if not parents:
+            return None
+        name = parents[0]
+    delegated = attributes.get("_inherits")
+
+    return {
+        "class": node.name,
+        "name": name,
+        "inherit": parents,
+        "inherits": sorted(delegated) if isinstance(delegated, dict) else [],
+        "description": attributes.get("_description") if isinstance(attributes.get("_description"), str) else "",
+        "line": node.lineno,
+        "fields": fields,
+    }
+
+
+def parse_models_file(path: str) -> list[dict[str, Any]]:
+    try:
+        tree = ast.parse(Path(path).read_bytes(), filename=path)
+    except (OSError, SyntaxError, ValueError):
+        return []
+    return [model for node in ast.walk(tree) if isinstance(node, ast.ClassDef) for model in [_parse_model_class(node)] if model]
+
+
+def parse_xml_ids(path: str) -> list[dict[str, Any]]:
+    records: list[dict[str, Any]] = []
+    stack: list[tuple[str, dict[str, Any] | None]] = []
+    try:
+        for event, element in iterparse(path, events=("start", "end")):
+            if event == "start":
+                record = None
+                xml_id = element.get("id")
+                parent_tag = stack[-1][0] if stack else ""
+                if element.tag in XML_RECORD_TAGS and xml_id and parent_tag in XML_CONTAINER_TAGS | {"menuitem"}:
+                    record = {"id": xml_id, "model": element.get("model") or XML_RECORD_TAGS[element.tag]}
+                    if element.tag == "template" and element.get("inherit_id"):
+                        record["inherit_id"] = element.get("inherit_id")
+                    if element.tag == "menuitem":
+                        parent = element.get("parent")
+                        if not parent and parent_tag == "menuitem" and stack[-1][1] is not None:
+                            parent = stack[-1][1]["id"]
+                        if parent:
+                            record["parent"] = parent
+                        if element.get("action"):
+                            record["action"] = element.get("action")
+                    records.append(record)
+                stack.append((element.tag, record))
+                continue
+
+            _, record = stack.pop()
+            owner = stack[-1][1] if stack and stack[-1][0] == "record" else None
+            if element.tag == "field" and owner is not None and owner["model"] == "ir.ui.view":
+                name = element.get("name")
+                if name == "inherit_id" and element.get("ref"):
+                    owner["inherit_id"] = element.get("ref")
+                elif name == "model" and (element.text or "").strip():
+                    owner["res_model"] = element.text.strip()
+            if record is not None or not stack or stack[-1][0] in XML_CONTAINER_TAGS:
+                element.clear()
+    except (OSError, ParseError):
+        pass
+    return records
+
+
+def parse_addon_file(path: str) -> list[dict[str, Any]]:
+    return parse_xml_ids(path) if path.endswith(".xml") else parse_models_file(path)
+
+
+def qualify_xml_id(xml_id: str, module: str) -> str:
+    return xml_id if "." in xml_id else f"{module}.{xml_id}"
+
+
+def parse_manifest(path: str) -> dict[str, Any]:
+    try:
+        manifest = ast.literal_eval(Path(path).read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError, ValueError, TypeError, SyntaxError, MemoryError, RecursionError) as e:
+        return {"depends": [], "data": [], "error": f"{type(e).__name__}: {str(e).split(': <', 1)[0]}"}
+    if not isinstance(manifest, dict):
+        return {"depends": [], "data": [], "error": "Manifest is not a dict"}
+
+    def strings(key: str) -> list[str]:
+        value = manifest.get(key) or []
+        return [item for item in value if isinstance(item, str)] if isinstance(value, (list, tuple)) else []
+
+    return {
+        "name": str(manifest.get("name", "")),
+        "version": str(manifest.get("version", "")),
+        "depends": strings("depends"),
+        "data": strings("data") + strings("demo"),
+        "installable": bool(manifest.get("installable", True)),
+        "auto_install": bool(manifest.get("auto_install", False)),
+    }
+
+
+class DependencyGraph:
+    def __init__(self, depends: dict[str, list[str]]) -> None:
+        self.depends = depends
+        self.dependents: dict[str, list[str]] = {}
+        for module in sorted(depends):
+            for dependency in depends[module]:
+                self.dependents.setdefault(dependency, []).append(module)
+        self._closures: dict[str, frozenset[str]] = {}
+        self._reverse_closures: dict[str, frozenset[str]] = {}
+
+    @staticmethod
+    def _reachable(start: str, edges: dict[str, list[str]]) -> frozenset[str]:
+        seen: set[str] = set()
+        pending = list(edges.get(start, []))
+        while pending:
+            module = pending.pop()
+            if module not in seen:
+                seen.add(module)
+                pending += edges.get(module, [])
+        seen.discard(start)
+        return frozenset(seen)
+
+    def closure(self, module: str) -> frozenset[str]:
+        if module not in self._closures:
+            self._closures[module] = self._reachable(module, self.depends)
+        return self._closures[module]
+
+    def reverse_closure(self, module: str) -> frozenset[str]:
+        if module not in self._reverse_closures:
+            self._reverse_closures[module] = self._reachable(module, self.dependents)
+        return self._reverse_closures[module]
+
+    def install_order(self, modules: list[str]) -> tuple[list[str], list[str]]:
+        wanted = set(modules)
+        for module in modules:
+            wanted |= self.closure(module)
+        wanted &= set(self.depends)
+
+        remaining = {module: len(set(self.depends[module]) & wanted) for module in wanted}
+        ready = sorted(module for module, count in remaining.items() if count == 0)
+        order = []
+        while ready:
+            module = ready.pop(0)
+            order.append(module)
+            del remaining[module]
+            for dependent in self.dependents.get(module, []):
+                if dependent in remaining:
+                    remaining[dependent] -= 1
+                    if remaining[dependent] == 0:
+                        ready.append(dependent)
+            ready.sort()
+        return order, sorted(remaining)
+
+    def missing(self, modules: list[str] | None = None) -> dict[str, list[str]]:
+        scope = sorted(self.depends) if modules is None else sorted(set(modules).union(*(self.closure(m) for m in modules)))
+        result = {}
+        for module in scope:
+            absent = [dependency for dependency in self.depends.get(module, []) if dependency not in self.depends]
+            if absent:
+                result[module] = absent
+        return result
+
+    def cycles(self) -> list[list[str]]:
+        index: dict[str, int] = {}
+        lowlink: dict[str, int] = {}
+        stack: list[str] = []
+        on_stack: set[str] = set()
+        components = []
+        for root in sorted(self.depends):
+            if root in index:
+                continue
+            work = [(root, iter(self.depends[root]))]
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                module, edges = work[-1]
+                for dependency in edges:
+                    if dependency not in self.depends:
+                        continue
+                    if dependency not in index:
+                        index[dependency] = lowlink[dependency] = len(index)
+                        stack.append(dependency)
+                        on_stack.add(dependency)
+                        work.append((dependency, iter(self.depends[dependency])))
+                        break
+                    if dependency in on_stack:
+                        lowlink[module] = min(lowlink[module], index[dependency])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[module])
+                    if lowlink[module] == index[module]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == module:
+                                break
+                        if len(component) > 1 or module in self.depends[module]:
+                            components.append(sorted(component))
+        return components
+
+
+def discover_addons(paths: list[Path]) -> dict[str, Path]:
+    addons: dict[str, Path] = {}
+    for addons_path in paths:
+        if not addons_path.is_dir():
+            continue
+        for entry in sorted(addons_path.iterdir()):
+            if entry.name not in addons and (entry / "__manifest__.py").is_file():
+                addons[entry.name] = entry
+    return addons
+
+
+def process_pool(workers: int) -> "ProcessPoolExecutor":
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(method))
+
+
+def python_files(addon_root: Path, suffixes: tuple[str, ...] = (".py",)) -> list[Path]:
+    files = []
+    for directory, subdirs, filenames in os.walk(addon_root):
+        subdirs[:] = sorted(subdir for subdir in subdirs if subdir not in SKIPPED_DIRS and not subdir.startswith("."))
+        files += [
+            Path(directory) / filename
+            for filename in sorted(filenames)
+            if filename.endswith(suffixes) and filename != "__manifest__.py"
+        ]
+    return files
+
+
+def _xml_files(addon_root: Path, manifest: dict[str, Any]) -> list[Path]:
+    files = []
+    for name in manifest["data"]:
+        path = addon_root / name
+        if name.endswith(".xml") and path not in files and path.is_file():
+            files.append(path)
+    return files
+
+
+class AddonsIndex:
+    def __init__(self, paths: list[Path], cache_file: Path | None = None) -> None:
+        self.paths = paths
+        self.cache_file = cache_file
+        self.files: dict[str, tuple[int, int, str, list[dict[str, Any]]]] = {}
+        self.manifest_files: dict[str, tuple[int, int, str, dict[str, Any]]] = {}
+        self.addons: dict[str, Path] = {}
+        self.manifests: dict[str, dict[str, Any]] = {}
+        self.models: dict[str, dict[str, Any]] = {}
+        self.xml_ids: dict[str, list[dict[str, Any]]] = {}
+        self.inheriting_views: dict[str, list[str]] = {}
+        self.model_views: dict[str, list[str]] = {}
+        self._graph: DependencyGraph | None = None
+        self.parsed_files = 0
+        self._load_cache()
+        self.refresh()
+
+    def _load_cache(self) -> None:
+        if self.cache_file is None or not self.cache_file.is_file():
+            return
+        try:
+            cached = json.loads(self.cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if cached.get("format") == CACHE_FORMAT:
+            self.files = {path: tuple(entry) for path, entry in cached["files"].items()}
+            self.manifest_files = {path: tuple(entry) for path, entry in cached["manifests"].items()}
+
+    def _save_cache(self) -> None:
+        if self.cache_file is None:
+            return
+        partial = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cached = {"format": CACHE_FORMAT, "files": self.files, "manifests": self.manifest_files}
+            partial.write_text(json.dumps(cached), encoding="utf-8")
+            os.replace(partial, self.cache_file)
+        except OSError:
+            partial.unlink(missing_ok=True)
+
+    def refresh(self) -> int:
+        self.addons = discover_addons(self.paths)
+        manifests_changed = self._refresh_manifests()
+        current: dict[str, tuple[int, int, str]] = {}
+        for module, root in self.addons.items():
+            for path in python_files(root) + _xml_files(root, self.manifests[module]):
+                stat = path.stat()
+                current[str(path)] = (stat.st_mtime_ns, stat.st_size, module)
+
+        stale = [
+            path for path, (mtime, size, module) in current.items()
+            if self.files.get(path, (None, None, None))[:3] != (mtime, size, module)
+        ]
+        results = self._parse(stale)
+        files = {path: entry for path, entry in self.files.items() if path in current}
+        for path, models in zip(stale, results):
+            files[path] = (*current[path], models)
+
+        changed = manifests_changed or bool(stale) or len(files) != len(self.files)
+        self.files = files
+        self.parsed_files = len(stale)
+        self._build_models()
+        self._build_xml_ids()
+        if changed:
+            self._save_cache()
+        return len(stale)
+
+    def _refresh_manifests(self) -> bool:
+        manifest_files = {}
+        changed = len(self.manifest_files) != len(self.addons)
+        for module, root in self.addons.items():
+            path = str(root / "__manifest__.py")
+            stat = os.stat(path)
+            cached = self.manifest_files.get(path)
+            if cached is not None and cached[:3] == (stat.st_mtime_ns, stat.st_size, module):
+                manifest_files[path] = cached
+            else:
+                manifest_files[path] = (stat.st_mtime_ns, stat.st_size, module, parse_manifest(path))
+                changed = True
+
+        self.manifest_files = manifest_files
+        manifests = {}
+        for _, _, module, manifest in manifest_files.values():
+            depends = manifest["depends"] or ([] if module == "base" else ["base"])
+            manifests[module] = {**manifest, "depends": depends}
+        self.manifests = manifests
+        self._graph = None
+        return changed
+
+    @property
+    def graph(self) -> DependencyGraph:
+        if self._graph is None:
+            self._graph = DependencyGraph({module: manifest["depends"] for module, manifest in self.manifests.items()})
+        return self._graph
+
+    def _parse(self, paths: list[str]) -> list[list[dict[str, Any]]]:
+        workers = os.cpu_count() or 1
+        if len(paths) < PARALLEL_MIN_FILES or workers < 2:
+            return [parse_addon_file(path) for path in paths]
+
+        with process_pool(workers) as pool:
+            return list(pool.map(parse_addon_file, paths, chunksize=PARSE_CHUNK_SIZE))
+
+    def _build_models(self) -> None:
+        models: dict[str, dict[str, Any]] = {}
+        order, _ = self.graph.install_order(list(self.addons))
+        rank = {module: position for position, module in enumerate(order)}
+        for path, (_, _, module, declarations) in sorted(
+            self.files.items(), key=lambda item: (rank.get(item[1][2], len(rank)), item[0])
+        ):
+            if path.endswith(".xml"):
+                continue
+            for declaration in declarations:
+                name = declaration["name"]
+                model = models.setdefault(name, {
+                    "name": name,
+                    "description": "",
+                    "parents": [],
+                    "delegates": [],
+                    "declarations": [],
+                    "fields": {},
+                })
+                model["declarations"].append({
+                    "module": module,
+                    "file": path,
+                    "line": declaration["line"],
+                    "class": declaration["class"],
+                    "defines": name not in declaration["inherit"],
+                })
+                model["description"] = model["description"] or declaration["description"]
+                for parent in declaration["inherit"]:
+                    if parent != name and parent not in model["parents"]:
+                        model["parents"].append(parent)
+                for parent in declaration["inherits"]:
+                    if parent not in model["delegates"]:
+                        model["delegates"].append(parent)
+                for field_name, field in declaration["fields"].items():
+                    model["fields"][field_name] = {**field, "module": module}
+        self.models = models
+
+    def _build_xml_ids(self) -> None:
+        xml_ids: dict[str, list[dict[str, Any]]] = {}
+        inheriting: dict[str, list[str]] = {}
+        model_views: dict[str, list[str]] = {}
+        for path, (_, _, module, records) in sorted(self.files.items()):
+            if not path.endswith(".xml"):
+                continue
+            for record in records:
+                definition = {**record, "module": module, "file": path}
+                for key in ("id", "inherit_id", "parent", "action"):
+                    if key in definition:
+                        definition[key] = qualify_xml_id(definition[key], module)
+                xml_ids.setdefault(definition["id"], []).append(definition)
+        self.xml_ids = xml_ids
+        for xml_id in sorted(xml_ids):
+            record = self.xml_id(xml_id)
+            if record.get("inherit_id"):
+                inheriting.setdefault(record["inherit_id"], []).append(xml_id)
+            if record.get("res_model"):
+                model_views.setdefault(record["res_model"], []).append(xml_id)
+        self.inheriting_views = inheriting
+        self.model_views = model_views
+
+    def xml_id(self, xml_id: str) -> dict[str, Any] | None:
+        definitions = self.xml_ids.get(xml_id)
+        if not definitions:
+            return None
+        merged = dict(definitions[0])
+        for definition in definitions[1:]:
+            merged.update({key: value for key, value in definition.items() if key not in ("module", "file")})
+        return merged
+
+    def view_chain(self, xml_id: str) -> list[str]:
+        chain = []
+        current = self.xml_id(xml_id)
+        while current is not None and current["id"] not in chain:
+            chain.append(current["id"])
+            parent = current.get("inherit_id")
+            current = self.xml_id(parent) if parent else None
+            if current is None and parent and parent not in chain:
+                chain.append(parent)
+        return chain
+
+    def search_xml_ids(self, query: str, limit: int = 20) -> list[str]:
+        query = query.lower()
+        return [xml_id for xml_id in sorted(self.xml_ids) if query in xml_id.lower()][:limit]
+
+    def model(self, name: str) -> dict[str, Any] | None:
+        return self.models.get(name)
+
+    def inheritance_chain(self, name: str) -> list[str]:
+        chain: list[str] = []
+        pending = [name]
+        while pending:
+            current = pending.pop(0)
+            if current in chain:
+                continue
+            chain.append(current)
+            model = self.models.get(current)
+            if model is not None:
+                pending += model["parents"] + model["delegates"]
+        return chain
+
+    def fields(self, name: str) -> dict[str, dict[str, Any]]:
+        merged: dict[str, dict[str, Any]] = {}
+        for model_name in reversed(self.inheritance_chain(name)):
+            model = self.models.get(model_name)
+            if model is not None:
+                merged.update(model["fields"])
+        return merged
+
+    def search(self, query: str, limit: int = 20) -> list[str]:
+        query = query.lower()
+        return [name for name in sorted(self.models) if query in name.lower()][:limit]
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the Odoo MCP Server
+
+Times the documentation and generator handlers over the bundled docs and
+over synthetic corpora scaled up by mirroring the version tree.
+
+    python bench_server.py --scales 1,10,100 --output bench.json
+    python bench_server.py --compare bench.json
+    python bench_server.py --scales "" --startup-runs 10 --startup-budget-ms 1500
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+import odoo_mcp_server as server
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+SERVER_PATH = Path(server.__file__)
+SEARCH_QUERIES = ["fields.Command", "ir.model.access", "@api.depends", "t-foreach", "xyzzy-no-match"]
+CONTENT_PATHS = ["reference/backend/orm", "reference/cli", "howtos/website_themes/theming"]
+MODEL_FIELDS = [
+    {"name": "partner_id", "type": "Many2one", "comodel_name": "res.partner"},
+    {"name": "line_ids", "type": "One2many", "comodel_name": "bench.line", "inverse_name": "order_id"},
+    {"name": "tag_ids", "type": "Many2many", "comodel_name": "bench.tag"},
+    {"name": "state", "type": "Selection"},
+    {"name": "amount", "type": "Float"},
+    {"name": "is_done", "type": "Boolean"},
+]
+
+
+def build_cases(version: str) -> list[tuple[str, str, str, dict]]:
+    cases = [("resource", "get_documentation_index", f"odoo://docs/{version}/index", {"version": version})]
+    for path in CONTENT_PATHS:
+        uri = f"odoo://docs/{version}/{path.replace('/', '%2F')}"
+        cases.append(("resource", "get_documentation_content", uri, {"version": version, "path": path}))
+    for query in SEARCH_QUERIES:
+        cases.append(("tool", "search_documentation", query, {"query": query, "version": version}))
+    cases += [
+        ("tool", "create_odoo_module", "bench_module", {
+            "module_name": "bench_module",
+            "display_name": "Bench Module",
+            "description": "Benchmark module",
+        }),
+        ("tool", "create_odoo_model", "bench.order", {
+            "model_name": "bench.order",
+            "model_description": "Bench Order",
+            "fields": MODEL_FIELDS,
+        }),
+        ("tool", "create_odoo_view", "form", {
+            "model_name": "bench.order",
+            "view_type": "form",
+            "fields_to_display": [field["name"] for field in MODEL_FIELDS],
+        }),
+        ("tool", "create_odoo_view", "kanban", {
+            "model_name": "bench.order",
+            "view_type": "kanban",
+            "fields_to_display": ["name"],
+        }),
+        ("tool", "create_security_rules", "bench.order", {
+            "model_name": "bench.order",
+            "module_name": "bench_module",
+        }),
+    ]
+    return cases
+
+
+def build_scaled_corpus(source: Path, target: Path, version: str, scale: int) -> None:
+    version_source = source / version
+    version_target = target / version
+    rst_files = sorted(version_source.rglob("*.rst"))
+    copies = [version_target] + [version_target / f"mirror_{i:03d}" for i in range(1, scale)]
+    for copy_root in copies:
+        for rst_file in rst_files:
+            destination = copy_root / rst_file.relative_to(version_source)
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.link(rst_file, destination)
+            except OSError:
+                shutil.copyfile(rst_file, destination)
+
+
+_loop = asyncio.new_event_loop()
+
+
+def invoke(kind: str, handler: str, target: str, arguments: dict, via_mcp: bool) -> int:
+    if not via_mcp:
+        result = getattr(server, handler)(**arguments)
+        return len(result)
+    if kind == "tool":
+        content = _loop.run_until_complete(server.mcp.call_tool(handler, arguments))
+    else:
+        content = _loop.run_until_complete(server.mcp.read_resource(target))
+    return len(str(content))
+
+
+def measure_case(case: tuple, iterations: int, warmup: int, budget: float, via_mcp: bool) -> dict:
+    kind, handler, target, arguments = case
+    for _ in range(warmup):
+        invoke(kind, handler, target, arguments, via_mcp)
+
+    samples = []
+    size = 0
+    started = time.perf_counter()
+    for i in range(iterations):
+        start = time.perf_counter_ns()
+        size = invoke(kind, handler, target, arguments, via_mcp)
+        samples.append((time.perf_counter_ns() - start) / 1_000_000)
+        if i >= 2 and time.perf_counter() - started > budget:
+            break
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    invoke(kind, handler, target, arguments, via_mcp)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "handler": handler,
+        "target": target,
+        **summarize(samples, elapsed),
+        "peak_kib": peak / 1024,
+        "response_chars": size,
+    }
+
+
+def summarize(samples: list[float], elapsed: float) -> dict:
+    ordered = sorted(samples)
+
+    def pick(q: float) -> float:
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    return {
+        "iterations": len(samples),
+        "min_ms": ordered[0],
+        "p50_ms": pick(0.5),
+        "p95_ms": pick(0.95),
+        "p99_ms": pick(0.99),
+        "max_ms": ordered[-1],
+        "mean_ms": statistics.fmean(samples),
+        "stdev_ms": statistics.pstdev(samples),
+        "ops_per_sec": len(samples) / elapsed if elapsed else 0.0,
+    }
+
+
+async def time_to_initialize() -> float:
+    params = StdioServerParameters(command=sys.executable, args=[str(SERVER_PATH)])
+    with open(os.devnull, "w") as errlog:
+        start = time.perf_counter_ns()
+        async with stdio_client(params, errlog=errlog) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                return (time.perf_counter_ns() - start) / 1_000_000
+
+
+def measure_startup(runs: int) -> dict:
+    started = time.perf_counter()
+    samples = [_loop.run_until_complete(time_to_initialize()) for _ in range(runs)]
+    result = {
+        "scale": 0,
+        "handler": "startup",
+        "target": "stdio initialize",
+        **summarize(samples, time.perf_counter() - started),
+        "peak_kib": 0.0,
+        "response_chars": 0,
+    }
+    print(f"  spawn -> initialize response    p50 {result['p50_ms']:>9.2f} ms  p95 {result['p95_ms']:>9.2f} ms  max {result['max_ms']:>9.2f} ms")
+    return result
+
+
+def run_scale(scale: int, args: argparse.Namespace, workdir: Path) -> list[dict]:
+    original_docs = server.DOCS_BASE_PATH
+    if scale > 1:
+        corpus = workdir / f"scale_{scale}"
+        build_scaled_corpus(original_docs, corpus, args.version, scale)
+        server.DOCS_BASE_PATH = corpus
+    server.clear_caches()
+
+    results = []
+    try:
+        for case in build_cases(args.version):
+            result = measure_case(case, args.iterations, args.warmup, args.budget, args.via_mcp)
+            result["scale"] = scale
+            results.append(result)
+            print(
+                f"  {result['handler']:<28} {result['target'][:34]:<34} "
+                f"p50 {result['p50_ms']:>9.2f} ms  p95 {result['p95_ms']:>9.2f} ms  "
+                f"{result['ops_per_sec']:>8.1f} op/s  peak {result['peak_kib']:>9.1f} KiB"
+            )
+    finally:
+        server.DOCS_BASE_PATH = original_docs
+        server.clear_caches()
+
+    return results
+
+
+def case_key(result: dict) -> str:
+    return f"{result['scale']}x {result['handler']} {result['target']}"
+
+
+def compare_runs(baseline: dict, current: dict, threshold: float, noise_ms: float) -> int:
+    print("\n=== Comparison against baseline ===")
+
+    if baseline.get("via_mcp") != current["via_mcp"]:
+        print("⚠ Baseline and current run used different call paths (--via-mcp); deltas include FastMCP overhead")
+
+    old_results = {case_key(result): result for result in baseline["results"]}
+    regressions = 0
+    for result in current["results"]:
+        key = case_key(result)
+        old = old_results.get(key)
+        if old is None:
+            print(f"  (new) {key}")
+            continue
+        for metric in ("p50_ms", "p95_ms", "peak_kib"):
+            before, after = old[metric], result[metric]
+            if before <= 0 or (metric.endswith("_ms") and abs(after - before) < noise_ms):
+                continue
+            change = (after - before) / before
+            if change > threshold:
+                regressions += 1
+                print(f"✗ {key}: {metric} {before:.2f} -> {after:.2f} (+{change:.0%})")
+            elif change < -threshold:
+                print(f"✓ {key}: {metric} {before:.2f} -> {after:.2f} ({change:.0%})")
+
+    if regressions:
+        print(f"\n✗ {regressions} regression(s) above {threshold:.0%}")
+    else:
+        print(f"\n✓ No regressions above {threshold:.0%}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the Odoo MCP Server handlers")
+    parser.add_argument("--version", default="19.0", choices=server.ODOO_VERSIONS)
+    parser.add_argument("--scales", default="1,10,100", help="Comma-separated corpus multipliers")
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--budget", type=float, default=10.0, help="Max seconds of timed iterations per case")
+    parser.add_argument("--startup-runs", type=int, default=5, help="Server launches timed to the initialize response")
+    parser.add_argument("--startup-budget-ms", type=float, help="Fail when median startup exceeds this")
+    parser.add_argument("--via-mcp", action="store_true", help="Go through FastMCP call_tool/read_resource")
+    parser.add_argument("--output", help="Write results as JSON")
+    parser.add_argument("--compare", help="Baseline JSON from a previous run")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Allowed relative slowdown")
+    parser.add_argument("--noise-ms", type=float, default=0.05, help="Ignore latency deltas smaller than this")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Odoo Development MCP Server - Benchmarks")
+    print("=" * 60)
+
+    scales = [int(scale) for scale in args.scales.split(",") if scale.strip()]
+    results = []
+    if args.startup_runs:
+        print(f"\n=== Startup ({args.startup_runs} stdio launches) ===")
+        results.append(measure_startup(args.startup_runs))
+    with tempfile.TemporaryDirectory(prefix="odoo_mcp_bench_") as workdir:
+        for scale in scales:
+            print(f"\n=== Corpus scale {scale}x (Odoo {args.version}) ===")
+            results += run_scale(scale, args, Path(workdir))
+
+    run = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "via_mcp": args.via_mcp,
+        "max_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else 0,
+        "results": results,
+    }
+    print(f"\n✓ Max RSS: {run['max_rss_kib'] / 1024:.1f} MiB")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(run, indent=2), encoding="utf-8")
+        print(f"✓ Results written to {args.output}")
+
+    failed = False
+    if args.startup_budget_ms is not None and args.startup_runs:
+        startup = results[0]["p50_ms"]
+        if startup > args.startup_budget_ms:
+            print(f"✗ Startup p50 {startup:.0f} ms exceeds budget of {args.startup_budget_ms:.0f} ms")
+            failed = True
+        else:
+            print(f"✓ Startup p50 {startup:.0f} ms within budget of {args.startup_budget_ms:.0f} ms")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        if compare_runs(baseline, run, args.threshold, args.noise_ms):
+            failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,464 @@
+"""
+Static checks for Odoo module code
+
+Walks Python files with `ast` (never importing them) and reports ORM usage
+that costs queries per record: searches, browses, writes, creates and sudo()
+calls inside loops over recordsets, computed fields without @api.depends and len() over a
+search. The lint checker enforces the naming rules of
+rules/odoo-development.mdc over Python, XML and access CSV files. Results are
+cached per file content hash and `CHECKS_VERSION`, which is bumped whenever a
+check changes, and large trees are checked in a process pool.
+Generated files are validated the same way before they are returned.
+
+Kept free of the `mcp` import so process-pool workers start quickly.
+"""
+
+import ast
+import csv
+import hashlib
+import io
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Any
+from xml.parsers import expat
+
+from addons_index import MODEL_BASES, PARALLEL_MIN_FILES, PARSE_CHUNK_SIZE, process_pool, python_files
+
+CHECKS_FORMAT = 1
+CHECKS_VERSION = 2
+CHECK_CACHE_MAX_ENTRIES = 50_000
+QUERY_METHODS = {"search", "search_count", "search_read", "read_group", "_read_group", "read"}
+RECORDSET_METHODS = {
+    "browse", "search", "sudo", "with_context", "with_user", "with_company", "with_env",
+    "filtered", "filtered_domain", "mapped", "sorted", "exists", "create", "new",
+}
+LOOP_MESSAGES = {
+    "browse": (
+        "query-in-loop",
+        "browse() inside a loop builds one-record recordsets that are fetched separately; browse all ids before the loop",
+    ),
+    "write": (
+        "write-in-loop",
+        "write() inside a loop issues one UPDATE per record; write once on the recordset, grouped by values",
+    ),
+    "create": (
+        "create-in-loop",
+        "create() inside a loop inserts one row per call; collect the values and call create(vals_list) once",
+    ),
+    "sudo": (
+        "sudo-in-loop",
+        "sudo() inside a loop builds a new environment per record and defeats prefetching; call it once before the loop",
+    ),
+}
+LINT_SUFFIXES = (".py", ".xml", ".csv")
+MODEL_NAME = re.compile(r"[a-z0-9_]+(\.[a-z0-9_]+)+")
+SNAKE_CASE = re.compile(r"^_?[a-z][a-z0-9_]*$")
+CAMEL_CASE = re.compile(r"^[A-Z][A-Za-z0-9]*$")
+BOOLEAN_PREFIXES = ("is_", "has_", "can_")
+BOOLEAN_EXEMPT = {"active"}
+DECORATOR_ORDER = {"model": 0, "depends": 1, "constrains": 2, "onchange": 3}
+METHOD_PREFIXES = {"onchange": "_onchange_", "constrains": "_check_"}
+XML_ID_PREFIXES = {"ir.ui.view": "view_", "ir.actions.act_window": "action_", "menuitem": "menu_"}
+
+
+def _target_names(target: ast.AST) -> set[str]:
+    return {node.id for node in ast.walk(target) if isinstance(node, ast.Name)}
+
+
+def _is_depends_decorator(decorator: ast.AST) -> bool:
+    function = decorator.func if isinstance(decorator, ast.Call) else decorator
+    return isinstance(function, ast.Attribute) and function.attr in ("depends", "depends_context")
+
+
+class _PerformanceVisitor(ast.NodeVisitor):
+    def __init__(self) -> None:
+        self.findings: list[dict[str, Any]] = []
+        self.loop_depth = 0
+        self.recordsets = {"self"}
+        self._seen: set[tuple[str, int]] = set()
+
+    def report(self, check: str, node: ast.AST, message: str) -> None:
+        if (check, node.lineno) not in self._seen:
+            self._seen.add((check, node.lineno))
+            self.findings.append({"line": node.lineno, "check": check, "message": message})
+
+    def is_recordset(self, node: ast.AST) -> bool:
+        while True:
+            if isinstance(node, ast.Name):
+                return node.id in self.recordsets
+            if isinstance(node, ast.Subscript):
+                value = node.value
+                if (isinstance(value, ast.Attribute) and value.attr == "env") or (isinstance(value, ast.Name) and value.id == "env"):
+                    return True
+                node = value
+            elif isinstance(node, ast.Attribute):
+                node = node.value
+            elif isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr in RECORDSET_METHODS:
+                node = node.func.value
+            else:
+                return False
+
+    def add_loop_targets(self, target: ast.AST, iterable: ast.AST) -> None:
+        if self.is_recordset(iterable):
+            self.recordsets = self.recordsets | _target_names(target)
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        methods = {item.name: item for item in node.body if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef))}
+        computed: dict[str, list[str]] = {}
+        for item in node.body:
+            if not (isinstance(item, ast.Assign) and isinstance(item.value, ast.Call)):
+                continue
+            for keyword in item.value.keywords:
+                if keyword.arg == "compute" and isinstance(keyword.value, ast.Constant) and isinstance(keyword.value.value, str):
+                    computed.setdefault(keyword.value.value, []).extend(sorted(_target_names(item.targets[0])))
+        for method_name, field_names in computed.items():
+            method = methods.get(method_name)
+            if method is not None and not any(_is_depends_decorator(decorator) for decorator in method.decorator_list):
+                self.report(
+                    "compute-without-depends",
+                    method,
+                    f"{method_name} computes {', '.join(field_names)} without @api.depends; "
+                    f"stored fields are never recomputed and non-stored ones are recomputed on every read",
+                )
+        self.generic_visit(node)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+        saved = self.loop_depth, self.recordsets
+        self.loop_depth, self.recordsets = 0, {"self"}
+        self.generic_visit(node)
+        self.loop_depth, self.recordsets = saved
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_For(self, node: ast.For | ast.AsyncFor) -> None:
+        self.visit(node.iter)
+        self.add_loop_targets(node.target, node.iter)
+        over_records = self.is_recordset(node.iter)
+        self.loop_depth += over_records
+        for statement in node.body:
+            self.visit(statement)
+        self.loop_depth -= over_records
+        for statement in node.orelse:
+            self.visit(statement)
+
+    visit_AsyncFor = visit_For
+
+    def visit_comprehension_node(self, node: ast.AST, parts: list[ast.AST]) -> None:
+        first, *rest = node.generators
+        self.visit(first.iter)
+        self.add_loop_targets(first.target, first.iter)
+        over_records = self.is_recordset(first.iter)
+        self.loop_depth += over_records
+        for condition in first.ifs:
+            self.visit(condition)
+        for generator in rest:
+            self.visit(generator.iter)
+            self.add_loop_targets(generator.target, generator.iter)
+            if not over_records and self.is_recordset(generator.iter):
+                over_records = True
+                self.loop_depth += 1
+            for condition in generator.ifs:
+                self.visit(condition)
+        for part in parts:
+            self.visit(part)
+        self.loop_depth -= over_records
+
+    def visit_ListComp(self, node: ast.ListComp | ast.SetComp | ast.GeneratorExp) -> None:
+        self.visit_comprehension_node(node, [node.elt])
+
+    visit_SetComp = visit_GeneratorExp = visit_ListComp
+
+    def visit_DictComp(self, node: ast.DictComp) -> None:
+        self.visit_comprehension_node(node, [node.key, node.value])
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        self.generic_visit(node)
+        if self.is_recordset(node.value):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    self.recordsets = self.recordsets | {target.id}
+
+    def visit_Call(self, node: ast.Call) -> None:
+        function = node.func
+        if isinstance(function, ast.Name) and function.id == "len" and len(node.args) == 1:
+            argument = node.args[0]
+            if (
+                isinstance(argument, ast.Call)
+                and isinstance(argument.func, ast.Attribute)
+                and argument.func.attr == "search"
+                and self.is_recordset(argument.func.value)
+            ):
+                self.report("len-search", node, "len(search(...)) fetches every matching record; use search_count()")
+
+        if self.loop_depth and isinstance(function, ast.Attribute) and self.is_recordset(function.value):
+            method = function.attr
+            if method in QUERY_METHODS:
+                self.report(
+                    "query-in-loop",
+                    node,
+                    f"{method}() inside a loop runs one query per iteration; "
+                    f"query once before the loop and use mapped()/filtered() on the result",
+                )
+            elif method in LOOP_MESSAGES:
+                check, message = LOOP_MESSAGES[method]
+                self.report(check, node, message)
+        self.generic_visit(node)
+
+
+def analyze_performance(source: str, filename: str = "<code>") -> list[dict[str, Any]]:
+    try:
+        tree = ast.parse(source, filename=filename)
+    except (SyntaxError, ValueError) as e:
+        return [{"line": getattr(e, "lineno", None) or 0, "check": "syntax-error", "message": str(e)}]
+    visitor = _PerformanceVisitor()
+    visitor.visit(tree)
+    return sorted(visitor.findings, key=lambda finding: (finding["line"], finding["check"]))
+
+
+def _api_decorator(decorator: ast.AST) -> str:
+    function = decorator.func if isinstance(decorator, ast.Call) else decorator
+    if isinstance(function, ast.Attribute) and isinstance(function.value, ast.Name) and function.value.id == "api":
+        return function.attr
+    return ""
+
+
+def _lint_model_class(node: ast.ClassDef) -> list[dict[str, Any]]:
+    findings = []
+
+    def report(check: str, line: int, message: str) -> None:
+        findings.append({"line": line, "check": check, "message": message})
+
+    if not CAMEL_CASE.match(node.name):
+        report("class-name", node.lineno, f"Model class {node.name} is not CamelCase")
+    for item in node.body:
+        if isinstance(item, ast.Assign) and len(item.targets) == 1 and isinstance(item.targets[0], ast.Name):
+            name = item.targets[0].id
+            value = item.value
+            if name == "_name" and isinstance(value, ast.Constant) and isinstance(value.value, str):
+                if not MODEL_NAME.fullmatch(value.value):
+                    report("model-name", item.lineno, f"Model name {value.value} should be lowercase dot notation")
+                continue
+            if not (isinstance(value, ast.Call) and isinstance(value.func, ast.Attribute)):
+                continue
+            if not (isinstance(value.func.value, ast.Name) and value.func.value.id == "fields"):
+                continue
+            field_type = value.func.attr
+            if not SNAKE_CASE.match(name):
+                report("field-name", item.lineno, f"Field {name} is not lowercase_with_underscores")
+            if field_type == "Boolean" and name not in BOOLEAN_EXEMPT and not name.startswith(BOOLEAN_PREFIXES):
+                report("boolean-prefix", item.lineno, f"Boolean field {name} should start with is_, has_ or can_")
+            elif field_type == "Many2one" and not name.endswith("_id"):
+                report("many2one-suffix", item.lineno, f"Many2one field {name} should end with _id")
+            elif field_type in ("One2many", "Many2many") and not name.endswith("_ids"):
+                report("x2many-suffix", item.lineno, f"{field_type} field {name} should end with _ids")
+            for keyword in value.keywords:
+                compute = keyword.value
+                if keyword.arg == "compute" and isinstance(compute, ast.Constant) and isinstance(compute.value, str):
+                    if not compute.value.startswith("_compute_"):
+                        report("compute-prefix", item.lineno, f"Compute method {compute.value} should start with _compute_")
+        elif isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            decorators = [_api_decorator(decorator) for decorator in item.decorator_list]
+            for decorator, prefix in METHOD_PREFIXES.items():
+                if decorator in decorators and not item.name.startswith(prefix):
+                    report(f"{decorator}-prefix", item.lineno, f"@api.{decorator} method {item.name} should start with {prefix}")
+            ranks = [DECORATOR_ORDER[decorator] for decorator in decorators if decorator in DECORATOR_ORDER]
+            if ranks != sorted(ranks):
+                report("decorator-order", item.lineno, f"Decorators of {item.name} should be ordered model, depends, constrains, onchange")
+            if item.name == "delete":
+                report("crud-name", item.lineno, "Override unlink() instead of defining delete()")
+    return findings
+
+
+def lint_python(source: str, filename: str = "<code>") -> list[dict[str, Any]]:
+    try:
+        tree = ast.parse(source, filename=filename)
+    except (SyntaxError, ValueError) as e:
+        return [{"line": getattr(e, "lineno", None) or 0, "check": "syntax-error", "message": str(e)}]
+    findings = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef) and any(
+            isinstance(base, ast.Attribute) and base.attr in MODEL_BASES for base in node.bases
+        ):
+            findings += _lint_model_class(node)
+    return sorted(findings, key=lambda finding: (finding["line"], finding["check"]))
+
+
+def lint_xml(source: str, filename: str = "<xml>") -> list[dict[str, Any]]:
+    findings: list[dict[str, Any]] = []
+    parser = expat.ParserCreate()
+
+    def start(tag: str, attributes: dict[str, str]) -> None:
+        xml_id = attributes.get("id", "")
+        kind = "menuitem" if tag == "menuitem" else attributes.get("model", "") if tag == "record" else ""
+        prefix = XML_ID_PREFIXES.get(kind)
+        if prefix and xml_id and "." not in xml_id and not xml_id.startswith(prefix):
+            check = f"{prefix.rstrip('_')}-id"
+            findings.append({
+                "line": parser.CurrentLineNumber,
+                "check": check,
+                "message": f"{kind} id {xml_id} should start with {prefix}",
+            })
+
+    parser.StartElementHandler = start
+    try:
+        parser.Parse(source, True)
+    except expat.ExpatError as e:
+        findings.append({"line": e.lineno, "check": "xml-syntax", "message": str(e)})
+    return findings
+
+
+def lint_csv(source: str, filename: str = "<csv>") -> list[dict[str, Any]]:
+    if Path(filename).name != "ir.model.access.csv":
+        return []
+    findings = []
+    for line, row in enumerate(csv.reader(io.StringIO(source)), 1):
+        if line == 1 or not row or not row[0]:
+            continue
+        if "." not in row[0] and not row[0].startswith("access_"):
+            findings.append({"line": line, "check": "access-id", "message": f"Access rule id {row[0]} should start with access_"})
+    return findings
+
+
+def lint_source(source: str, filename: str = "<code>") -> list[dict[str, Any]]:
+    if filename.endswith(".xml"):
+        return lint_xml(source, filename)
+    if filename.endswith(".csv"):
+        return lint_csv(source, filename)
+    return lint_python(source, filename)
+
+
+CHECKERS = {"performance": analyze_performance, "lint": lint_source}
+
+
+def validate_generated_file(path: str, content: str) -> list[str]:
+    if path.endswith(".py"):
+        try:
+            tree = ast.parse(content, filename=path)
+        except (SyntaxError, ValueError) as e:
+            return [f"{path}:{getattr(e, 'lineno', None) or 0}: {type(e).__name__}: {getattr(e, 'msg', e)}"]
+        if Path(path).name == "__manifest__.py":
+            manifest = tree.body[0].value if len(tree.body) == 1 and isinstance(tree.body[0], ast.Expr) else None
+            try:
+                manifest = ast.literal_eval(manifest) if manifest is not None else None
+            except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+                manifest = None
+            if not isinstance(manifest, dict):
+                return [f"{path}:1: manifest is not a literal dict"]
+        return []
+
+    if path.endswith(".xml"):
+        parser = expat.ParserCreate()
+        try:
+            parser.Parse(content, True)
+        except expat.ExpatError as e:
+            return [f"{path}:{e.lineno}: {e}"]
+        return []
+
+    if path.endswith(".csv"):
+        rows = list(csv.reader(io.StringIO(content)))
+        if not rows:
+            return [f"{path}:1: empty CSV"]
+        errors = []
+        header = rows[0]
+        permissions = [position for position, column in enumerate(header) if column.startswith("perm_")]
+        for line, row in enumerate(rows[1:], 2):
+            if len(row) != len(header):
+                errors.append(f"{path}:{line}: {len(row)} columns, header has {len(header)}")
+            elif any(row[position] not in ("0", "1") for position in permissions):
+                errors.append(f"{path}:{line}: permissions must be 0 or 1")
+        return errors
+    return []
+
+
+def validate_generated_files(files: dict[str, str]) -> list[str]:
+    return [error for path, content in files.items() for error in validate_generated_file(path, content)]
+
+
+def check_file(task: tuple[str, str]) -> list[dict[str, Any]]:
+    checker, path = task
+    try:
+        source = Path(path).read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError) as e:
+        return [{"line": 0, "check": "unreadable", "message": f"{type(e).__name__}: {e}"}]
+    return CHECKERS[checker](source, path)
+
+
+class CheckCache:
+    def __init__(self, cache_file: Path | None = None) -> None:
+        self.cache_file = cache_file
+        self.results: dict[str, list[dict[str, Any]]] = {}
+        self.changed = False
+        self._lock = threading.Lock()
+        if cache_file is None or not cache_file.is_file():
+            return
+        try:
+            cached = json.loads(cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if cached.get("format") == CHECKS_FORMAT:
+            self.results = cached["results"]
+
+    def get(self, key: str) -> list[dict[str, Any]] | None:
+        return self.results.get(key)
+
+    def put(self, key: str, findings: list[dict[str, Any]]) -> None:
+        with self._lock:
+            self.results[key] = findings
+            while len(self.results) > CHECK_CACHE_MAX_ENTRIES:
+                del self.results[next(iter(self.results))]
+            self.changed = True
+
+    def save(self) -> None:
+        if self.cache_file is None or not self.changed:
+            return
+        partial = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+        with self._lock:
+            try:
+                self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+                partial.write_text(json.dumps({"format": CHECKS_FORMAT, "results": self.results}), encoding="utf-8")
+                os.replace(partial, self.cache_file)
+                self.changed = False
+            except OSError:
+                partial.unlink(missing_ok=True)
+
+
+def check_targets(target: Path, suffixes: tuple[str, ...] = (".py",)) -> list[Path]:
+    return [target] if target.is_file() else python_files(target, suffixes)
+
+
+def run_checks(
+    paths: list[Path], checker: str, cache: CheckCache | None = None
+) -> tuple[dict[str, list[dict[str, Any]]], int]:
+    results: dict[str, list[dict[str, Any]]] = {}
+    pending: list[tuple[str, str]] = []
+    for path in paths:
+        try:
+            scope = f"{path.suffix}:{path.name}" if path.suffix == ".csv" else path.suffix
+            key = f"{checker}{scope}:{CHECKS_VERSION}:{hashlib.sha256(path.read_bytes()).hexdigest()}"
+        except OSError:
+            continue
+        cached = cache.get(key) if cache is not None else None
+        if cached is None:
+            pending.append((str(path), key))
+        else:
+            results[str(path)] = cached
+
+    tasks = [(checker, path) for path, _ in pending]
+    workers = os.cpu_count() or 1
+    if len(tasks) < PARALLEL_MIN_FILES or workers < 2:
+        found = [check_file(task) for task in tasks]
+    else:
+        with process_pool(workers) as pool:
+            found = list(pool.map(check_file, tasks, chunksize=PARSE_CHUNK_SIZE))
+
+    for (path, key), findings in zip(pending, found):
+        results[path] = findings
+        if cache is not None:
+            cache.put(key, findings)
+    if cache is not None:
+        cache.save()
+    ordered = {str(path): results[str(path)] for path in paths if str(path) in results}
+    return ordered, len(ordered) - len(pending)
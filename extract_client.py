@@ -0,0 +1,166 @@
+"""
+Async batch client for the Odoo Extract API
+
+Built from the flow in `docs/*/reference/extract_api/implementation.py`: each
+document is sent to `/parse` and `/get_result` is polled until it leaves the
+`processing` state. Uploads run concurrently behind a semaphore, the base64
+payload is streamed from disk in chunks instead of reading whole files into
+memory, and polling backs off from `poll_interval` to `max_poll_interval`.
+"""
+
+import asyncio
+import base64
+import json
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import Any, AsyncIterator
+
+import httpx
+
+EXTRACT_URL_ENV = "ODOO_MCP_EXTRACT_URL"
+EXTRACT_TOKEN_ENV = "ODOO_MCP_EXTRACT_TOKEN"
+EXTRACT_INBOX_ENV = "ODOO_MCP_EXTRACT_INBOX"
+EXTRACT_URL = "https://extract.api.odoo.com"
+EXTRACT_DOCUMENT_TYPES = {
+    "invoice": (2, 123),
+    "bank_statement": (1, 100),
+    "expense": (2, 132),
+    "applicant": (2, 102),
+}
+EXTRACT_SUFFIXES = (".pdf", ".png", ".jpg", ".jpeg")
+EXTRACT_FIELDS = ["total", "subtotal", "invoice_id", "date", "due_date", "currency"]
+ENCODE_CHUNK_SIZE = 3 * 64 * 1024
+
+
+class ExtractError(Exception):
+    pass
+
+
+def encoded_size(size: int) -> int:
+    return 4 * ((size + 2) // 3)
+
+
+async def iter_base64(path: Path, chunk_size: int = ENCODE_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    with path.open("rb") as f:
+        while chunk := await asyncio.to_thread(f.read, chunk_size):
+            yield base64.b64encode(chunk)
+
+
+def extract_targets(target: str) -> list[Path]:
+    path = Path(target).expanduser()
+    if path.is_dir():
+        return sorted(child for child in path.iterdir() if child.suffix.lower() in EXTRACT_SUFFIXES and child.is_file())
+    return [path]
+
+
+def selected_value(result: dict[str, Any], field: str) -> Any:
+    documents = result.get("results") or [{}]
+    return ((documents[0].get(field) or {}).get("selected_value") or {}).get("content", "")
+
+
+class ExtractClient:
+    def __init__(
+        self,
+        account_token: str,
+        url: str = EXTRACT_URL,
+        document_type: str = "invoice",
+        concurrency: int = 4,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 30.0,
+        timeout: float = 600.0,
+    ) -> None:
+        if document_type not in EXTRACT_DOCUMENT_TYPES:
+            raise ExtractError(f"Unknown document type: {document_type}. Available: {', '.join(EXTRACT_DOCUMENT_TYPES)}")
+        route, self.version = EXTRACT_DOCUMENT_TYPES[document_type]
+        self.account_token = account_token
+        self.url = url.rstrip("/")
+        self.prefix = f"/api/extract/{document_type}/{route}"
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.timeout = timeout
+        self.requests = 0
+        self._slots = asyncio.Semaphore(concurrency)
+        self._http = httpx.AsyncClient(
+            base_url=self.url,
+            timeout=httpx.Timeout(60.0, connect=10.0),
+            limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
+        )
+
+    async def __aenter__(self) -> "ExtractClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        await self._http.aclose()
+
+    async def _post(self, endpoint: str, content: Any, length: int) -> dict[str, Any]:
+        self.requests += 1
+        headers = {"Content-Type": "application/json", "Content-Length": str(length)}
+        try:
+            response = await self._http.post(self.prefix + endpoint, content=content, headers=headers)
+            response.raise_for_status()
+            reply = response.json()
+        except (httpx.HTTPError, ValueError) as e:
+            raise ExtractError(f"{endpoint} failed: {e}") from e
+        if reply.get("error"):
+            raise ExtractError(f"{endpoint} failed: {reply['error'].get('message', 'RPC error')}")
+        return reply["result"]
+
+    async def call(self, endpoint: str, params: dict[str, Any]) -> dict[str, Any]:
+        payload = {"jsonrpc": "2.0", "method": "call", "params": params, "id": uuid.uuid4().hex}
+        body = json.dumps(payload).encode("utf-8")
+        return await self._post(endpoint, body, len(body))
+
+    async def parse(self, path: Path) -> dict[str, Any]:
+        placeholder = f"document-{uuid.uuid4().hex}"
+        params = {"account_token": self.account_token, "version": self.version, "documents": [placeholder]}
+        head, tail = json.dumps({
+            "jsonrpc": "2.0", "method": "call", "params": params, "id": uuid.uuid4().hex,
+        }).encode("utf-8").split(placeholder.encode("ascii"))
+        size = await asyncio.to_thread(os.path.getsize, path)
+
+        async def body() -> AsyncIterator[bytes]:
+            yield head
+            async for chunk in iter_base64(path):
+                yield chunk
+            yield tail
+
+        return await self._post("/parse", body(), len(head) + encoded_size(size) + len(tail))
+
+    async def get_result(self, document_token: str) -> dict[str, Any]:
+        params = {"version": self.version, "document_token": document_token, "account_token": self.account_token}
+        deadline = time.monotonic() + self.timeout
+        interval = self.poll_interval
+        while True:
+            result = await self.call("/get_result", params)
+            if result.get("status") != "processing":
+                return result
+            if time.monotonic() + interval > deadline:
+                raise ExtractError(f"Document {document_token} still processing after {self.timeout:.0f}s")
+            await asyncio.sleep(interval)
+            interval = min(interval * 2, self.max_poll_interval)
+
+    async def process(self, path: Path) -> dict[str, Any]:
+        try:
+            async with self._slots:
+                parsed = await self.parse(path)
+            if parsed.get("status") != "success":
+                return {"path": str(path), **parsed}
+            result = await self.get_result(parsed["document_token"])
+            return {"path": str(path), "document_token": parsed["document_token"], **result}
+        except (ExtractError, OSError) as e:
+            return {"path": str(path), "status": "error", "status_msg": str(e)}
+
+    async def process_batch(self, paths: list[Path]) -> list[dict[str, Any]]:
+        return await asyncio.gather(*(self.process(path) for path in paths))
+
+
+def client_from_env(**kwargs: Any) -> ExtractClient | None:
+    token = os.environ.get(EXTRACT_TOKEN_ENV)
+    if not token:
+        return None
+    return ExtractClient(token, os.environ.get(EXTRACT_URL_ENV, EXTRACT_URL), **kwargs)
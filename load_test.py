@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Load generator for the Odoo MCP Server
+
+Runs N simulated MCP clients with the `mcp` client SDK, each issuing a mix
+of searches, resource reads and generator calls, and reports throughput,
+tail latency and error rate for every concurrency step.
+
+    python load_test.py --transport stdio --concurrency 1,4,8
+    python load_test.py --transport http --spawn --concurrency 1,8,32
+    python load_test.py --transport http --spawn --workers 4 --concurrency 1,8,32
+    python load_test.py --transport http --url http://127.0.0.1:8000/mcp
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from pydantic import AnyUrl
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+from mcp.client.streamable_http import streamablehttp_client
+
+SERVER_PATH = Path(__file__).parent / "odoo_mcp_server.py"
+VERSIONS = ["17.0", "18.0", "19.0"]
+SEARCH_QUERIES = ["fields.Command", "ir.model.access", "@api.depends", "t-foreach", "qweb", "res.partner", "_inherit"]
+CONTENT_PATHS = ["reference%2Fbackend%2Form", "reference%2Fcli", "howtos%2Fwebsite_themes%2Ftheming"]
+WORKLOAD_MIX = {
+    "search": 50,
+    "read_index": 10,
+    "read_content": 20,
+    "create_model": 10,
+    "create_view": 10,
+}
+
+
+def build_operation(kind: str, rng: random.Random) -> tuple[str, str, dict]:
+    version = rng.choice(VERSIONS)
+    if kind == "search":
+        return "tool", "search_documentation", {"query": rng.choice(SEARCH_QUERIES), "version": version}
+    if kind == "read_index":
+        return "resource", f"odoo://docs/{version}/index", {}
+    if kind == "read_content":
+        return "resource", f"odoo://docs/{version}/{rng.choice(CONTENT_PATHS)}", {}
+    if kind == "create_model":
+        return "tool", "create_odoo_model", {
+            "model_name": "load.order",
+            "model_description": "Load Order",
+            "fields": [
+                {"name": "partner_id", "type": "Many2one", "comodel_name": "res.partner"},
+                {"name": "amount", "type": "Float"},
+            ],
+        }
+    return "tool", "create_odoo_view", {
+        "model_name": "load.order",
+        "view_type": rng.choice(["form", "tree", "search"]),
+        "fields_to_display": ["name", "partner_id", "amount"],
+    }
+
+
+class StepClock:
+    def __init__(self, clients: int, duration: float) -> None:
+        self.pending = clients
+        self.arrived: set[int] = set()
+        self.duration = duration
+        self.start = 0.0
+        self.deadline = 0.0
+        self.started = asyncio.Event()
+
+    def arrive(self, client_id: int) -> None:
+        if client_id in self.arrived:
+            return
+        self.arrived.add(client_id)
+        self.pending -= 1
+        if self.pending == 0:
+            self.start = time.perf_counter()
+            self.deadline = self.start + self.duration
+            self.started.set()
+
+
+async def run_session(session: ClientSession, client_id: int, clock: StepClock, seed: int, samples: list) -> None:
+    await session.initialize()
+    clock.arrive(client_id)
+    await clock.started.wait()
+
+    rng = random.Random(seed + client_id)
+    kinds = list(WORKLOAD_MIX)
+    weights = list(WORKLOAD_MIX.values())
+    while time.perf_counter() < clock.deadline:
+        kind = rng.choices(kinds, weights)[0]
+        call_type, target, arguments = build_operation(kind, rng)
+        start = time.perf_counter()
+        error = False
+        try:
+            if call_type == "tool":
+                result = await session.call_tool(target, arguments)
+                error = result.isError
+            else:
+                await session.read_resource(AnyUrl(target))
+        except Exception:
+            error = True
+        samples.append((kind, (time.perf_counter() - start) * 1000, error))
+
+
+async def run_client(args: argparse.Namespace, client_id: int, clock: StepClock, samples: list, failures: list) -> None:
+    try:
+        if args.transport == "stdio":
+            params = StdioServerParameters(command=sys.executable, args=[str(SERVER_PATH)])
+            with open(os.devnull, "w") as errlog:
+                async with stdio_client(params, errlog=errlog) as (read, write):
+                    async with ClientSession(read, write) as session:
+                        await run_session(session, client_id, clock, args.seed, samples)
+        else:
+            async with streamablehttp_client(args.url) as (read, write, _):
+                async with ClientSession(read, write) as session:
+                    await run_session(session, client_id, clock, args.seed, samples)
+    except Exception as e:
+        failures.append(f"client {client_id}: {e!r}")
+        clock.arrive(client_id)
+
+
+def percentile(ordered: list[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def run_step(args: argparse.Namespace, clients: int) -> dict:
+    samples: list[tuple[str, float, bool]] = []
+    failures: list[str] = []
+    clock = StepClock(clients, args.duration)
+    await asyncio.gather(*(run_client(args, i, clock, samples, failures) for i in range(clients)))
+    elapsed = time.perf_counter() - clock.start if clock.start else 0.0
+
+    latencies = sorted(latency for _, latency, _ in samples)
+    errors = sum(1 for _, _, error in samples if error)
+    per_kind = {}
+    for kind in WORKLOAD_MIX:
+        kind_latencies = sorted(latency for sample_kind, latency, _ in samples if sample_kind == kind)
+        if kind_latencies:
+            per_kind[kind] = {
+                "count": len(kind_latencies),
+                "p50_ms": percentile(kind_latencies, 0.5),
+                "p99_ms": percentile(kind_latencies, 0.99),
+            }
+
+    return {
+        "clients": clients,
+        "requests": len(samples),
+        "errors": errors,
+        "client_failures": failures,
+        "error_rate": (errors + len(failures)) / max(1, len(samples) + len(failures)),
+        "throughput": len(samples) / elapsed if elapsed else 0.0,
+        "mean_ms": statistics.fmean(latencies) if latencies else 0.0,
+        "p50_ms": percentile(latencies, 0.5),
+        "p95_ms": percentile(latencies, 0.95),
+        "p99_ms": percentile(latencies, 0.99),
+        "max_ms": latencies[-1] if latencies else 0.0,
+        "per_operation": per_kind,
+    }
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def spawn_http_server(port: int, workers: int) -> subprocess.Popen:
+    process = subprocess.Popen(
+        [sys.executable, str(SERVER_PATH), "--transport", "http", "--port", str(port), "--workers", str(workers)],
+        cwd=SERVER_PATH.parent,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"HTTP server exited with code {process.returncode}")
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.2):
+                return process
+        except OSError:
+            time.sleep(0.1)
+    process.terminate()
+    raise RuntimeError("HTTP server did not start within 30 seconds")
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description="Concurrent-session load test for the Odoo MCP Server")
+    parser.add_argument("--transport", choices=["stdio", "http"], default="stdio")
+    parser.add_argument("--url", default="http://127.0.0.1:8000/mcp", help="Streamable HTTP endpoint")
+    parser.add_argument("--spawn", action="store_true", help="Start a local HTTP server for the run")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes for the spawned HTTP server")
+    parser.add_argument("--concurrency", default="1,4,8", help="Comma-separated client counts")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per concurrency step")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="Write results as JSON")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"Odoo Development MCP Server - Load Test ({args.transport})")
+    print("=" * 60)
+
+    server_process = None
+    if args.transport == "http" and args.spawn:
+        port = free_port()
+        args.url = f"http://127.0.0.1:{port}/mcp"
+        server_process = spawn_http_server(port, args.workers)
+        print(f"✓ Spawned HTTP server at {args.url}")
+
+    steps = []
+    try:
+        for clients in [int(step) for step in args.concurrency.split(",") if step.strip()]:
+            step = await run_step(args, clients)
+            steps.append(step)
+            print(
+                f"  {clients:>4} clients  {step['requests']:>7} req  {step['throughput']:>8.1f} req/s  "
+                f"p50 {step['p50_ms']:>8.2f} ms  p95 {step['p95_ms']:>8.2f} ms  p99 {step['p99_ms']:>8.2f} ms  "
+                f"errors {step['error_rate']:.2%}"
+            )
+            for failure in step["client_failures"][:3]:
+                print(f"    ✗ {failure}")
+    finally:
+        if server_process is not None:
+            server_process.terminate()
+            server_process.wait(timeout=10)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps({"transport": args.transport, "steps": steps}, indent=2), encoding="utf-8")
+        print(f"\n✓ Results written to {args.output}")
+
+    return 1 if any(step["error_rate"] for step in steps) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
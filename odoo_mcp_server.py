@@ -1,77 +1,1052 @@
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+from collections import OrderedDict, deque
+from contextvars import ContextVar
+from functools import wraps
+from urllib.parse import unquote
+import array
+import ast
+import atexit
+import bisect
+import hashlib
+import inspect
+import io
+import json
+import math
+import mmap
+import os
+import posixpath
 import re
-from mcp.server.fastmcp import FastMCP, Context
+import sys
+import threading
+import time
+import weakref
+import zlib
+from xml.sax.saxutils import escape, quoteattr
+from mcp.server.fastmcp import FastMCP
+
+if TYPE_CHECKING:
+    from addons_index import AddonsIndex
+    from code_checks import CheckCache
+    from odoo_rpc import OdooClient
 
 ODOO_VERSIONS = ["17.0", "18.0", "19.0"]
 DOCS_BASE_PATH = Path(__file__).parent / "docs"
+DOCS_BUNDLE_PATH = Path(__file__).parent / "docs.bundle"
 RULES_BASE_PATH = Path(__file__).parent / "rules"
 
 mcp = FastMCP("Odoo Development Assistant")
 
 current_version = {"value": "19.0"}
+session_versions: "weakref.WeakKeyDictionary[Any, str]" = weakref.WeakKeyDictionary()
+
+METRICS_SAMPLE_SIZE = 2048
+METRICS_QUANTILES = (0.5, 0.95, 0.99)
+PROFILE_HANDLERS = {name.strip() for name in os.environ.get("ODOO_MCP_PROFILE", "").split(",") if name.strip()}
+PROFILE_TOP_N = 25
+PROFILE_READ_ONLY_FORMATS = ("markdown", "json", "text", "diff")
+
+
+class HandlerStats:
+    __slots__ = ("count", "errors", "bytes_out", "cache_hits", "total_ns", "samples")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors = 0
+        self.bytes_out = 0
+        self.cache_hits = 0
+        self.total_ns = 0
+        self.samples: deque[int] = deque(maxlen=METRICS_SAMPLE_SIZE)
+
+    def quantile_ms(self, q: float) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(q * len(ordered)))
+        return ordered[index] / 1_000_000
+
+
+handler_stats: dict[str, HandlerStats] = {}
+handler_functions: dict[str, Any] = {}
+_metrics_lock = threading.Lock()
+_active_handler: ContextVar[str | None] = ContextVar("active_handler", default=None)
+_tracing_lock = threading.Lock()
+_tracing = {"users": 0, "owned": False}
+_warm_up = {"armed": False}
+_warm_up_lock = threading.Lock()
+
+
+def record_cache_hit() -> None:
+    name = _active_handler.get()
+    if name is None:
+        return
+    with _metrics_lock:
+        handler_stats[name].cache_hits += 1
+
+
+def _payload_size(result: Any) -> int:
+    if isinstance(result, str):
+        return len(result.encode("utf-8"))
+    if isinstance(result, (bytes, bytearray)):
+        return len(result)
+    return 0
+
+
+def profile_call(fn, *args, **kwargs) -> tuple[Any, str]:
+    import cProfile
+    import io
+    import pstats
+    import tracemalloc
+    
+    with _tracing_lock:
+        if _tracing["users"] == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start(10)
+            _tracing["owned"] = True
+        _tracing["users"] += 1
+    tracemalloc.reset_peak()
+    before = tracemalloc.take_snapshot()
+    profiler = cProfile.Profile()
+    start = time.perf_counter_ns()
+    try:
+        result = profiler.runcall(fn, *args, **kwargs)
+    finally:
+        elapsed = time.perf_counter_ns() - start
+        after = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        with _tracing_lock:
+            _tracing["users"] -= 1
+            if _tracing["users"] == 0 and _tracing["owned"]:
+                tracemalloc.stop()
+                _tracing["owned"] = False
+    
+    stats_output = io.StringIO()
+    pstats.Stats(profiler, stream=stats_output).strip_dirs().sort_stats("cumulative").print_stats(PROFILE_TOP_N)
+    
+    ignored = (
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    )
+    allocations = after.filter_traces(ignored).compare_to(before.filter_traces(ignored), "lineno")
+    
+    report = f"# Profile for {fn.__name__}\n\n"
+    report += f"- Wall time: {elapsed / 1_000_000:.2f} ms\n"
+    report += f"- Peak traced memory: {peak / 1024:.1f} KiB\n"
+    report += f"- Net allocated: {sum(stat.size_diff for stat in allocations) / 1024:.1f} KiB\n\n"
+    report += f"## Top {PROFILE_TOP_N} functions by cumulative time\n\n"
+    report += stats_output.getvalue().strip() + "\n\n"
+    report += f"## Top {PROFILE_TOP_N} allocation sites\n\n"
+    for stat in allocations[:PROFILE_TOP_N]:
+        report += f"{stat}\n"
+    
+    return result, report
+
+
+def _cache_path(name: str) -> Path:
+    import getpass
+    import tempfile
+    
+    base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "odoo_mcp"
+    try:
+        base.mkdir(mode=0o700, parents=True, exist_ok=True)
+    except OSError:
+        base = Path(tempfile.gettempdir()) / f"odoo_mcp-{getpass.getuser()}"
+        base.mkdir(mode=0o700, exist_ok=True)
+        if hasattr(os, "getuid") and base.stat().st_uid != os.getuid():
+            raise PermissionError(f"Cache directory {base} belongs to another user")
+    return base / name
+
+
+def _write_profile_report(name: str, report: str) -> Path | None:
+    profile_dir = Path(os.environ.get("ODOO_MCP_PROFILE_DIR") or _cache_path("profiles"))
+    target = profile_dir / f"{name}-{time.time_ns()}.txt"
+    try:
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        target.write_text(report, encoding="utf-8")
+    except OSError as e:
+        print(f"⚠ Could not write profile report for {name}: {e}", file=sys.stderr)
+        return None
+    return target
+
+
+def instrumented(fn):
+    name = fn.__name__
+    stats = handler_stats.setdefault(name, HandlerStats())
+    handler_functions[name] = fn
+    profiled = name in PROFILE_HANDLERS or "*" in PROFILE_HANDLERS
+    
+    def record(start: int, failed: bool, result: Any) -> None:
+        elapsed = time.perf_counter_ns() - start
+        size = _payload_size(result)
+        with _metrics_lock:
+            stats.count += 1
+            stats.errors += failed
+            stats.bytes_out += size
+            stats.total_ns += elapsed
+            stats.samples.append(elapsed)
+    
+    if inspect.iscoroutinefunction(fn):
+        @wraps(fn)
+        async def async_wrapper(*args, **kwargs):
+            if _warm_up["armed"]:
+                start_warm_up()
+            token = _active_handler.set(name)
+            start = time.perf_counter_ns()
+            failed = True
+            result = None
+            try:
+                result = await fn(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                _active_handler.reset(token)
+                record(start, failed, result)
+        
+        return async_wrapper
+    
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        if _warm_up["armed"]:
+            start_warm_up()
+        token = _active_handler.set(name)
+        start = time.perf_counter_ns()
+        failed = True
+        result = None
+        try:
+            if profiled:
+                result, report = profile_call(fn, *args, **kwargs)
+                _write_profile_report(name, report)
+            else:
+                result = fn(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            _active_handler.reset(token)
+            record(start, failed, result)
+
+    return wrapper
+
+
+def render_prometheus_metrics() -> str:
+    with _metrics_lock:
+        snapshot = {name: stats for name, stats in handler_stats.items() if stats.count}
+        lines = [
+            "# HELP odoo_mcp_handler_calls_total Handler invocations.",
+            "# TYPE odoo_mcp_handler_calls_total counter",
+        ]
+        lines += [f'odoo_mcp_handler_calls_total{{handler="{name}"}} {stats.count}' for name, stats in snapshot.items()]
+        lines += [
+            "# HELP odoo_mcp_handler_errors_total Handler invocations that raised.",
+            "# TYPE odoo_mcp_handler_errors_total counter",
+        ]
+        lines += [f'odoo_mcp_handler_errors_total{{handler="{name}"}} {stats.errors}' for name, stats in snapshot.items()]
+        lines += [
+            "# HELP odoo_mcp_handler_response_bytes_total Bytes returned by the handler.",
+            "# TYPE odoo_mcp_handler_response_bytes_total counter",
+        ]
+        lines += [f'odoo_mcp_handler_response_bytes_total{{handler="{name}"}} {stats.bytes_out}' for name, stats in snapshot.items()]
+        lines += [
+            "# HELP odoo_mcp_handler_cache_hits_total Cache hits while serving the handler.",
+            "# TYPE odoo_mcp_handler_cache_hits_total counter",
+        ]
+        lines += [f'odoo_mcp_handler_cache_hits_total{{handler="{name}"}} {stats.cache_hits}' for name, stats in snapshot.items()]
+        lines += [
+            "# HELP odoo_mcp_handler_duration_seconds Handler latency over the recent sample window.",
+            "# TYPE odoo_mcp_handler_duration_seconds summary",
+        ]
+        for name, stats in snapshot.items():
+            for q in METRICS_QUANTILES:
+                lines.append(f'odoo_mcp_handler_duration_seconds{{handler="{name}",quantile="{q}"}} {stats.quantile_ms(q) / 1000:.6f}')
+            lines.append(f'odoo_mcp_handler_duration_seconds_sum{{handler="{name}"}} {stats.total_ns / 1e9:.6f}')
+            lines.append(f'odoo_mcp_handler_duration_seconds_count{{handler="{name}"}} {stats.count}')
+    
+    return "\n".join(lines) + "\n"
+
+
+def _dump_metrics_on_exit() -> None:
+    target = os.environ.get("ODOO_MCP_METRICS_FILE")
+    if target:
+        Path(target).write_text(render_prometheus_metrics(), encoding="utf-8")
+
+
+atexit.register(_dump_metrics_on_exit)
+
+BUNDLE_MAGIC = b"ODOODOC1"
+BUNDLE_ENV = "ODOO_MCP_DOCS_BUNDLE"
+BUNDLE_STORED = 0
+BUNDLE_ZLIB = 1
+
+
+class DocsDirectory:
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.resolved_root = root.resolve()
+
+    def _path(self, relative: str) -> Path | None:
+        path = (self.root / relative).resolve()
+        if path != self.resolved_root and self.resolved_root not in path.parents:
+            return None
+        return path
+
+    def exists(self, relative: str) -> bool:
+        path = self._path(relative)
+        return path is not None and path.exists()
+
+    def is_file(self, relative: str) -> bool:
+        path = self._path(relative)
+        return path is not None and path.is_file()
+
+    def list_files(self, prefix: str, suffix: str = "") -> list[str]:
+        base = self.root / prefix
+        if not base.is_dir():
+            return []
+        return [
+            str(path.relative_to(self.root)).replace("\\", "/")
+            for path in base.rglob(f"*{suffix}")
+            if path.is_file()
+        ]
+
+    def stamp(self, relative: str) -> tuple[int, int]:
+        stat = self.root.joinpath(relative).stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def read_bytes(self, relative: str) -> bytes:
+        path = self._path(relative)
+        if path is None or not path.is_file():
+            raise FileNotFoundError(relative)
+        return path.read_bytes()
+
+
+class DocsBundle:
+    def __init__(self, path: Path) -> None:
+        with open(path, "rb") as bundle:
+            self.buffer = mmap.mmap(bundle.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.buffer[:len(BUNDLE_MAGIC)] != BUNDLE_MAGIC:
+            raise ValueError(f"Not an Odoo documentation bundle: {path}")
+        
+        header_start = len(BUNDLE_MAGIC) + 8
+        header_length = int.from_bytes(self.buffer[len(BUNDLE_MAGIC):header_start], "little")
+        header = json.loads(self.buffer[header_start:header_start + header_length])
+        self.path = path
+        self.data_base = header_start + header_length
+        self.entries: dict[str, list] = {entry[0]: entry[1:] for entry in header["files"]}
+        self.directories = {
+            name.rsplit("/", depth)[0]
+            for name in self.entries
+            for depth in range(1, name.count("/") + 1)
+        }
+
+    def exists(self, relative: str) -> bool:
+        relative = relative.strip("/")
+        return relative in self.entries or relative in self.directories
+
+    def is_file(self, relative: str) -> bool:
+        return relative in self.entries
+
+    def list_files(self, prefix: str, suffix: str = "") -> list[str]:
+        prefix = prefix.strip("/") + "/" if prefix else ""
+        return [name for name in self.entries if name.startswith(prefix) and name.endswith(suffix)]
+
+    def close(self) -> None:
+        self.buffer.close()
+
+    def stamp(self, relative: str) -> tuple[int, int]:
+        _, _, raw_length, _, checksum = self.entries[relative]
+        return checksum, raw_length
+
+    def read_bytes(self, relative: str) -> bytes:
+        entry = self.entries.get(relative)
+        if entry is None:
+            raise FileNotFoundError(relative)
+        offset, stored_length, _, method, checksum = entry
+        start = self.data_base + offset
+        data = self.buffer[start:start + stored_length]
+        if method == BUNDLE_ZLIB:
+            data = zlib.decompress(data)
+        if zlib.crc32(data) != checksum:
+            raise ValueError(f"Corrupt bundle entry: {relative}")
+        return data
+
+
+def build_docs_bundle(source: Path, target: Path, level: int = 9) -> dict[str, int]:
+    directory = DocsDirectory(source)
+    files = []
+    frames = bytearray()
+    for relative in directory.list_files(""):
+        raw = directory.read_bytes(relative)
+        compressed = zlib.compress(raw, level)
+        method, stored = (BUNDLE_ZLIB, compressed) if len(compressed) < len(raw) else (BUNDLE_STORED, raw)
+        files.append([relative, len(frames), len(stored), len(raw), method, zlib.crc32(raw)])
+        frames += stored
+    
+    header = json.dumps({"files": files}, separators=(",", ":")).encode("utf-8")
+    staging = target.with_suffix(f".{os.getpid()}.tmp")
+    staging.write_bytes(BUNDLE_MAGIC + len(header).to_bytes(8, "little") + header + bytes(frames))
+    os.replace(staging, target)
+    
+    return {
+        "files": len(files),
+        "raw_bytes": sum(entry[3] for entry in files),
+        "bundle_bytes": target.stat().st_size,
+    }
+
+
+_docs_source: list[DocsDirectory | DocsBundle] = []
+_rst_files_cache: dict[str, list[tuple[str, str]]] = {}
+
+
+def get_docs_source() -> DocsDirectory | DocsBundle:
+    if _docs_source:
+        return _docs_source[0]
+    
+    bundle_path = os.environ.get(BUNDLE_ENV)
+    if bundle_path:
+        source = DocsBundle(Path(bundle_path))
+    elif DOCS_BASE_PATH.exists() or not DOCS_BUNDLE_PATH.exists():
+        source = DocsDirectory(DOCS_BASE_PATH)
+    else:
+        source = DocsBundle(DOCS_BUNDLE_PATH)
+    _docs_source.append(source)
+    return source
+
+
+def version_relative(version: str, path: str) -> str | None:
+    normalized = posixpath.normpath(unquote(path).replace("\\", "/").lstrip("/"))
+    if normalized == ".." or normalized.startswith("../"):
+        return None
+    return f"{version}/{normalized}"
+
+
+def clear_caches() -> None:
+    while _docs_source:
+        source = _docs_source.pop()
+        if isinstance(source, DocsBundle):
+            source.close()
+    _asset_digests.clear()
+    _asset_blobs.clear()
+    _asset_cache_bytes[0] = 0
+    _rst_files_cache.clear()
+    _doc_indexes.clear()
+    _rule_sets.clear()
+    _addons_index.clear()
+    _addons_index_build.clear()
+    _check_cache.clear()
+    while _rpc_client:
+        _rpc_client.pop().close()
+    _rpc_error.clear()
+
+
+ASSET_MIME_TYPES = {
+    "png": "image/png",
+    "jpg": "image/jpeg",
+    "jpeg": "image/jpeg",
+    "gif": "image/gif",
+    "svg": "image/svg+xml",
+}
+ASSET_CACHE_MAX_BYTES = int(os.environ.get("ODOO_MCP_ASSET_CACHE_BYTES", 64 * 1024 * 1024))
+ASSET_PREVIEW_MAX_WIDTH = int(os.environ.get("ODOO_MCP_ASSET_PREVIEW_WIDTH", 800))
+ASSET_PREVIEW_MAX_BYTES = 256 * 1024
+IMAGE_DIRECTIVE = re.compile(r"^\s*\.\. (?:image|figure):: *(\S+)", re.MULTILINE)
+
+_asset_digests: dict[str, tuple[Any, str]] = {}
+_asset_blobs: "OrderedDict[str, bytes]" = OrderedDict()
+_asset_cache_bytes = [0]
+_asset_lock = threading.Lock()
+
+
+def _cache_asset_blob(key: str, data: bytes) -> None:
+    if key in _asset_blobs or len(data) > ASSET_CACHE_MAX_BYTES:
+        return
+    _asset_blobs[key] = data
+    _asset_cache_bytes[0] += len(data)
+    while _asset_cache_bytes[0] > ASSET_CACHE_MAX_BYTES:
+        _, evicted = _asset_blobs.popitem(last=False)
+        _asset_cache_bytes[0] -= len(evicted)
+
+
+def _cached_asset_blob(key: str) -> bytes | None:
+    data = _asset_blobs.get(key)
+    if data is not None:
+        _asset_blobs.move_to_end(key)
+        record_cache_hit()
+    return data
+
+
+def load_asset(version: str, path: str) -> tuple[bytes, str]:
+    if version not in ODOO_VERSIONS:
+        raise ValueError(f"Unknown Odoo version {version}. Available: {', '.join(ODOO_VERSIONS)}")
+    relative = version_relative(version, path)
+    path = unquote(path).lstrip("/")
+    if path.rsplit(".", 1)[-1].lower() not in ASSET_MIME_TYPES:
+        raise ValueError(f"Unsupported asset type: {path}. Supported: {', '.join(ASSET_MIME_TYPES)}")
+    
+    source = get_docs_source()
+    if relative is None or not source.is_file(relative):
+        raise FileNotFoundError(f"Documentation asset not found: {path}")
+    
+    stamp = source.stamp(relative)
+    with _asset_lock:
+        known = _asset_digests.get(relative)
+        if known is not None and known[0] == stamp:
+            data = _cached_asset_blob(known[1])
+            if data is not None:
+                return data, known[1]
+    
+    data = source.read_bytes(relative)
+    digest = hashlib.sha256(data).hexdigest()
+    with _asset_lock:
+        _asset_digests[relative] = (stamp, digest)
+        _cache_asset_blob(digest, data)
+    return data, digest
+
+
+def load_asset_preview(version: str, path: str, max_width: int = ASSET_PREVIEW_MAX_WIDTH) -> bytes:
+    data, digest = load_asset(version, path)
+    if path.lower().endswith(".svg"):
+        return data
+    
+    key = f"{digest}@{max_width}"
+    with _asset_lock:
+        cached = _cached_asset_blob(key)
+    if cached is not None:
+        return cached
+    
+    try:
+        from PIL import Image
+    except ImportError:
+        if len(data) <= ASSET_PREVIEW_MAX_BYTES:
+            return data
+        raise RuntimeError(
+            f"Asset is {len(data)} bytes and downscaling needs Pillow (pip install pillow); "
+            f"fetch the full image from odoo://docs/{version}/assets/{path} instead"
+        )
+    
+    with Image.open(io.BytesIO(data)) as image:
+        if image.width <= max_width:
+            preview = data
+        else:
+            image_format = image.format
+            image.thumbnail((max_width, max(1, image.height * max_width // image.width)))
+            output = io.BytesIO()
+            image.save(output, format=image_format, optimize=True)
+            preview = min(output.getvalue(), data, key=len)
+    
+    with _asset_lock:
+        _cache_asset_blob(key, preview)
+    return preview
 
 
-def get_all_rst_files(version: str) -> list[tuple[Path, str]]:
-    version_path = DOCS_BASE_PATH / version
-    if not version_path.exists():
+def _register_asset_resources(extension: str, mime_type: str) -> None:
+    def get_documentation_asset(version: str, path: str) -> bytes:
+        return load_asset(version, f"{path}.{extension}")[0]
+    
+    def get_documentation_asset_preview(version: str, path: str) -> bytes:
+        return load_asset_preview(version, f"{path}.{extension}")
+    
+    for handler, kind in ((get_documentation_asset, "assets"), (get_documentation_asset_preview, "previews")):
+        handler.__name__ = handler.__qualname__ = f"{handler.__name__}_{extension}"
+        uri = f"odoo://docs/{{version}}/{kind}/{{path}}.{extension}"
+        mcp.resource(uri, mime_type=mime_type)(instrumented(handler))
+
+
+def _current_session() -> Any:
+    try:
+        return mcp.get_context().session
+    except (LookupError, ValueError):
+        return None
+
+
+def get_active_version() -> str:
+    session = _current_session()
+    if session is not None:
+        version = session_versions.get(session)
+        if version:
+            return version
+    return current_version["value"]
+
+
+def get_all_rst_files(version: str) -> list[tuple[str, str]]:
+    cached = _rst_files_cache.get(version)
+    if cached is not None:
+        record_cache_hit()
+        return cached
+    
+    source = get_docs_source()
+    if not source.exists(version):
         return []
     
     files = []
-    for rst_file in version_path.rglob("*.rst"):
-        relative = rst_file.relative_to(version_path)
-        uri_path = str(relative).replace("\\", "/").replace(".rst", "")
-        files.append((rst_file, uri_path))
+    for relative in source.list_files(version, ".rst"):
+        uri_path = relative[len(version) + 1:].replace(".rst", "")
+        files.append((relative, uri_path))
     
+    _rst_files_cache[version] = files
     return files
 
 
+INDEX_MAGIC = b"ODOOIDX3"
+INDEX_DIR_ENV = "ODOO_MCP_INDEX_DIR"
+NGRAM_SIZE = 3
+SNIPPET_CONTEXT_LINES = 2
+
+_doc_indexes: dict[str, "DocIndex"] = {}
+_doc_index_lock = threading.Lock()
+
+
+def _ngrams(text: str) -> set[str]:
+    return {text[i:i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+
+def encode_postings(doc_ids: list[int]) -> bytes:
+    encoded = bytearray()
+    previous = 0
+    for doc_id in doc_ids:
+        delta = doc_id - previous
+        previous = doc_id
+        while delta >= 0x80:
+            encoded.append((delta & 0x7F) | 0x80)
+            delta >>= 7
+        encoded.append(delta)
+    return bytes(encoded)
+
+
+def decode_postings(encoded: bytes | memoryview) -> list[int]:
+    doc_ids = []
+    current = 0
+    delta = 0
+    shift = 0
+    for byte in encoded:
+        delta |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        current += delta
+        doc_ids.append(current)
+        delta = 0
+        shift = 0
+    return doc_ids
+
+
+def _offset_table(buffer: memoryview, start: int, count: int) -> memoryview | array.array:
+    table = buffer[start:start + count * 4]
+    if sys.byteorder == "little":
+        return table.cast("I")
+    swapped = array.array("I", table.tobytes())
+    swapped.byteswap()
+    return swapped
+
+
+class DocIndex:
+    def __init__(self, buffer: bytes | mmap.mmap) -> None:
+        if buffer[:len(INDEX_MAGIC)] != INDEX_MAGIC:
+            raise ValueError("Not an Odoo documentation index snapshot")
+        
+        header_start = len(INDEX_MAGIC) + 8
+        header_length = int.from_bytes(buffer[len(INDEX_MAGIC):header_start], "little")
+        header = json.loads(buffer[header_start:header_start + header_length])
+        sections = header["sections"]
+        self.buffer = buffer
+        self.view = memoryview(buffer)
+        self.version = header["version"]
+        self.docs: list[list] = header["docs"]
+        self.term_count = header["term_count"]
+        self.term_offsets = _offset_table(self.view, sections["term_offsets"], self.term_count + 1)
+        self.posting_offsets = _offset_table(self.view, sections["posting_offsets"], self.term_count + 1)
+        self.line_starts = _offset_table(self.view, sections["line_starts"], header["line_entries"])
+        self.terms_base = sections["terms"]
+        self.postings_base = sections["postings"]
+        self.text_base = sections["text"]
+        self.lower_base = sections["lower_text"]
+
+    @classmethod
+    def load(cls, path: Path) -> "DocIndex":
+        with open(path, "rb") as snapshot:
+            return cls(mmap.mmap(snapshot.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def close(self) -> None:
+        self.term_offsets = self.posting_offsets = self.line_starts = None
+        self.view.release()
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+
+    def uri_path(self, doc_id: int) -> str:
+        return self.docs[doc_id][0]
+
+    def text(self, doc_id: int) -> str:
+        _, offset, length = self.docs[doc_id][:3]
+        start = self.text_base + offset
+        return str(self.view[start:start + length], "utf-8")
+
+    def find_lines(self, doc_id: int, query_lower: str, limit: int = 3, context: int = SNIPPET_CONTEXT_LINES) -> list[tuple[int, str]]:
+        _, text_offset, text_length, lower_offset, lower_length, line_index, line_count = self.docs[doc_id]
+        needle = query_lower.encode("utf-8")
+        if b"\n" in needle:
+            return []
+        
+        starts = self.line_starts[line_index:line_index + line_count]
+        lower_starts = self.line_starts[line_index + line_count:line_index + 2 * line_count]
+        text_start = self.text_base + text_offset
+        lower_start = self.lower_base + lower_offset
+        lower_end = lower_start + lower_length
+        
+        def line_end(line: int, table, length: int) -> int:
+            return table[line + 1] - 1 if line + 1 < line_count else length
+        
+        matches = []
+        position = self.buffer.find(needle, lower_start, lower_end)
+        while position >= 0 and len(matches) < limit:
+            line = bisect.bisect_right(lower_starts, position - lower_start) - 1
+            first = max(0, line - context)
+            last = min(line_count - 1, line + context)
+            
+            match_start = match_end = text_start + starts[line]
+            if line_end(line, starts, text_length) - starts[line] == line_end(line, lower_starts, lower_length) - lower_starts[line]:
+                match_start += position - lower_start - lower_starts[line]
+                match_end = match_start + len(needle)
+            
+            try:
+                before = str(self.view[text_start + starts[first]:match_start], "utf-8")
+                matched = str(self.view[match_start:match_end], "utf-8")
+                after = str(self.view[match_end:text_start + line_end(last, starts, text_length)], "utf-8")
+            except UnicodeDecodeError:
+                before = str(self.view[text_start + starts[first]:text_start + line_end(last, starts, text_length)], "utf-8")
+                matched = after = ""
+            matches.append((line + 1, f"{before}**{matched}**{after}" if matched else f"{before}{after}"))
+            
+            if line + 1 >= line_count:
+                break
+            position = self.buffer.find(needle, lower_start + lower_starts[line + 1], lower_end)
+        
+        return matches
+
+    def _term(self, term_id: int) -> bytes:
+        return self.buffer[self.terms_base + self.term_offsets[term_id]:self.terms_base + self.term_offsets[term_id + 1]]
+
+    def find_term(self, term: str) -> int:
+        key = term.encode("utf-8")
+        low, high = 0, self.term_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._term(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.term_count and self._term(low) == key:
+            return low
+        return -1
+
+    def posting(self, term: str) -> list[int]:
+        term_id = self.find_term(term)
+        if term_id < 0:
+            return []
+        start = self.postings_base + self.posting_offsets[term_id]
+        end = self.postings_base + self.posting_offsets[term_id + 1]
+        return decode_postings(self.view[start:end])
+
+    def candidates(self, query_lower: str) -> list[int]:
+        if len(query_lower) < NGRAM_SIZE:
+            return list(range(len(self.docs)))
+        
+        term_ids = [self.find_term(gram) for gram in _ngrams(query_lower)]
+        if min(term_ids) < 0:
+            return []
+        term_ids.sort(key=lambda term_id: self.posting_offsets[term_id + 1] - self.posting_offsets[term_id])
+        
+        matches = None
+        for term_id in term_ids:
+            start = self.postings_base + self.posting_offsets[term_id]
+            end = self.postings_base + self.posting_offsets[term_id + 1]
+            doc_ids = decode_postings(self.view[start:end])
+            matches = set(doc_ids) if matches is None else matches.intersection(doc_ids)
+            if not matches:
+                return []
+        return sorted(matches)
+
+
+def _line_starts(encoded: bytes) -> array.array:
+    starts = array.array("I", [0])
+    position = encoded.find(b"\n")
+    while position >= 0:
+        starts.append(position + 1)
+        position = encoded.find(b"\n", position + 1)
+    return starts
+
+
+def build_index_snapshot(version: str) -> bytes:
+    docs = []
+    grams: dict[str, list[int]] = {}
+    text = bytearray()
+    lower_text = bytearray()
+    line_starts = array.array("I")
+    source = get_docs_source()
+    for doc_id, (relative, uri_path) in enumerate(get_all_rst_files(version)):
+        try:
+            content = source.read_bytes(relative).decode("utf-8")
+        except Exception:
+            content = ""
+        content_lower = content.lower()
+        encoded = content.encode("utf-8")
+        encoded_lower = content_lower.encode("utf-8")
+        original_lines = _line_starts(encoded)
+        docs.append([uri_path, len(text), len(encoded), len(lower_text), len(encoded_lower), len(line_starts), len(original_lines)])
+        text += encoded
+        lower_text += encoded_lower
+        line_starts.extend(original_lines)
+        line_starts.extend(_line_starts(encoded_lower))
+        for gram in _ngrams(content_lower):
+            grams.setdefault(sys.intern(gram), []).append(doc_id)
+    
+    terms = sorted(grams, key=lambda gram: gram.encode("utf-8"))
+    term_offsets = array.array("I", [0])
+    posting_offsets = array.array("I", [0])
+    term_blob = bytearray()
+    posting_blob = bytearray()
+    for term in terms:
+        term_blob += term.encode("utf-8")
+        posting_blob += encode_postings(grams[term])
+        term_offsets.append(len(term_blob))
+        posting_offsets.append(len(posting_blob))
+    if sys.byteorder != "little":
+        term_offsets.byteswap()
+        posting_offsets.byteswap()
+        line_starts.byteswap()
+    
+    blocks = [
+        term_offsets.tobytes(),
+        posting_offsets.tobytes(),
+        line_starts.tobytes(),
+        bytes(term_blob),
+        bytes(posting_blob),
+        bytes(text),
+        bytes(lower_text),
+    ]
+    names = ["term_offsets", "posting_offsets", "line_starts", "terms", "postings", "text", "lower_text"]
+    header_fields = {"version": version, "docs": docs, "term_count": len(terms), "line_entries": len(line_starts)}
+    
+    # Section offsets live in the header, so grow the header until its own length stops moving them.
+    sections = dict.fromkeys(names, 0)
+    while True:
+        header = json.dumps({**header_fields, "sections": sections}, separators=(",", ":")).encode("utf-8")
+        position = len(INDEX_MAGIC) + 8 + len(header)
+        placed = {}
+        for name, block in zip(names, blocks):
+            position += -position % 4
+            placed[name] = position
+            position += len(block)
+        if placed == sections:
+            break
+        sections = placed
+    
+    snapshot = bytearray(INDEX_MAGIC + len(header).to_bytes(8, "little") + header)
+    for name, block in zip(names, blocks):
+        snapshot += bytes(sections[name] - len(snapshot))
+        snapshot += block
+    return bytes(snapshot)
+
+
+def write_index_snapshots(index_dir: Path) -> Path:
+    index_dir.mkdir(parents=True, exist_ok=True)
+    for version in ODOO_VERSIONS:
+        if not get_docs_source().exists(version):
+            continue
+        target = index_dir / f"{version}.idx"
+        staging = target.with_suffix(f".{os.getpid()}.tmp")
+        staging.write_bytes(build_index_snapshot(version))
+        os.replace(staging, target)
+    return index_dir
+
+
+def get_doc_index(version: str) -> DocIndex | None:
+    index = _doc_indexes.get(version)
+    if index is not None:
+        record_cache_hit()
+        return index
+    
+    with _doc_index_lock:
+        if version in _doc_indexes:
+            return _doc_indexes[version]
+        if not get_docs_source().exists(version):
+            return None
+        
+        index_dir = os.environ.get(INDEX_DIR_ENV)
+        snapshot = Path(index_dir) / f"{version}.idx" if index_dir else None
+        if snapshot is not None and snapshot.exists():
+            index = DocIndex.load(snapshot)
+        else:
+            index = DocIndex(build_index_snapshot(version))
+        _doc_indexes[version] = index
+    
+    return index
+
+
 @mcp.resource("odoo://docs/{version}/index")
+@instrumented
 def get_documentation_index(version: str) -> str:
     if version not in ODOO_VERSIONS:
         return f"Error: Unknown Odoo version {version}. Available: {', '.join(ODOO_VERSIONS)}"
     
-    version_path = DOCS_BASE_PATH / version
-    if not version_path.exists():
+    source = get_docs_source()
+    if not source.exists(version):
         return f"Documentation for Odoo {version} not found"
     
     content = f"# Odoo {version} Documentation Index\n\n"
-    content += f"Current development version: {current_version['value']}\n\n"
+    content += f"Current development version: {get_active_version()}\n\n"
     
     for category in ["howtos", "reference"]:
-        cat_path = version_path / category
-        if cat_path.exists():
+        cat_prefix = f"{version}/{category}"
+        if source.exists(cat_prefix):
             content += f"\n## {category.title()}\n\n"
-            for rst_file in sorted(cat_path.glob("*.rst")):
-                topic = rst_file.stem
+            names = [relative[len(cat_prefix) + 1:] for relative in source.list_files(cat_prefix, ".rst")]
+            for name in sorted(name for name in names if "/" not in name):
+                topic = name[:-len(".rst")]
                 content += f"- {topic}\n"
     
     return content
 
 
 @mcp.resource("odoo://docs/{version}/{path}")
+@instrumented
 def get_documentation_content(version: str, path: str) -> str:
     if version not in ODOO_VERSIONS:
         return f"Error: Unknown Odoo version {version}"
     
-    file_path = DOCS_BASE_PATH / version / f"{path}.rst"
+    relative = version_relative(version, f"{path}.rst")
+    path = unquote(path)
+    source = get_docs_source()
     
-    if not file_path.exists():
-        parts = path.split("/")
-        if len(parts) > 1:
-            file_path = DOCS_BASE_PATH / version / parts[0] / f"{'/'.join(parts[1:])}.rst"
-    
-    if not file_path.exists():
+    if relative is None or not source.is_file(relative):
         return f"Documentation file not found: {path}"
     
     try:
-        content = file_path.read_text(encoding="utf-8")
+        content = source.read_bytes(relative).decode("utf-8")
         return f"# {path} (Odoo {version})\n\n{content}"
     except Exception as e:
         return f"Error reading file: {str(e)}"
 
 
+RULE_HEADING = re.compile(r"^(#{1,6}) +(.+?) *$")
+RULE_SEARCH_LIMIT = 10
+GUIDELINE_CONTEXTS: dict[str, dict[str, list[str] | None]] = {
+    "general": {
+        "clean-code": None,
+        "odoo-development": [
+            "Module Structure",
+            "Module Dependencies",
+            "Version Compatibility",
+            "Common Pitfalls to Avoid",
+            "Summary Checklist",
+        ],
+    },
+    "models": {
+        "odoo-development": [
+            "Python Coding Standards",
+            "Translatable Strings",
+            "Performance Best Practices",
+            "Common Pitfalls to Avoid",
+        ],
+    },
+    "views": {"odoo-development": ["View (XML) Standards", "XML Translation", "Data Files"]},
+    "security": {"odoo-development": ["Security Standards"]},
+    "performance": {"odoo-development": ["Performance Best Practices", "Common Pitfalls to Avoid"]},
+    "testing": {"clean-code": ["Testing"], "odoo-development": ["Testing Standards"]},
+    "all": {"clean-code": None, "odoo-development": None},
+}
+
+
+class RuleSection:
+    __slots__ = ("path", "text", "lower")
+
+    def __init__(self, path: tuple[str, ...], lines: list[str]) -> None:
+        self.path = path
+        self.text = "\n".join(lines)
+        self.lower = self.text.lower()
+
+
+class RuleSet:
+    __slots__ = ("name", "stamp", "raw", "sections", "by_path")
+
+    def __init__(self, name: str, stamp: tuple[int, int], raw: str) -> None:
+        self.name = name
+        self.stamp = stamp
+        self.raw = raw
+        self.sections = parse_rule_sections(raw)
+        self.by_path = {section.path: section for section in self.sections}
+
+    def render(self, titles: list[str] | None) -> str:
+        if titles is None:
+            return "\n".join(section.text for section in self.sections)
+        
+        wanted = set(titles)
+        emitted: set[tuple[str, ...]] = set()
+        parts = []
+        for section in self.sections:
+            if not wanted.intersection(section.path):
+                continue
+            for depth in range(1, len(section.path)):
+                ancestor = section.path[:depth]
+                if ancestor not in emitted:
+                    emitted.add(ancestor)
+                    parts.append(self.by_path[ancestor].text.split("\n", 1)[0] + "\n")
+            emitted.add(section.path)
+            parts.append(section.text)
+        return "\n".join(parts)
+
+
+def parse_rule_sections(content: str) -> list[RuleSection]:
+    lines = content.split("\n")
+    start = 0
+    while start < len(lines) and lines[start].strip() == "---":
+        end = start + 1
+        while end < len(lines) and lines[end].strip() != "---":
+            end += 1
+        start = end + 1
+    
+    sections = []
+    path: tuple[str, ...] = ()
+    levels: tuple[int, ...] = ()
+    current: list[str] = []
+    in_code = False
+    for line in lines[start:]:
+        if line.lstrip().startswith("```"):
+            in_code = not in_code
+        heading = None if in_code else RULE_HEADING.match(line)
+        if heading is None:
+            current.append(line)
+            continue
+        if current or path:
+            sections.append(RuleSection(path, current))
+        level = len(heading.group(1))
+        depth = sum(1 for parent in levels if parent < level)
+        path = path[:depth] + (heading.group(2),)
+        levels = levels[:depth] + (level,)
+        current = [line]
+    if current or path:
+        sections.append(RuleSection(path, current))
+    return sections
+
+
+_rule_sets: dict[str, RuleSet] = {}
+
+
+def load_rule_set(name: str) -> RuleSet | None:
+    rule_file = RULES_BASE_PATH / f"{name}.mdc"
+    try:
+        stat = rule_file.stat()
+    except OSError:
+        return None
+    
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    rule_set = _rule_sets.get(name)
+    if rule_set is not None and rule_set.stamp == stamp:
+        record_cache_hit()
+        return rule_set
+    
+    rule_set = RuleSet(name, stamp, rule_file.read_text(encoding="utf-8"))
+    _rule_sets[name] = rule_set
+    return rule_set
+
+
 @mcp.resource("odoo://rules/{rule_name}")
+@instrumented
 def get_development_rules(rule_name: str) -> str:
     valid_rules = {
         "clean-code": "clean-code.mdc",
@@ -86,175 +1061,1509 @@ def get_development_rules(rule_name: str) -> str:
         content = "# Complete Development Guidelines\n\n"
         for rule_file in RULES_BASE_PATH.glob("*.mdc"):
             try:
-                rule_content = rule_file.read_text(encoding="utf-8")
-                content += f"\n\n---\n\n{rule_content}\n\n"
+                rule_set = load_rule_set(rule_file.stem)
             except Exception:
                 continue
+            if rule_set is not None:
+                content += f"\n\n---\n\n{rule_set.raw}\n\n"
         return content
     
-    rule_file = RULES_BASE_PATH / valid_rules[rule_name]
-    if not rule_file.exists():
+    try:
+        rule_set = load_rule_set(valid_rules[rule_name][:-len(".mdc")])
+    except Exception as e:
+        return f"Error reading rules: {str(e)}"
+    if rule_set is None:
         return f"Rule file not found: {rule_name}"
+    return rule_set.raw
+
+
+OUTPUT_FORMATS = ("markdown", "json", "write", "diff")
+WORKSPACE_ENV = "ODOO_MCP_WORKSPACE"
+CONVENTIONS = {
+    "module": """## Naming Convention Rules ⚠️
+- **Module name**: Use lowercase_with_underscores (e.g., `sale_extended`)
+- **Technical name**: Same as directory name
+- **Display name**: Human-readable (e.g., "Sales Extended")
+- **Never use hyphens** in module names
+""",
+    "model": """## Naming Convention Rules ⚠️
+- **Model name**: Use dots (e.g., `sale.order.line`, not `sale_order_line`)
+- **Class name**: CamelCase (e.g., `SaleOrderLine`)
+- **Field naming**:
+  - Boolean: Start with `is_`, `has_`, `can_`
+  - Many2one: End with `_id`
+  - One2many/Many2many: End with `_ids`
+- **Method naming**: Use `_compute_`, `_onchange_`, `_check_` prefixes
+""",
+    "view": """## Naming Convention Rules ⚠️
+- **View ID**: Format as `view_{model}_{type}` (e.g., `view_sale_order_form`)
+- **Action ID**: Format as `action_{model}` (e.g., `action_sale_order`)
+- **Menu ID**: Format as `menu_{model}` (e.g., `menu_sale_order`)
+- **File naming**: Use underscores (e.g., `sale_order_views.xml`)
+""",
+    "security": """## Security Rules Guidelines ⚠️
+- **Naming**: Use `access_{model}_{group}` format
+- **Permissions**: Format is (read, write, create, unlink)
+  - User group: Usually (1,0,0,0) - read-only
+  - Manager group: Usually (1,1,1,1) - full access
+- **Record Rules**: Use for row-level security
+- **Testing**: Always test security with different user groups
+""",
+}
+
+
+def compact_json(payload: dict[str, Any]) -> str:
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+
+
+def workspace_target(target_dir: str) -> Path:
+    root = os.environ.get(WORKSPACE_ENV)
+    if not root:
+        raise ValueError(f"Writing files is disabled. Set {WORKSPACE_ENV} or start the server with --workspace")
+    root_path = Path(root).resolve()
+    base = (root_path / target_dir).resolve()
+    if base != root_path and root_path not in base.parents:
+        raise ValueError(f"Target directory is outside the workspace: {target_dir}")
+    return base
+
+
+def _workspace_file(base: Path, relative: str) -> Path:
+    path = (base / relative).resolve()
+    if base not in path.parents:
+        raise ValueError(f"Generated path is outside the target directory: {relative}")
+    return path
+
+
+def merge_ordered(existing: list[Any], new: list[Any]) -> list[Any]:
+    merged = list(existing)
+    for position, item in enumerate(new):
+        if item in merged:
+            continue
+        previous = next((new[index] for index in range(position - 1, -1, -1) if new[index] in merged), None)
+        following = next((new[index] for index in range(position + 1, len(new)) if new[index] in merged), None)
+        if previous is not None:
+            merged.insert(merged.index(previous) + 1, item)
+        elif following is not None:
+            merged.insert(merged.index(following), item)
+        else:
+            merged.append(item)
+    return merged
+
+
+def xml_record_spans(source: bytes) -> tuple[dict[str, tuple[int, int]], int] | None:
+    import xml.parsers.expat
+    
+    spans: dict[str, tuple[int, int]] = {}
+    stack: list[tuple[str, str | None, int]] = []
+    root_end = [-1]
+    parser = xml.parsers.expat.ParserCreate()
+    
+    def start(tag: str, attributes: dict[str, str]) -> None:
+        stack.append((tag, attributes.get("id"), parser.CurrentByteIndex))
     
+    def end(tag: str) -> None:
+        _, record_id, begin = stack.pop()
+        index = parser.CurrentByteIndex
+        if not stack:
+            root_end[0] = index
+            return
+        parents = [name for name, _, _ in stack]
+        if record_id and parents in (["odoo"], ["odoo", "data"]):
+            close = source.find(b">", index) + 1 if source.startswith(b"</" + tag.encode(), index) else index
+            spans[record_id] = (begin, close)
+    
+    parser.StartElementHandler = start
+    parser.EndElementHandler = end
+    try:
+        parser.Parse(source, True)
+    except xml.parsers.expat.ExpatError:
+        return None
+    return spans, root_end[0]
+
+
+def merge_xml_records(existing: str, content: str, overwrite: bool = False) -> str | None:
+    old_source, new_source = existing.encode("utf-8"), content.encode("utf-8")
+    old, new = xml_record_spans(old_source), xml_record_spans(new_source)
+    if old is None or new is None:
+        return content if overwrite else None
+    old_spans, root_end = old
+    edits = []
+    added = b""
+    for record_id, (begin, close) in new[0].items():
+        record = new_source[begin:close]
+        if record_id not in old_spans:
+            added += b"\n    " + record + b"\n"
+        elif old_source[slice(*old_spans[record_id])] != record:
+            if not overwrite:
+                return None
+            edits.append((*old_spans[record_id], record))
+    if added:
+        edits.append((root_end, root_end, added))
+    for begin, close, replacement in sorted(edits, reverse=True):
+        old_source = old_source[:begin] + replacement + old_source[close:]
+    return old_source.decode("utf-8")
+
+
+def merge_manifest(existing: str, content: str) -> str | None:
     try:
-        content = rule_file.read_text(encoding="utf-8")
+        old_tree = ast.parse(existing, mode="eval").body
+        new_manifest = ast.literal_eval(content)
+    except (SyntaxError, ValueError):
+        return None
+    if not isinstance(old_tree, ast.Dict):
+        return None
+    
+    source = existing.encode("utf-8")
+    line_starts = [0] + [index + 1 for index, byte in enumerate(source) if byte == 10]
+    replacements = []
+    for key, value in zip(old_tree.keys, old_tree.values):
+        name = key.value if isinstance(key, ast.Constant) else None
+        if name not in ("depends", "data") or not isinstance(value, ast.List):
+            continue
+        try:
+            current = ast.literal_eval(value)
+        except ValueError:
+            return None
+        merged = merge_ordered(current, new_manifest.get(name, []))
+        if merged == current:
+            continue
+        if name == "data":
+            rendered = "[\n" + "".join(f"        {path!r},\n" for path in merged) + "    ]"
+        else:
+            rendered = repr(merged)
+        begin = line_starts[value.lineno - 1] + value.col_offset
+        close = line_starts[value.end_lineno - 1] + value.end_col_offset
+        replacements.append((begin, close, rendered.encode("utf-8")))
+    for begin, close, rendered in sorted(replacements, reverse=True):
+        source = source[:begin] + rendered + source[close:]
+    return source.decode("utf-8")
+
+
+def merge_generated_file(relative: str, existing: str | None, content: str, overwrite: bool = False) -> str | None:
+    if existing is None or existing == content:
         return content
+    
+    name = relative.rsplit("/", 1)[-1]
+    if name.endswith(".csv"):
+        rows = existing.rstrip("\n").split("\n")
+        known = {row.split(",", 1)[0] for row in rows}
+        added = [row for row in content.rstrip("\n").split("\n")[1:] if row.split(",", 1)[0] not in known]
+        return "\n".join(rows + added) + "\n"
+    if name.endswith(".xml"):
+        return merge_xml_records(existing, content, overwrite)
+    if name == "__manifest__.py":
+        merged = merge_manifest(existing, content)
+        return content if merged is None and overwrite else merged
+    if name == "__init__.py":
+        lines = existing.rstrip("\n").split("\n")
+        added = [line for line in content.rstrip("\n").split("\n") if line.strip() and line not in lines]
+        return "\n".join(lines + added) + "\n"
+    return content if overwrite else None
+
+
+def plan_generated_files(base: Path, files: dict[str, str], overwrite: bool = False) -> list[tuple[str, Path, str | None, str, bool]]:
+    plan = []
+    for relative, content in files.items():
+        path = _workspace_file(base, relative)
+        existing = path.read_text(encoding="utf-8") if path.is_file() else None
+        content = content if content.endswith("\n") else content + "\n"
+        merged = merge_generated_file(relative, existing, content, overwrite)
+        plan.append((relative, path, existing, content if merged is None else merged, merged is None))
+    return plan
+
+
+def write_generated_files(base: Path, files: dict[str, str], overwrite: bool = False) -> list[dict[str, Any]]:
+    import shutil
+    import tempfile
+    
+    plan = plan_generated_files(base, files, overwrite)
+    conflicts = [relative for relative, _, _, _, conflict in plan if conflict]
+    if conflicts:
+        raise ValueError(
+            f"Refusing to overwrite modified files: {', '.join(conflicts)}. Pass overwrite=True to replace them"
+        )
+    base.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=".odoo_mcp_staging_", dir=base))
+    written = []
+    try:
+        for relative, path, existing, content, _ in plan:
+            status = "created" if existing is None else "unchanged" if existing == content else "updated"
+            written.append({
+                "path": relative,
+                "status": status,
+                "bytes": len(content.encode("utf-8")),
+                "sha256": hashlib.sha256(content.encode("utf-8")).hexdigest(),
+            })
+            if status != "unchanged":
+                staged = staging / relative
+                staged.parent.mkdir(parents=True, exist_ok=True)
+                staged.write_text(content, encoding="utf-8")
+        
+        for top in sorted(staging.iterdir()):
+            if top.is_file() or not (base / top.name).exists():
+                os.replace(top, base / top.name)
+                continue
+            for staged in sorted(top.rglob("*")):
+                if staged.is_file():
+                    target = base / staged.relative_to(staging)
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    os.replace(staged, target)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    return written
+
+
+def diff_generated_files(base: Path, files: dict[str, str], overwrite: bool = False) -> str:
+    import difflib
+    
+    output = ""
+    for relative, _, existing, content, conflict in plan_generated_files(base, files, overwrite):
+        if existing == content:
+            continue
+        if conflict:
+            output += f"# {relative} differs and would only be replaced with overwrite=True\n"
+        output += "".join(difflib.unified_diff(
+            (existing or "").splitlines(keepends=True),
+            content.splitlines(keepends=True),
+            "/dev/null" if existing is None else f"a/{relative}",
+            f"b/{relative}",
+        ))
+    return output or f"No changes under {base}\n"
+
+
+def generated_files(
+    kind: str,
+    version: str,
+    files: dict[str, str],
+    docs: str,
+    output_format: str = "json",
+    target_dir: str = "",
+    overwrite: bool = False,
+    **extra: Any,
+) -> str:
+    if output_format in ("write", "diff"):
+        try:
+            base = workspace_target(target_dir)
+            if output_format == "diff":
+                return diff_generated_files(base, files, overwrite)
+            result = {"root": str(base), "files": write_generated_files(base, files, overwrite)}
+            if extra.get("warnings"):
+                result["warnings"] = extra["warnings"]
+            return compact_json(result)
+        except (ValueError, OSError) as e:
+            return f"Error writing files: {str(e)}"
+    
+    return compact_json({
+        "version": version,
+        "files": files,
+        **extra,
+        "refs": {
+            "conventions": f"odoo://conventions/{kind}",
+            "docs": docs,
+            "rules": "odoo://rules/odoo-development",
+        },
+    })
+
+
+@mcp.resource("odoo://conventions/{kind}")
+@instrumented
+def get_conventions(kind: str) -> str:
+    if kind not in CONVENTIONS:
+        return f"Unknown conventions: {kind}. Available: {', '.join(CONVENTIONS)}"
+    return CONVENTIONS[kind]
+
+
+for _extension, _mime_type in ASSET_MIME_TYPES.items():
+    _register_asset_resources(_extension, _mime_type)
+
+
+@mcp.tool(structured_output=False)
+@instrumented
+def get_documentation_assets(doc_path: str, version: str = "") -> str:
+    asset_version = version if version and version in ODOO_VERSIONS else get_active_version()
+    relative = version_relative(asset_version, f"{doc_path.strip('/')}.rst")
+    doc_path = unquote(doc_path).strip("/")
+    source = get_docs_source()
+    if relative is None or not source.is_file(relative):
+        return f"Documentation file not found: {doc_path}"
+    
+    content = source.read_bytes(relative).decode("utf-8")
+    base = doc_path.rsplit("/", 1)[0] + "/" if "/" in doc_path else ""
+    references = IMAGE_DIRECTIVE.findall(content)
+    if not references:
+        return f"No images referenced in {doc_path} (Odoo {asset_version})"
+    
+    output = f"# Images in {doc_path} (Odoo {asset_version})\n\n"
+    for reference in dict.fromkeys(references):
+        asset_path = reference.lstrip("/") if reference.startswith("/") else f"{base}{reference}"
+        encoded = asset_path.replace("/", "%2F")
+        try:
+            data, digest = load_asset(asset_version, asset_path)
+        except (ValueError, FileNotFoundError) as e:
+            output += f"- `{reference}`: {str(e)}\n"
+            continue
+        output += f"- `{reference}` ({len(data)} bytes, etag `{digest[:16]}`)\n"
+        output += f"  - Full: odoo://docs/{asset_version}/assets/{encoded}\n"
+        output += f"  - Preview (max {ASSET_PREVIEW_MAX_WIDTH}px wide): odoo://docs/{asset_version}/previews/{encoded}\n"
+    
+    return output
+
+
+@mcp.resource("odoo://metrics")
+def get_metrics() -> str:
+    with _metrics_lock:
+        rows = sorted(
+            ((name, stats) for name, stats in handler_stats.items() if stats.count),
+            key=lambda item: item[1].total_ns,
+            reverse=True,
+        )
+        content = "# Handler Metrics\n\n"
+        if not rows:
+            return content + "No handler calls recorded yet.\n"
+        
+        content += "| Handler | Calls | Errors | p50 ms | p95 ms | p99 ms | Total ms | Bytes out | Cache hits |\n"
+        content += "|---|---|---|---|---|---|---|---|---|\n"
+        for name, stats in rows:
+            p50, p95, p99 = (stats.quantile_ms(q) for q in METRICS_QUANTILES)
+            content += (
+                f"| {name} | {stats.count} | {stats.errors} | {p50:.2f} | {p95:.2f} | {p99:.2f} "
+                f"| {stats.total_ns / 1_000_000:.1f} | {stats.bytes_out} | {stats.cache_hits} |\n"
+            )
+    
+    return content
+
+
+@mcp.resource("odoo://metrics/prometheus")
+def get_prometheus_metrics() -> str:
+    return render_prometheus_metrics()
+
+
+@mcp.tool(structured_output=False)
+def profile_tool_call(tool_name: str, arguments: dict[str, Any] | None = None, save_report: bool = False) -> str:
+    arguments = arguments or {}
+    if tool_name not in handler_functions:
+        return f"Unknown handler: {tool_name}. Available: {', '.join(sorted(handler_functions))}"
+    if inspect.iscoroutinefunction(handler_functions[tool_name]):
+        return f"{tool_name} is asynchronous and cannot be profiled synchronously"
+    if arguments.get("output_format", "markdown") not in PROFILE_READ_ONLY_FORMATS:
+        return f"Profiling only runs handlers read-only; output_format must be one of: {', '.join(PROFILE_READ_ONLY_FORMATS)}"
+    
+    try:
+        result, report = profile_call(handler_functions[tool_name], **arguments)
     except Exception as e:
-        return f"Error reading rules: {str(e)}"
+        return f"Error profiling {tool_name}: {str(e)}"
+    
+    size = _payload_size(result)
+    preview = str(result)[:500]
+    output = f"{report}\n## Result ({size} bytes, first 500 chars)\n\n{preview}\n"
+    if save_report:
+        target = _write_profile_report(tool_name, report)
+        output += f"\nReport written to: {target}\n" if target else "\nReport could not be written\n"
+    
+    return output
+
+
+@mcp.tool(structured_output=False)
+@instrumented
+def set_odoo_version(version: str) -> str:
+    if version not in ODOO_VERSIONS:
+        return f"Invalid version. Available versions: {', '.join(ODOO_VERSIONS)}"
+    if mcp.settings.stateless_http:
+        return (
+            "This server runs stateless, so the version cannot be remembered between requests. "
+            f"Pass version=\"{version}\" to each documentation and generator call instead"
+        )
+    
+    session = _current_session()
+    if session is None:
+        current_version["value"] = version
+    else:
+        session_versions[session] = version
+    return f"Odoo version set to {version}"
+
+
+@mcp.tool(structured_output=False)
+@instrumented
+def get_current_version() -> str:
+    return f"Current Odoo development version: {get_active_version()}"
+
+
+@mcp.tool(structured_output=False)
+@instrumented
+def search_documentation(query: str, version: str = "", output_format: str = "markdown") -> str:
+    search_version = version if version and version in ODOO_VERSIONS else get_active_version()
+    if output_format not in ("markdown", "json"):
+        return f"Unknown output format: {output_format}. Available: markdown, json"
+    
+    results = []
+    index = get_doc_index(search_version)
+    query_lower = query.lower()
+    
+    for doc_id in index.candidates(query_lower) if index is not None else []:
+        matching_lines = index.find_lines(doc_id, query_lower, context=0 if output_format == "json" else SNIPPET_CONTEXT_LINES)
+        if matching_lines:
+            results.append({
+                "file": index.uri_path(doc_id),
+                "matches": matching_lines
+            })
+            if len(results) >= 10:
+                break
+    
+    if output_format == "json":
+        return compact_json({
+            "query": query,
+            "version": search_version,
+            "results": [
+                {
+                    "uri": f"odoo://docs/{search_version}/{result['file'].replace('/', '%2F')}",
+                    "hits": [[number, text] for number, text in result["matches"]],
+                }
+                for result in results
+            ],
+        })
+    
+    if not results:
+        return f"No results found for '{query}' in Odoo {search_version} documentation"
+    
+    output = f"Search results for '{query}' in Odoo {search_version}:\n\n"
+    for result in results[:10]:
+        output += f"## {result['file']}\n"
+        for number, context in result['matches']:
+            output += f"Line {number}:\n{context}\n\n"
+        output += "---\n\n"
+    
+    return output
+
+
+@mcp.tool(structured_output=False)
+@instrumented
+def get_development_guidelines(context: str = "general") -> str:
+    if context not in GUIDELINE_CONTEXTS:
+        context = "general"
+    
+    guidelines = f"# Development Guidelines for {context.title()} Context\n\n"
+    guidelines += f"Current Odoo Version: {get_active_version()}\n\n"
+    
+    for rule_name, titles in GUIDELINE_CONTEXTS[context].items():
+        try:
+            rule_set = load_rule_set(rule_name)
+        except Exception:
+            continue
+        if rule_set is not None:
+            guidelines += rule_set.render(titles) + "\n\n---\n\n"
+    
+    guidelines += "\n## Quick Reference Links\n\n"
+    guidelines += f"- Full rules: odoo://rules/all\n"
+    guidelines += f"- Clean code: odoo://rules/clean-code\n"
+    guidelines += f"- Odoo conventions: odoo://rules/odoo-development\n"
+    guidelines += f"- Documentation: odoo://docs/{get_active_version()}/index\n"
+    
+    return guidelines
+
+
+@mcp.tool(structured_output=False)
+@instrumented
+def search_development_rules(query: str) -> str:
+    query_lower = query.lower().strip()
+    if not query_lower:
+        return "Please provide a search query"
+    
+    results = []
+    for rule_file in sorted(RULES_BASE_PATH.glob("*.mdc")):
+        rule_set = load_rule_set(rule_file.stem)
+        if rule_set is None:
+            continue
+        for section in rule_set.sections:
+            if section.path and query_lower in section.lower:
+                results.append((rule_set.name, section))
+                if len(results) >= RULE_SEARCH_LIMIT:
+                    break
+        if len(results) >= RULE_SEARCH_LIMIT:
+            break
+    
+    if not results:
+        return f"No rules found for '{query}'"
+    
+    output = f"Rules matching '{query}':\n\n"
+    for rule_name, section in results:
+        output += f"## {rule_name}: {' > '.join(section.path)}\n"
+        output += f"Source: odoo://rules/{rule_name}\n\n"
+        output += f"{section.text.strip()}\n\n---\n\n"
+    
+    return output
+
+
+_addons_index: list["AddonsIndex"] = []
+_addons_index_build: list[threading.Thread] = []
+_addons_index_lock = threading.Lock()
+
+
+def build_addons_index(paths: list[Path]) -> None:
+    from addons_index import AddonsIndex
+    
+    key = hashlib.sha256("\0".join(str(path.resolve()) for path in paths).encode("utf-8")).hexdigest()[:16]
+    cache_dir = Path(os.environ.get(INDEX_DIR_ENV) or _cache_path("index"))
+    try:
+        index = AddonsIndex(paths, cache_dir / f"addons-{key}.json")
+    except Exception as e:
+        print(f"⚠ Could not index the addons paths: {type(e).__name__}: {e}", file=sys.stderr)
+        index = None
+    with _addons_index_lock:
+        if _addons_index_build and _addons_index_build[0] is threading.current_thread():
+            if index is None:
+                _addons_index_build.clear()
+            else:
+                _addons_index.append(index)
+
+
+def get_addons_index(wait: bool = False) -> "AddonsIndex | None":
+    if _addons_index:
+        record_cache_hit()
+        return _addons_index[0]
+    
+    from addons_index import addons_paths
+    
+    paths = addons_paths()
+    if not paths:
+        return None
+    with _addons_index_lock:
+        if not _addons_index_build:
+            build = threading.Thread(target=build_addons_index, args=(paths,), name="addons-index", daemon=True)
+            _addons_index_build.append(build)
+            build.start()
+        build = _addons_index_build[0]
+    if wait:
+        build.join()
+    return _addons_index[0] if _addons_index else None
+
+
+def addons_index_unavailable() -> str:
+    from addons_index import ADDONS_PATH_ENV, addons_paths
+    
+    if not addons_paths():
+        return f"No addons paths configured. Set {ADDONS_PATH_ENV} or start the server with --addons-path"
+    return "The addons index is still being built in the background; try again in a moment"
+
+
+_check_cache: list["CheckCache"] = []
+
+
+def get_check_cache() -> "CheckCache":
+    from code_checks import CheckCache
+    
+    with _addons_index_lock:
+        if not _check_cache:
+            cache_dir = Path(os.environ.get(INDEX_DIR_ENV) or _cache_path("index"))
+            _check_cache.append(CheckCache(cache_dir / "checks.json"))
+    return _check_cache[0]
+
+
+def check_roots() -> list[Path]:
+    from addons_index import addons_paths
+    
+    roots = [Path(os.environ[WORKSPACE_ENV])] if os.environ.get(WORKSPACE_ENV) else []
+    roots += addons_paths()
+    return [root.expanduser().resolve() for root in roots]
+
+
+def within(path: Path, roots: list[Path]) -> bool:
+    return any(path == root or root in path.parents for root in roots)
+
+
+def resolve_check_target(path: str, suffixes: tuple[str, ...] = (".py",)) -> Path | None:
+    target = Path(path).expanduser().resolve()
+    inside = within(target, check_roots())
+    if inside and (target.is_dir() or (target.is_file() and target.suffix in suffixes)):
+        return target
+    index = get_addons_index()
+    if index is not None and path in index.addons:
+        return index.addons[path]
+    if not inside:
+        raise ValueError(f"Path is outside the workspace and the addons paths: {path}")
+    return None
+
+
+_rpc_client: list["OdooClient"] = []
+_rpc_client_lock = threading.Lock()
+
+
+_rpc_error: list[str] = []
+
+
+def get_rpc_client() -> "OdooClient | None":
+    if _rpc_client:
+        return _rpc_client[0]
+    
+    from odoo_rpc import RPCError, client_from_env
+    
+    with _rpc_client_lock:
+        if not _rpc_client:
+            if _rpc_error:
+                return None
+            try:
+                client = client_from_env()
+            except (RPCError, ValueError) as e:
+                _rpc_error.append(str(e))
+                print(f"⚠ Odoo RPC unavailable: {e}", file=sys.stderr)
+                return None
+            if client is None:
+                return None
+            _rpc_client.append(client)
+    return _rpc_client[0]
+
+
+def rpc_unavailable() -> str:
+    from odoo_rpc import RPC_URL_ENV
+    
+    if _rpc_error:
+        return f"Odoo RPC is unavailable: {_rpc_error[0]}"
+    return f"No running Odoo configured. Set {RPC_URL_ENV} or start the server with --odoo-url"
+
+
+def known_fields(model_name: str) -> dict[str, dict[str, Any]] | None:
+    index = get_addons_index()
+    if index is not None and index.model(model_name) is not None:
+        return index.fields(model_name)
+    client = get_rpc_client()
+    if client is None:
+        return None
+    
+    from odoo_rpc import RPCError
+    
+    try:
+        fields = client.fields_get([model_name])[model_name]
+    except RPCError:
+        return None
+    if isinstance(fields, RPCError):
+        return None
+    return {name: {"type": field["type"].capitalize(), "module": client.url} for name, field in fields.items()}
+
+
+def unknown_models(models: list[str], known_models: set[str] | None = None) -> list[str]:
+    known_models = known_models or set()
+    index = get_addons_index()
+    client = get_rpc_client()
+    if index is None and client is None:
+        return []
+    unknown = [model for model in dict.fromkeys(models) if model not in known_models and (index is None or index.model(model) is None)]
+    if unknown and client is not None:
+        from odoo_rpc import RPCError
+        
+        try:
+            existing = client.existing_models(unknown)
+        except RPCError:
+            existing = set(unknown)
+        unknown = [model for model in unknown if model not in existing]
+    return unknown
+
+
+def model_warnings(fields: list[dict[str, Any]], inherit: str = "", known_models: set[str] | None = None) -> list[str]:
+    warnings = []
+    for field in fields:
+        if field.get("type") == "Many2one" and not field.get("comodel_name"):
+            warnings.append(f"Field {field.get('name', 'field')} has no comodel_name; defaulted to res.partner")
+    
+    comodels = [
+        field["comodel_name"] for field in fields
+        if field.get("type") in ("Many2one", "One2many", "Many2many") and field.get("comodel_name")
+    ]
+    unknown = set(unknown_models(([inherit] if inherit else []) + comodels, known_models))
+    if inherit in unknown:
+        warnings.append(f"Inherited model {inherit} is not defined in the indexed addons")
+    existing = (known_fields(inherit) or {}) if inherit else {}
+    for field in fields:
+        field_name = field.get("name", "field")
+        comodel = field.get("comodel_name")
+        if field.get("type") in ("Many2one", "One2many", "Many2many") and comodel in unknown:
+            warnings.append(f"Comodel {comodel} of field {field_name} is not defined in the indexed addons")
+        if field_name in existing:
+            warnings.append(
+                f"Field {field_name} already exists on {inherit} "
+                f"({existing[field_name]['type']}, from {existing[field_name]['module']})"
+            )
+    return warnings
+
+
+def depends_warnings(depends: list[str]) -> list[str]:
+    index = get_addons_index()
+    if index is None:
+        return []
+    graph = index.graph
+    warnings = [f"Dependency {module} is not in the indexed addons" for module in depends if module not in index.manifests]
+    for module in depends:
+        implied_by = sorted(other for other in depends if other != module and module in graph.closure(other))
+        if implied_by:
+            warnings.append(f"Dependency {module} is already implied by {', '.join(implied_by)}")
+    return warnings
+
+
+def view_warnings(model_name: str, fields_to_display: list[str]) -> list[str]:
+    known = known_fields(model_name)
+    if known is None:
+        return []
+    
+    from addons_index import AUTOMATIC_FIELDS
+    
+    return [
+        f"Field {field} does not exist on {model_name} in the indexed addons"
+        for field in fields_to_display
+        if field not in known and field not in AUTOMATIC_FIELDS
+    ]
+
+
+def xml_id_warnings(module_name: str, xml_ids: list[str], refs: list[str] | None = None) -> list[str]:
+    refs = refs or []
+    index = get_addons_index()
+    if index is None:
+        return []
+    
+    from addons_index import qualify_xml_id
+    
+    warnings = []
+    if module_name:
+        for local_id in xml_ids:
+            existing = index.xml_id(qualify_xml_id(local_id, module_name))
+            if existing is not None:
+                warnings.append(
+                    f"XML ID {existing['id']} already exists ({existing['model']} in {existing['file']}); "
+                    f"this record would overwrite it"
+                )
+    for ref in refs:
+        if ref.split(".", 1)[0] in index.manifests and index.xml_id(ref) is None:
+            warnings.append(f"Referenced XML ID {ref} is not defined in the indexed addons")
+    return warnings
+
+
+def render_warnings(warnings: list[str]) -> str:
+    if not warnings:
+        return ""
+    return "## Warnings ⚠️\n" + "".join(f"- {warning}\n" for warning in warnings) + "\n"
+
+
+FIELD_TYPES = {
+    "Char", "Text", "Html", "Integer", "Float", "Monetary", "Boolean", "Date", "Datetime", "Binary", "Image",
+    "Selection", "Reference", "Many2one", "One2many", "Many2many", "Many2oneReference", "Json", "Properties",
+}
+
+
+def field_errors(fields: list[dict[str, Any]]) -> list[str]:
+    import keyword
+    
+    errors = []
+    for field in fields:
+        field_name = field.get("name", "field")
+        field_type = field.get("type", "Char")
+        if not isinstance(field_name, str) or not field_name.isidentifier() or keyword.iskeyword(field_name):
+            errors.append(f"Field name {field_name!r} is not a valid Python identifier")
+            continue
+        if field_type not in FIELD_TYPES:
+            errors.append(f"Field {field_name} has unknown type {field_type}. Known types: {', '.join(sorted(FIELD_TYPES))}")
+        required = {"One2many": ("comodel_name", "inverse_name"), "Many2many": ("comodel_name",)}.get(field_type, ())
+        missing = [key for key in required if not isinstance(field.get(key), str) or not field.get(key)]
+        if missing:
+            errors.append(f"Field {field_name} ({field_type}) needs {' and '.join(missing)}")
+        if field_type == "Selection" and "selection" in field:
+            selection = field["selection"]
+            if isinstance(selection, str):
+                try:
+                    selection = ast.literal_eval(selection)
+                except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+                    selection = None
+            if not (
+                isinstance(selection, (list, tuple)) and selection
+                and all(isinstance(option, (list, tuple)) and len(option) == 2 for option in selection)
+            ):
+                errors.append(f"Field {field_name} (Selection) needs a non-empty list of (value, label) pairs")
+    return errors
+
+
+def validation_report(errors: list[str]) -> str:
+    return "Generated code failed validation:\n" + "".join(f"- {error}\n" for error in errors)
+
+
+ACCESS_CSV_HEADER = "id,name,model_id:id,group_id:id,perm_read,perm_write,perm_create,perm_unlink"
+VIEW_TYPES = ("list", "tree", "form", "search", "kanban")
+VIEW_DIALECTS = {
+    "17.0": {"list": "tree", "card": "kanban-box"},
+    "18.0": {"list": "list", "card": "card"},
+    "19.0": {"list": "list", "card": "card"},
+}
+VIEW_DIALECT_DOC = "reference/user_interface/view_architectures"
+VIEW_DIALECT_MARKERS = {
+    "list": {"tree": "<tree", "list": "<list"},
+    "card": {"kanban-box": 't-name="kanban-box"', "card": 't-name="card"'},
+}
+SPEC_DEFAULT_VIEWS = ["list", "form", "search"]
+SPEC_LIST_EXCLUDED_TYPES = {"One2many", "Many2many", "Text", "Html", "Binary"}
+SPEC_SEARCH_TYPES = {"Char", "Many2one", "Selection"}
+FILE_LANGUAGES = {"py": "python", "xml": "xml", "csv": "csv"}
+
+
+def render_manifest(
+    version: str,
+    display_name: str,
+    description: str,
+    author: str,
+    category: str,
+    depends: list[str],
+    data: list[str],
+) -> str:
+    data_lines = "".join(f"        {path!r},\n" for path in data)
+    long_description = description.replace("\\", "\\\\").replace('"', '\\"')
+    return f'''{{
+    'name': {display_name!r},
+    'version': '{version}.1.0.0',
+    'category': {category!r},
+    'summary': {description!r},
+    'description': """
+        {long_description}
+    """,
+    'author': {author!r},
+    'website': 'https://www.yourcompany.com',
+    'license': 'LGPL-3',
+    'depends': {depends},
+    'data': [
+{data_lines}    ],
+    'demo': [],
+    'installable': True,
+    'application': False,
+    'auto_install': False,
+}}
+'''
+
+
+def render_model_code(model_name: str, model_description: str, fields: list[dict[str, Any]], inherit: str = "") -> str:
+    class_name = "".join(word.capitalize() for word in model_name.split("."))
+    
+    field_definitions = []
+    for field in fields:
+        field_name = field.get("name", "field")
+        field_type = field.get("type", "Char")
+        field_string = field.get("string", field_name.replace("_", " ").title())
+        required = field.get("required", False)
+        
+        if field_type == "Many2one":
+            comodel = field.get("comodel_name", "res.partner")
+            field_def = f'    {field_name} = fields.Many2one({comodel!r}, string={field_string!r}, required={required})'
+        elif field_type == "One2many":
+            comodel = field.get("comodel_name")
+            inverse = field.get("inverse_name")
+            field_def = f'    {field_name} = fields.One2many({comodel!r}, {inverse!r}, string={field_string!r})'
+        elif field_type == "Many2many":
+            comodel = field.get("comodel_name")
+            field_def = f'    {field_name} = fields.Many2many({comodel!r}, string={field_string!r})'
+        elif field_type == "Selection":
+            selection = field.get("selection", "[('draft', 'Draft'), ('done', 'Done')]")
+            if not isinstance(selection, str):
+                selection = repr([tuple(option) for option in selection])
+            field_def = f'    {field_name} = fields.Selection({selection}, string={field_string!r}, required={required})'
+        else:
+            field_def = f'    {field_name} = fields.{field_type}(string={field_string!r}, required={required})'
+        
+        field_definitions.append(field_def)
+    
+    fields_code = "\n".join(field_definitions)
+    
+    if inherit:
+        return f'''from odoo import models, fields, api
+
+
+class {class_name}(models.Model):
+    _inherit = {inherit!r}
+
+{fields_code}
+'''
+    return f'''from odoo import models, fields, api
+
+
+class {class_name}(models.Model):
+    _name = {model_name!r}
+    _description = {model_description!r}
+
+    name = fields.Char(string='Name', required=True)
+{fields_code}
+'''
+
+
+def compile_view_templates(dialect: dict[str, str]) -> dict[str, tuple[str, str]]:
+    list_tag = dialect["list"]
+    templates = {
+        "list": (f'''<{list_tag}>
+                {{fields}}
+            </{list_tag}>''', "\n                "),
+        "form": ('''<form>
+                <sheet>
+                    <group>
+                        {fields}
+                    </group>
+                </sheet>
+            </form>''', "\n                        "),
+        "search": ('''<search>
+                {fields}
+            </search>''', "\n                "),
+    }
+    if dialect["card"] == "card":
+        templates["kanban"] = ('''<kanban>
+                <templates>
+                    <t t-name="card">
+                        {fields}
+                    </t>
+                </templates>
+            </kanban>''', "\n                        ")
+    else:
+        templates["kanban"] = ('''<kanban>
+                <field name="name"/>
+                <templates>
+                    <t t-name="kanban-box">
+                        <div class="oe_kanban_card">
+                            <div class="oe_kanban_content">
+                                <div><field name="name"/></div>
+                            </div>
+                        </div>
+                    </t>
+                </templates>
+            </kanban>''', "")
+    return templates
+
+
+VIEW_TEMPLATES = {version: compile_view_templates(dialect) for version, dialect in VIEW_DIALECTS.items()}
+
+
+def view_dialect_mismatches(version: str) -> list[str]:
+    relative = f"{version}/{VIEW_DIALECT_DOC}.rst"
+    source = get_docs_source()
+    if not source.is_file(relative):
+        return []
+    
+    text = source.read_bytes(relative).decode("utf-8")
+    mismatches = []
+    for key, markers in VIEW_DIALECT_MARKERS.items():
+        counts = {choice: text.count(marker) for choice, marker in markers.items()}
+        documented = max(counts, key=counts.get)
+        emitted = VIEW_DIALECTS[version][key]
+        if counts[documented] and documented != emitted:
+            mismatches.append(f"Odoo {version} docs use {markers[documented]} but the templates emit {markers[emitted]}")
+    return mismatches
+
+
+def view_kind(view_type: str) -> str:
+    return "list" if view_type in ("tree", "list") else view_type
+
+
+def view_record_id(model_name: str, view_type: str, version: str = "") -> str:
+    kind = view_kind(view_type)
+    tag = VIEW_DIALECTS[version or get_active_version()]["list"] if kind == "list" else kind
+    return f"view_{model_name.replace('.', '_')}_{tag}"
+
+
+def render_view_record(
+    model_name: str, view_type: str, fields_to_display: list[str], view_name: str = "", version: str = ""
+) -> str | None:
+    version = version or get_active_version()
+    kind = view_kind(view_type)
+    template = VIEW_TEMPLATES[version].get(kind)
+    if template is None:
+        return None
+    if not view_name:
+        view_name = view_record_id(model_name, view_type, version)
+    
+    arch, indent = template
+    tag = VIEW_DIALECTS[version]["list"] if kind == "list" else kind
+    fields_xml = indent.join([f'<field name="{field}"/>' for field in fields_to_display or ["name"]])
+    return f'''    <record id="{view_name}" model="ir.ui.view">
+        <field name="name">{model_name}.{tag}</field>
+        <field name="model">{model_name}</field>
+        <field name="arch" type="xml">
+            {arch.format(fields=fields_xml)}
+        </field>
+    </record>'''
+
+
+def render_action_xml(model_name: str, menu_parent: str = "base.menu_custom", version: str = "") -> str:
+    model_underscore = model_name.replace(".", "_")
+    title = model_name.split('.')[-1].title()
+    list_tag = VIEW_DIALECTS[version or get_active_version()]["list"]
+    return f'''    <record id="action_{model_underscore}" model="ir.actions.act_window">
+        <field name="name">{title}</field>
+        <field name="res_model">{model_name}</field>
+        <field name="view_mode">{list_tag},form</field>
+    </record>
+
+    <menuitem id="menu_{model_underscore}"
+              name="{title}"
+              action="action_{model_underscore}"
+              parent="{menu_parent}"/>'''
+
+
+CORE_GROUPS = {
+    "user": "base.group_user",
+    "portal": "base.group_portal",
+    "public": "base.group_public",
+    "system": "base.group_system",
+    "erp_manager": "base.group_erp_manager",
+    "no_one": "base.group_no_one",
+}
+
+
+def group_ref(group: str, module_name: str) -> str:
+    if "." in group:
+        return group
+    return CORE_GROUPS.get(group) or f"{module_name}.group_{group}"
+
+
+def local_groups(groups: list[Any]) -> dict[str, dict[str, Any]]:
+    local = {}
+    for group in groups:
+        declared = group if isinstance(group, dict) else {"name": group}
+        name = declared.get("name", "")
+        if name and "." not in name and name not in CORE_GROUPS:
+            local.setdefault(name, declared)
+    return local
+
+
+def render_group_record(module_name: str, group: dict[str, Any]) -> str:
+    label = group.get("label") or group["name"].replace("_", " ").title()
+    implied = ", ".join(f"(4, ref('{group_ref(name, module_name)}'))" for name in group.get("implied", ["user"]))
+    return f'''    <record id="group_{group['name']}" model="res.groups">
+        <field name="name">{escape(label)}</field>
+        <field name="implied_ids" eval="[{implied}]"/>
+    </record>'''
+
+
+def render_access_lines(model_name: str, module_name: str, groups: list[str]) -> list[str]:
+    model_underscore = model_name.replace(".", "_")
+    lines = []
+    for group in groups:
+        key = group.rsplit(".", 1)[-1].removeprefix("group_")
+        perms = "1,0,0,0" if group == "user" else "1,1,1,1"
+        lines.append(
+            f"access_{model_underscore}_{key},{module_name}.{key},model_{model_underscore},{group_ref(group, module_name)},{perms}"
+        )
+    return lines
+
+
+def render_record_rule(model_name: str) -> str:
+    model_underscore = model_name.replace(".", "_")
+    return f'''    <record id="{model_underscore}_rule_own" model="ir.rule">
+        <field name="name">{model_name}: See own records</field>
+        <field name="model_id" ref="model_{model_underscore}"/>
+        <field name="domain_force">[('create_uid', '=', user.id)]</field>
+        <field name="groups" eval="[(4, ref('base.group_user'))]"/>
+    </record>'''
+
+
+def render_xml_document(records: list[str]) -> str:
+    body = "\n\n".join(records)
+    return f'''<?xml version="1.0" encoding="utf-8"?>
+<odoo>
+{body}
+</odoo>'''
+
+
+@mcp.tool(structured_output=False)
+@instrumented
+def get_model_info(model_name: str, refresh: bool = False) -> str:
+    index = get_addons_index()
+    if index is None:
+        return addons_index_unavailable()
+    if refresh:
+        index.refresh()
+    
+    model = index.model(model_name)
+    if model is None:
+        matches = index.search(model_name)
+        if not matches:
+            import difflib
+            matches = difflib.get_close_matches(model_name, list(index.models), n=10)
+        suggestions = f" Similar models: {', '.join(matches)}" if matches else ""
+        return f"Model not found in {len(index.addons)} indexed addons: {model_name}.{suggestions}"
+    
+    output = f"# Model {model_name}\n\n"
+    if model["description"]:
+        output += f"{model['description']}\n\n"
+    output += "## Declared In\n\n"
+    for declaration in model["declarations"]:
+        kind = "defines" if declaration["defines"] else "extends"
+        output += f"- {declaration['module']} ({kind}): {declaration['file']}:{declaration['line']} `{declaration['class']}`\n"
+    
+    chain = index.inheritance_chain(model_name)
+    if len(chain) > 1:
+        output += f"\n## Inheritance Chain\n\n{' -> '.join(chain)}\n"
+    
+    fields = index.fields(model_name)
+    output += f"\n## Fields ({len(fields)})\n\n"
+    output += "| Field | Type | Comodel | Module |\n|---|---|---|---|\n"
+    for field_name in sorted(fields):
+        field = fields[field_name]
+        comodel = field.get("comodel") or (f"related: {field['related']}" if field.get("related") else "")
+        output += f"| {field_name} | {field['type']} | {comodel} | {field['module']} |\n"
+    
+    return output
 
 
-@mcp.tool()
-def set_odoo_version(version: str) -> str:
-    if version not in ODOO_VERSIONS:
-        return f"Invalid version. Available versions: {', '.join(ODOO_VERSIONS)}"
+@mcp.tool(structured_output=False)
+@instrumented
+def get_xml_id_info(xml_id: str = "", model_name: str = "", refresh: bool = False) -> str:
+    index = get_addons_index()
+    if index is None:
+        return addons_index_unavailable()
+    if not xml_id and not model_name:
+        return "Please provide an XML ID or a model name"
+    if refresh:
+        index.refresh()
     
-    current_version["value"] = version
-    return f"Odoo version set to {version}"
+    if not xml_id:
+        views = index.model_views.get(model_name, [])
+        if not views:
+            return f"No views for {model_name} in {len(index.addons)} indexed addons"
+        output = f"# Views for {model_name} ({len(views)})\n\n"
+        output += "| XML ID | Inherits | Module |\n|---|---|---|\n"
+        for view_id in views:
+            view = index.xml_id(view_id)
+            output += f"| {view_id} | {view.get('inherit_id', '')} | {view['module']} |\n"
+        return output
+    
+    record = index.xml_id(xml_id)
+    if record is None:
+        matches = index.search_xml_ids(xml_id)
+        suggestions = f" Similar XML IDs: {', '.join(matches)}" if matches else ""
+        return f"XML ID not found in {len(index.addons)} indexed addons: {xml_id}.{suggestions}"
+    
+    output = f"# XML ID {record['id']}\n\n- Model: {record['model']}\n"
+    for key, label in (("res_model", "View Model"), ("inherit_id", "Inherits"), ("parent", "Parent Menu"), ("action", "Action")):
+        if record.get(key):
+            output += f"- {label}: {record[key]}\n"
+    output += "\n## Defined In\n\n"
+    output += "".join(f"- {definition['module']}: {definition['file']}\n" for definition in index.xml_ids[record['id']])
+    
+    chain = index.view_chain(record["id"])
+    if len(chain) > 1:
+        output += f"\n## Inheritance Chain\n\n{' -> '.join(chain)}\n"
+    children = index.inheriting_views.get(record["id"], [])
+    if children:
+        output += f"\n## Inherited By ({len(children)})\n\n"
+        output += "".join(f"- {child} ({index.xml_id(child)['module']})\n" for child in children)
+    
+    return output
 
 
-@mcp.tool()
-def get_current_version() -> str:
-    return f"Current Odoo development version: {current_version['value']}"
+@mcp.tool(structured_output=False)
+@instrumented
+def get_odoo_fields(model_names: str, refresh: bool = False) -> str:
+    client = get_rpc_client()
+    if client is None:
+        return rpc_unavailable()
+    models = [name.strip() for name in model_names.split(",") if name.strip()]
+    if not models:
+        return "Please provide one or more comma-separated model names"
+    
+    from odoo_rpc import RPCError
+    
+    output = ""
+    for model, fields in client.fields_get(models, refresh).items():
+        if isinstance(fields, RPCError):
+            output += f"# {model}\n\nError: {fields}\n\n"
+            continue
+        output += f"# {model} ({len(fields)} fields)\n\n"
+        output += "| Field | Type | Relation | Required | String |\n|---|---|---|---|---|\n"
+        for name in sorted(fields):
+            field = fields[name]
+            required = "yes" if field.get("required") else ""
+            output += f"| {name} | {field.get('type', '')} | {field.get('relation', '')} | {required} | {field.get('string', '')} |\n"
+        output += "\n"
+    return output
 
 
-@mcp.tool()
-def search_documentation(query: str, version: str = "") -> str:
-    search_version = version if version and version in ODOO_VERSIONS else current_version["value"]
+@mcp.tool(structured_output=False)
+@instrumented
+def odoo_search_read(
+    model: str, domain: list | None = None, fields: list[str] | None = None, limit: int = 20, order: str = ""
+) -> str:
+    client = get_rpc_client()
+    if client is None:
+        return rpc_unavailable()
     
-    results = []
-    files = get_all_rst_files(search_version)
+    from odoo_rpc import RPCError
     
-    query_lower = query.lower()
+    try:
+        records = client.search_read(model, domain or [], fields or [], limit, order)
+    except RPCError as e:
+        return f"Error reading {model}: {e}"
+    return json.dumps(records, separators=(",", ":"), default=str)
+
+
+@mcp.tool(structured_output=False)
+@instrumented
+async def extract_documents(paths: str, document_type: str = "invoice", concurrency: int = 4, output_format: str = "markdown") -> str:
+    from extract_client import EXTRACT_FIELDS, EXTRACT_INBOX_ENV, EXTRACT_SUFFIXES, EXTRACT_TOKEN_ENV, ExtractError
+    from extract_client import client_from_env as extract_client_from_env
+    from extract_client import extract_targets, selected_value
     
-    for file_path, uri_path in files:
-        try:
-            content = file_path.read_text(encoding="utf-8")
-            content_lower = content.lower()
-            
-            if query_lower in content_lower:
-                lines = content.split("\n")
-                matching_lines = []
-                
-                for i, line in enumerate(lines):
-                    if query_lower in line.lower():
-                        start = max(0, i - 2)
-                        end = min(len(lines), i + 3)
-                        context = "\n".join(lines[start:end])
-                        matching_lines.append(f"Line {i+1}:\n{context}")
-                        if len(matching_lines) >= 3:
-                            break
-                
-                if matching_lines:
-                    results.append({
-                        "file": uri_path,
-                        "matches": matching_lines[:3]
-                    })
-        except Exception:
+    roots = [Path(os.environ[name]).expanduser().resolve() for name in (WORKSPACE_ENV, EXTRACT_INBOX_ENV) if os.environ.get(name)]
+    if not roots:
+        return f"Reading documents is disabled. Set {WORKSPACE_ENV} or {EXTRACT_INBOX_ENV}"
+    targets = []
+    for path in paths.split(","):
+        if not path.strip():
             continue
+        if not within(Path(path.strip()).expanduser().resolve(), roots):
+            return f"Document path is outside the workspace and the extract inbox: {path.strip()}"
+        targets += [target.resolve() for target in extract_targets(path.strip())]
+    if not targets:
+        return "Please provide one or more comma-separated document files or directories"
+    for target in targets:
+        if not within(target, roots):
+            return f"Document path is outside the workspace and the extract inbox: {target}"
+        if target.suffix.lower() not in EXTRACT_SUFFIXES:
+            return f"Unsupported document: {target}. Supported: {', '.join(EXTRACT_SUFFIXES)}"
+        if not target.is_file():
+            return f"Document not found: {target}"
     
-    if not results:
-        return f"No results found for '{query}' in Odoo {search_version} documentation"
+    try:
+        client = extract_client_from_env(document_type=document_type, concurrency=max(1, concurrency))
+    except ExtractError as e:
+        return str(e)
+    if client is None:
+        return f"No Extract API token configured. Set {EXTRACT_TOKEN_ENV}"
+    async with client:
+        results = await client.process_batch(targets)
     
-    output = f"Search results for '{query}' in Odoo {search_version}:\n\n"
-    for result in results[:10]:
-        output += f"## {result['file']}\n"
-        for match in result['matches']:
-            output += f"{match}\n\n"
-        output += "---\n\n"
+    rows = [
+        {
+            "path": result["path"],
+            "status": result.get("status", ""),
+            "status_msg": result.get("status_msg", ""),
+            "document_token": result.get("document_token", ""),
+            **{field: selected_value(result, field) for field in EXTRACT_FIELDS},
+        }
+        for result in results
+    ]
+    if output_format == "json":
+        return json.dumps(rows, separators=(",", ":"), default=str)
     
+    succeeded = sum(row["status"] == "success" for row in rows)
+    output = f"# Extract Results ({succeeded}/{len(rows)} succeeded)\n\n"
+    output += "| Document | Status | " + " | ".join(EXTRACT_FIELDS) + " |\n"
+    output += "|---" * (len(EXTRACT_FIELDS) + 2) + "|\n"
+    for row in rows:
+        status = row["status"] if row["status"] == "success" else f"{row['status']}: {row['status_msg']}"
+        output += f"| {Path(row['path']).name} | {status} | " + " | ".join(str(row[field]) for field in EXTRACT_FIELDS) + " |\n"
     return output
 
 
-@mcp.tool()
-def get_development_guidelines(context: str = "general") -> str:
-    contexts = {
-        "general": ["clean-code", "odoo-development"],
-        "models": ["odoo-development"],
-        "views": ["odoo-development"],
-        "security": ["odoo-development"],
-        "all": ["clean-code", "odoo-development"]
+@mcp.tool(structured_output=False)
+@instrumented
+def get_module_dependencies(module_names: str = "", query: str = "depends", refresh: bool = False) -> str:
+    queries = ("depends", "dependents", "order", "check")
+    if query not in queries:
+        return f"Unknown query: {query}. Available: {', '.join(queries)}"
+    index = get_addons_index()
+    if index is None:
+        return addons_index_unavailable()
+    if refresh:
+        index.refresh()
+    
+    graph = index.graph
+    modules = [name.strip() for name in module_names.split(",") if name.strip()]
+    unknown = [module for module in modules if module not in index.manifests]
+    if unknown:
+        return f"Module not found in {len(index.manifests)} indexed addons: {', '.join(unknown)}"
+    if not modules and query != "check":
+        return "Please provide one or more comma-separated module names"
+    label = ", ".join(modules)
+    
+    if query == "depends":
+        output = f"# Dependencies of {label}\n\n"
+        for module in modules:
+            closure = graph.closure(module)
+            output += f"## {module}\n\n"
+            output += f"- Direct ({len(graph.depends[module])}): {', '.join(graph.depends[module]) or '-'}\n"
+            output += f"- Transitive ({len(closure)}): {', '.join(sorted(closure)) or '-'}\n\n"
+        return output
+    
+    if query == "dependents":
+        output = f"# Modules depending on {label}\n\n"
+        for module in modules:
+            closure = graph.reverse_closure(module)
+            direct = graph.dependents.get(module, [])
+            output += f"## {module}\n\n"
+            output += f"- Direct ({len(direct)}): {', '.join(direct) or '-'}\n"
+            output += f"- Transitive ({len(closure)}): {', '.join(sorted(closure)) or '-'}\n\n"
+        return output
+    
+    if query == "order":
+        order, cyclic = graph.install_order(modules)
+        output = f"# Install order for {label} ({len(order)} modules)\n\n"
+        output += "".join(f"{position}. {module}\n" for position, module in enumerate(order, 1))
+        if cyclic:
+            output += f"\n⚠️ Not orderable because of a dependency cycle: {', '.join(cyclic)}\n"
+        return output
+    
+    scope = modules or None
+    missing = graph.missing(scope)
+    in_scope = set(modules).union(*(graph.closure(module) for module in modules)) if modules else None
+    cycles = [cycle for cycle in graph.cycles() if in_scope is None or in_scope.intersection(cycle)]
+    broken = [
+        f"{module}: {manifest['error']}"
+        for module, manifest in sorted(index.manifests.items())
+        if manifest.get("error") and (in_scope is None or module in in_scope)
+    ]
+    output = f"# Dependency check for {label or f'{len(index.manifests)} addons'}\n\n"
+    if not missing and not cycles and not broken:
+        return output + "✓ No missing dependencies, cycles or unreadable manifests\n"
+    if missing:
+        output += "## Missing Dependencies\n\n"
+        output += "".join(f"- {module} -> {', '.join(absent)}\n" for module, absent in missing.items()) + "\n"
+    if cycles:
+        output += "## Cycles\n\n"
+        output += "".join(f"- {' -> '.join(cycle + cycle[:1])}\n" for cycle in cycles) + "\n"
+    if broken:
+        output += "## Unreadable Manifests\n\n"
+        output += "".join(f"- {entry}\n" for entry in broken) + "\n"
+    return output
+
+
+@mcp.tool(structured_output=False)
+@instrumented
+def analyze_odoo_performance(path: str, output_format: str = "markdown") -> str:
+    from code_checks import check_targets, run_checks
+    
+    if output_format not in ("markdown", "json"):
+        return f"Unknown output format: {output_format}. Available: markdown, json"
+    try:
+        target = resolve_check_target(path)
+    except ValueError as e:
+        return str(e)
+    if target is None:
+        return f"Not a Python file, directory or indexed module: {path}"
+    
+    files = check_targets(target)
+    results, cached = run_checks(files, "performance", get_check_cache())
+    base = target if target.is_dir() else target.parent
+    findings = {
+        Path(file).relative_to(base).as_posix(): file_findings
+        for file, file_findings in results.items()
+        if file_findings
     }
+    total = sum(len(file_findings) for file_findings in findings.values())
     
-    if context not in contexts:
-        context = "general"
+    if output_format == "json":
+        return compact_json({"target": str(target), "files": len(results), "cached": cached, "findings": findings})
     
-    guidelines = f"# Development Guidelines for {context.title()} Context\n\n"
-    guidelines += f"Current Odoo Version: {current_version['value']}\n\n"
+    output = f"# Performance Analysis: {target}\n\n"
+    output += f"{total} findings in {len(findings)} of {len(results)} files ({cached} cached)\n\n"
+    if not findings:
+        return output + "✓ No ORM performance issues found\n"
+    for file, file_findings in findings.items():
+        output += f"## {file}\n\n"
+        output += "".join(
+            f"- L{finding['line']} `{finding['check']}`: {finding['message']}\n" for finding in file_findings
+        ) + "\n"
+    return output
+
+
+@mcp.tool(structured_output=False)
+@instrumented
+def lint_odoo_code(path: str = "", output_format: str = "text") -> str:
+    from code_checks import LINT_SUFFIXES, check_targets, run_checks
     
-    rule_files = contexts[context]
+    if output_format not in ("text", "json"):
+        return f"Unknown output format: {output_format}. Available: text, json"
+    if path:
+        try:
+            target = resolve_check_target(path, LINT_SUFFIXES)
+        except ValueError as e:
+            return str(e)
+        if target is None:
+            return f"Not a Python, XML or CSV file, directory or indexed module: {path}"
+        targets = [target]
+    elif os.environ.get(WORKSPACE_ENV):
+        targets = [Path(os.environ[WORKSPACE_ENV]).expanduser().resolve()]
+    else:
+        return f"No path given and no workspace configured. Pass a path or set {WORKSPACE_ENV}"
     
-    for rule_name in rule_files:
-        rule_file = RULES_BASE_PATH / f"{rule_name}.mdc"
-        if rule_file.exists():
-            try:
-                content = rule_file.read_text(encoding="utf-8")
-                lines = content.split('\n')
-                clean_content = []
-                in_frontmatter = False
-                frontmatter_count = 0
-                
-                for line in lines:
-                    if line.strip() == '---':
-                        frontmatter_count += 1
-                        in_frontmatter = not in_frontmatter
-                        continue
-                    if not in_frontmatter and frontmatter_count >= 2:
-                        clean_content.append(line)
-                
-                guidelines += '\n'.join(clean_content) + "\n\n---\n\n"
-            except Exception:
-                continue
+    display = {
+        str(file): file.relative_to(target if target.is_dir() else target.parent).as_posix()
+        for target in targets
+        for file in check_targets(target, LINT_SUFFIXES)
+    }
+    results, cached = run_checks([Path(file) for file in display], "lint", get_check_cache())
+    violations = [
+        (display[file], finding)
+        for file, file_findings in results.items()
+        for finding in file_findings
+    ]
     
-    guidelines += "\n## Quick Reference Links\n\n"
-    guidelines += f"- Full rules: odoo://rules/all\n"
-    guidelines += f"- Clean code: odoo://rules/clean-code\n"
-    guidelines += f"- Odoo conventions: odoo://rules/odoo-development\n"
-    guidelines += f"- Documentation: odoo://docs/{current_version['value']}/index\n"
+    if output_format == "json":
+        return compact_json({
+            "files": len(results),
+            "cached": cached,
+            "violations": [[file, finding["line"], finding["check"], finding["message"]] for file, finding in violations],
+        })
     
-    return guidelines
+    lines = [f"{file}:{finding['line']}: {finding['check']} {finding['message']}" for file, finding in violations]
+    lines.append(f"{len(violations)} violations in {len(results)} files ({cached} cached)")
+    return "\n".join(lines)
 
 
-@mcp.tool()
+@mcp.tool(structured_output=False)
+@instrumented
 def create_odoo_module(
     module_name: str,
     display_name: str,
     description: str,
     author: str = "Your Company",
     category: str = "Uncategorized",
-    depends: list[str] = []
+    depends: list[str] | None = None,
+    output_format: str = "markdown",
+    target_dir: str = "",
+    overwrite: bool = False,
+    version: str = ""
 ) -> str:
-    version = current_version["value"]
-    if not depends:
-        depends = ["base"]
+    version = version if version and version in ODOO_VERSIONS else get_active_version()
+    if output_format not in OUTPUT_FORMATS:
+        return f"Unknown output format: {output_format}. Available: {', '.join(OUTPUT_FORMATS)}"
+    depends = depends or ["base"]
+    warnings = depends_warnings(depends)
     
-    manifest_content = f'''{{
-    'name': '{display_name}',
-    'version': '{version}.1.0.0',
-    'category': '{category}',
-    'summary': '{description}',
-    'description': """
-        {description}
-    """,
-    'author': '{author}',
-    'website': 'https://www.yourcompany.com',
-    'license': 'LGPL-3',
-    'depends': {depends},
-    'data': [
-        'security/ir.model.access.csv',
-    ],
-    'demo': [],
-    'installable': True,
-    'application': False,
-    'auto_install': False,
-}}
-'''
+    manifest_content = render_manifest(
+        version, display_name, description, author, category, depends, ["security/ir.model.access.csv"]
+    )
     
     init_content = '''from . import models
 '''
+    access_content = (
+        f"{ACCESS_CSV_HEADER}\n"
+        f"access_{module_name}_user,{module_name}.user,model_{module_name}_model,base.group_user,1,1,1,1"
+    )
+    
+    files = {
+        f"{module_name}/__manifest__.py": manifest_content,
+        f"{module_name}/__init__.py": init_content,
+        f"{module_name}/models/__init__.py": "# Import your models here\n",
+        f"{module_name}/security/ir.model.access.csv": access_content + "\n",
+    }
+    from code_checks import validate_generated_files
+    
+    errors = validate_generated_files(files)
+    if errors:
+        return validation_report(errors)
     
     doc_reference = f"odoo://docs/{version}/reference/backend"
     rules_reference = "odoo://rules/odoo-development"
     
+    if output_format != "markdown":
+        return generated_files(
+            "module",
+            version,
+            files,
+            doc_reference,
+            output_format,
+            target_dir,
+            overwrite,
+            **({"warnings": warnings} if warnings else {}),
+        )
+    
     structure = f"""# Module Structure for {module_name} (Odoo {version})
 
 ## Directory Structure
@@ -291,16 +2600,10 @@ def create_odoo_module(
 
 ### security/ir.model.access.csv
 ```csv
-id,name,model_id:id,group_id:id,perm_read,perm_write,perm_create,perm_unlink
-access_{module_name}_user,{module_name}.user,model_{module_name}_model,base.group_user,1,1,1,1
+{access_content}
 ```
 
-## Naming Convention Rules ⚠️
-- **Module name**: Use lowercase_with_underscores (e.g., `sale_extended`)
-- **Technical name**: Same as directory name
-- **Display name**: Human-readable (e.g., "Sales Extended")
-- **Never use hyphens** in module names
-
+{render_warnings(warnings)}{CONVENTIONS["module"]}
 ## Next Steps
 1. Create the directory structure above
 2. Add models: `create_odoo_model()`
@@ -317,67 +2620,41 @@ access_{module_name}_user,{module_name}.user,model_{module_name}_model,base.grou
     return structure
 
 
-@mcp.tool()
+@mcp.tool(structured_output=False)
+@instrumented
 def create_odoo_model(
     model_name: str,
     model_description: str,
     fields: list[dict[str, Any]],
-    inherit: str = ""
+    inherit: str = "",
+    output_format: str = "markdown",
+    target_dir: str = "",
+    overwrite: bool = False,
+    version: str = ""
 ) -> str:
-    class_name = "".join(word.capitalize() for word in model_name.split("."))
-    
-    field_definitions = []
-    for field in fields:
-        field_name = field.get("name", "field")
-        field_type = field.get("type", "Char")
-        field_string = field.get("string", field_name.replace("_", " ").title())
-        required = field.get("required", False)
-        
-        if field_type == "Many2one":
-            comodel = field.get("comodel_name", "res.partner")
-            field_def = f'    {field_name} = fields.Many2one(\'{comodel}\', string=\'{field_string}\', required={required})'
-        elif field_type == "One2many":
-            comodel = field.get("comodel_name")
-            inverse = field.get("inverse_name")
-            field_def = f'    {field_name} = fields.One2many(\'{comodel}\', \'{inverse}\', string=\'{field_string}\')'
-        elif field_type == "Many2many":
-            comodel = field.get("comodel_name")
-            field_def = f'    {field_name} = fields.Many2many(\'{comodel}\', string=\'{field_string}\')'
-        elif field_type == "Selection":
-            selection = field.get("selection", "[('draft', 'Draft'), ('done', 'Done')]")
-            field_def = f'    {field_name} = fields.Selection({selection}, string=\'{field_string}\', required={required})'
-        else:
-            field_def = f'    {field_name} = fields.{field_type}(string=\'{field_string}\', required={required})'
-        
-        field_definitions.append(field_def)
+    if output_format not in OUTPUT_FORMATS:
+        return f"Unknown output format: {output_format}. Available: {', '.join(OUTPUT_FORMATS)}"
+    errors = field_errors(fields)
+    if errors:
+        return validation_report(errors)
     
-    fields_code = "\n".join(field_definitions)
-    version = current_version["value"]
+    model_code = render_model_code(model_name, model_description, fields, inherit)
+    files = {f"models/{model_name.replace('.', '_')}.py": model_code}
+    from code_checks import validate_generated_files
     
-    if inherit:
-        model_code = f'''from odoo import models, fields, api
-
-
-class {class_name}(models.Model):
-    _inherit = '{inherit}'
-
-{fields_code}
-'''
-    else:
-        model_code = f'''from odoo import models, fields, api
-
-
-class {class_name}(models.Model):
-    _name = '{model_name}'
-    _description = '{model_description}'
-
-    name = fields.Char(string='Name', required=True)
-{fields_code}
-'''
+    errors = validate_generated_files(files)
+    if errors:
+        return validation_report(errors)
+    version = version if version and version in ODOO_VERSIONS else get_active_version()
+    warnings = model_warnings(fields, inherit)
     
     doc_reference = f"odoo://docs/{version}/reference/backend/orm"
     rules_reference = "odoo://rules/odoo-development"
     
+    if output_format != "markdown":
+        extra = {"warnings": warnings} if warnings else {}
+        return generated_files("model", version, files, doc_reference, output_format, target_dir, overwrite, **extra)
+    
     return f"""# Model Definition for {model_name} (Odoo {version})
 
 **File**: models/{model_name.replace('.', '_')}.py
@@ -386,15 +2663,7 @@ class {class_name}(models.Model):
 {model_code}
 ```
 
-## Naming Convention Rules ⚠️
-- **Model name**: Use dots (e.g., `sale.order.line`, not `sale_order_line`)
-- **Class name**: CamelCase (e.g., `SaleOrderLine`)
-- **Field naming**:
-  - Boolean: Start with `is_`, `has_`, `can_`
-  - Many2one: End with `_id`
-  - One2many/Many2many: End with `_ids`
-- **Method naming**: Use `_compute_`, `_onchange_`, `_check_` prefixes
-
+{render_warnings(warnings)}{CONVENTIONS["model"]}
 ## Next Steps
 1. Import in models/__init__.py: `from . import {model_name.replace('.', '_')}`
 2. Add security: `create_security_rules("{model_name}", "module_name")`
@@ -408,108 +2677,61 @@ class {class_name}(models.Model):
 """
 
 
-@mcp.tool()
+@mcp.tool(structured_output=False)
+@instrumented
 def create_odoo_view(
     model_name: str,
     view_type: str,
     fields_to_display: list[str],
-    view_name: str = ""
+    view_name: str = "",
+    output_format: str = "markdown",
+    target_dir: str = "",
+    module_name: str = "",
+    overwrite: bool = False,
+    version: str = ""
 ) -> str:
-    version = current_version["value"]
-    if not view_name:
-        view_name = f"{model_name.replace('.', '_')}_{view_type}_view"
+    version = version if version and version in ODOO_VERSIONS else get_active_version()
+    if output_format not in OUTPUT_FORMATS:
+        return f"Unknown output format: {output_format}. Available: {', '.join(OUTPUT_FORMATS)}"
     
     model_underscore = model_name.replace(".", "_")
     
-    if view_type == "tree":
-        fields_xml = "\n            ".join([f'<field name="{field}"/>' for field in fields_to_display])
-        view_xml = f'''<?xml version="1.0" encoding="utf-8"?>
-<odoo>
-    <record id="{view_name}" model="ir.ui.view">
-        <field name="name">{model_name}.tree</field>
-        <field name="model">{model_name}</field>
-        <field name="arch" type="xml">
-            <tree>
-                {fields_xml}
-            </tree>
-        </field>
-    </record>
-</odoo>'''
-    
-    elif view_type == "form":
-        fields_xml = "\n                    ".join([f'<field name="{field}"/>' for field in fields_to_display])
-        view_xml = f'''<?xml version="1.0" encoding="utf-8"?>
-<odoo>
-    <record id="{view_name}" model="ir.ui.view">
-        <field name="name">{model_name}.form</field>
-        <field name="model">{model_name}</field>
-        <field name="arch" type="xml">
-            <form>
-                <sheet>
-                    <group>
-                        {fields_xml}
-                    </group>
-                </sheet>
-            </form>
-        </field>
-    </record>
-</odoo>'''
-    
-    elif view_type == "search":
-        fields_xml = "\n                ".join([f'<field name="{field}"/>' for field in fields_to_display])
-        view_xml = f'''<?xml version="1.0" encoding="utf-8"?>
-<odoo>
-    <record id="{view_name}" model="ir.ui.view">
-        <field name="name">{model_name}.search</field>
-        <field name="model">{model_name}</field>
-        <field name="arch" type="xml">
-            <search>
-                {fields_xml}
-            </search>
-        </field>
-    </record>
-</odoo>'''
-    
-    elif view_type == "kanban":
-        view_xml = f'''<?xml version="1.0" encoding="utf-8"?>
-<odoo>
-    <record id="{view_name}" model="ir.ui.view">
-        <field name="name">{model_name}.kanban</field>
-        <field name="model">{model_name}</field>
-        <field name="arch" type="xml">
-            <kanban>
-                <field name="name"/>
-                <templates>
-                    <t t-name="kanban-box">
-                        <div class="oe_kanban_card">
-                            <div class="oe_kanban_content">
-                                <div><field name="name"/></div>
-                            </div>
-                        </div>
-                    </t>
-                </templates>
-            </kanban>
-        </field>
-    </record>
-</odoo>'''
-    
-    else:
-        return f"Unsupported view type: {view_type}. Supported types: tree, form, search, kanban"
+    view_record = render_view_record(model_name, view_type, fields_to_display, view_name, version)
+    if view_record is None:
+        return f"Unsupported view type: {view_type}. Supported types: {', '.join(VIEW_TYPES)}"
+    view_xml = render_xml_document([view_record])
+    action_xml = render_action_xml(model_name, version=version)
+    from code_checks import validate_generated_files
     
-    action_xml = f'''    <record id="action_{model_underscore}" model="ir.actions.act_window">
-        <field name="name">{model_name.split('.')[-1].title()}</field>
-        <field name="res_model">{model_name}</field>
-        <field name="view_mode">tree,form</field>
-    </record>
-
-    <menuitem id="menu_{model_underscore}"
-              name="{model_name.split('.')[-1].title()}"
-              action="action_{model_underscore}"
-              parent="base.menu_custom"/>'''
+    errors = validate_generated_files({
+        f"views/{model_underscore}_views.xml": view_xml,
+        "action_menu.xml": f"<odoo>\n{action_xml}\n</odoo>",
+    })
+    if errors:
+        return validation_report(errors)
+    warnings = view_warnings(model_name, fields_to_display) + xml_id_warnings(
+        module_name,
+        [view_name or view_record_id(model_name, view_type, version), f"action_{model_underscore}", f"menu_{model_underscore}"],
+        ["base.menu_custom"],
+    )
     
     doc_reference = f"odoo://docs/{version}/reference/user_interface/view_architectures"
     rules_reference = "odoo://rules/odoo-development"
     
+    if output_format != "markdown":
+        return generated_files(
+            "view",
+            version,
+            {f"views/{model_underscore}_views.xml": view_xml},
+            doc_reference,
+            output_format,
+            target_dir,
+            overwrite,
+            snippets={"action_menu": f"<odoo>\n{action_xml}\n</odoo>"},
+            manifest_data=["security/ir.model.access.csv", f"views/{model_underscore}_views.xml"],
+            **({"warnings": warnings} if warnings else {}),
+        )
+    
     return f"""# {view_type.title()} View for {model_name} (Odoo {version})
 
 **File**: views/{model_underscore}_views.xml
@@ -518,7 +2740,7 @@ def create_odoo_view(
 {view_xml}
 ```
 
-## Action and Menu
+{render_warnings(warnings)}## Action and Menu
 
 ```xml
 <odoo>
@@ -536,12 +2758,7 @@ Add to __manifest__.py 'data' section:
 ],
 ```
 
-## Naming Convention Rules ⚠️
-- **View ID**: Format as `view_{{model}}_{{type}}` (e.g., `view_sale_order_form`)
-- **Action ID**: Format as `action_{{model}}` (e.g., `action_sale_order`)
-- **Menu ID**: Format as `menu_{{model}}` (e.g., `menu_sale_order`)
-- **File naming**: Use underscores (e.g., `sale_order_views.xml`)
-
+{CONVENTIONS["view"]}
 ## Next Steps
 1. Add this file to your manifest's 'data' section
 2. Test the view in Odoo interface
@@ -554,34 +2771,54 @@ Add to __manifest__.py 'data' section:
 """
 
 
-@mcp.tool()
+@mcp.tool(structured_output=False)
+@instrumented
 def create_security_rules(
     model_name: str,
     module_name: str,
-    groups: list[str] = []
+    groups: list[str] | None = None,
+    output_format: str = "markdown",
+    target_dir: str = "",
+    overwrite: bool = False,
+    version: str = ""
 ) -> str:
-    if not groups:
-        groups = ["user", "manager"]
+    if output_format not in OUTPUT_FORMATS:
+        return f"Unknown output format: {output_format}. Available: {', '.join(OUTPUT_FORMATS)}"
+    groups = groups or ["user", "manager"]
     
     model_underscore = model_name.replace(".", "_")
     
-    csv_lines = ["id,name,model_id:id,group_id:id,perm_read,perm_write,perm_create,perm_unlink"]
-    
-    for group in groups:
-        if group == "user":
-            perms = "1,0,0,0"
-        elif group == "manager":
-            perms = "1,1,1,1"
-        else:
-            perms = "1,1,1,1"
-        
-        line = f"access_{model_underscore}_{group},{module_name}.{group},model_{model_underscore},base.group_{group},{perms}"
-        csv_lines.append(line)
-    
-    csv_content = "\n".join(csv_lines)
-    version = current_version["value"]
+    csv_content = "\n".join([ACCESS_CSV_HEADER] + render_access_lines(model_name, module_name, groups))
+    version = version if version and version in ODOO_VERSIONS else get_active_version()
     doc_reference = f"odoo://docs/{version}/reference/backend/security"
     rules_reference = "odoo://rules/odoo-development"
+    group_records = [render_group_record(module_name, group) for group in local_groups(groups).values()]
+    record_rules_xml = render_xml_document(group_records + [render_record_rule(model_name)])
+    files = {
+        "security/ir.model.access.csv": csv_content + "\n",
+        f"security/{module_name}_security.xml": record_rules_xml,
+    }
+    from code_checks import validate_generated_files
+    
+    errors = validate_generated_files(files)
+    if errors:
+        return validation_report(errors)
+    
+    if output_format != "markdown":
+        return generated_files(
+            "security",
+            version,
+            files,
+            doc_reference,
+            output_format,
+            target_dir,
+            overwrite,
+            manifest_data=[
+                f"security/{module_name}_security.xml",
+                "security/ir.model.access.csv",
+                f"views/{model_underscore}_views.xml",
+            ],
+        )
     
     return f"""# Security Rules for {model_name} (Odoo {version})
 
@@ -593,30 +2830,15 @@ def create_security_rules(
 {csv_content}
 ```
 
-## Record Rules (XML) - Optional
+## Groups and Record Rules (XML)
 
 **File**: security/{module_name}_security.xml
 
 ```xml
-<?xml version="1.0" encoding="utf-8"?>
-<odoo>
-    <record id="{model_underscore}_rule_own" model="ir.rule">
-        <field name="name">{model_name}: See own records</field>
-        <field name="model_id" ref="model_{model_underscore}"/>
-        <field name="domain_force">[('create_uid', '=', user.id)]</field>
-        <field name="groups" eval="[(4, ref('base.group_user'))]"/>
-    </record>
-</odoo>
+{record_rules_xml}
 ```
 
-## Security Rules Guidelines ⚠️
-- **Naming**: Use `access_{{model}}_{{group}}` format
-- **Permissions**: Format is (read, write, create, unlink)
-  - User group: Usually (1,0,0,0) - read-only
-  - Manager group: Usually (1,1,1,1) - full access
-- **Record Rules**: Use for row-level security
-- **Testing**: Always test security with different user groups
-
+{CONVENTIONS["security"]}
 ## Manifest Configuration
 
 Add to __manifest__.py 'data' section (order matters):
@@ -640,9 +2862,276 @@ Add to __manifest__.py 'data' section (order matters):
 """
 
 
+@mcp.tool(structured_output=False)
+@instrumented
+def generate_module_from_spec(
+    spec: dict[str, Any],
+    output_format: str = "markdown",
+    target_dir: str = "",
+    overwrite: bool = False,
+    version: str = ""
+) -> str:
+    version = version if version and version in ODOO_VERSIONS else get_active_version()
+    if output_format not in OUTPUT_FORMATS:
+        return f"Unknown output format: {output_format}. Available: {', '.join(OUTPUT_FORMATS)}"
+    
+    module_name = spec.get("module_name", "")
+    models_spec = spec.get("models", [])
+    if not module_name or not isinstance(models_spec, list) or not models_spec:
+        return "Invalid spec: 'module_name' and a non-empty 'models' list are required"
+    
+    display_name = spec.get("display_name", module_name.replace("_", " ").title())
+    declared_groups = spec.get("groups") or ["user", "manager"]
+    groups = [group["name"] if isinstance(group, dict) else group for group in declared_groups]
+    
+    model_files: dict[str, str] = {}
+    view_files: dict[str, str] = {}
+    spec_models = {model.get("name", "") for model in models_spec}
+    errors = [
+        f"{model.get('name', '')}: {error}"
+        for model in models_spec
+        for error in field_errors(model.get("fields", []))
+    ]
+    if errors:
+        return validation_report(errors)
+    warnings = depends_warnings(spec.get("depends") or ["base"])
+    model_imports = []
+    access_lines = []
+    record_rules = []
+    actions = []
+    security_groups = local_groups(declared_groups)
+    for model in models_spec:
+        model_name = model.get("name", "")
+        if not model_name:
+            return "Invalid spec: every model needs a 'name'"
+        
+        model_underscore = model_name.replace(".", "_")
+        fields = model.get("fields", [])
+        inherit = model.get("inherit", "")
+        description = model.get("description", model_name.split(".")[-1].title())
+        model_files[f"models/{model_underscore}.py"] = render_model_code(model_name, description, fields, inherit)
+        warnings += [f"{model_name}: {warning}" for warning in model_warnings(fields, inherit, spec_models)]
+        model_imports.append(f"from . import {model_underscore}\n")
+        if inherit:
+            continue
+        
+        model_groups = model.get("groups") or groups
+        for name, group in local_groups(model_groups).items():
+            security_groups.setdefault(name, group)
+        access_lines += render_access_lines(model_name, module_name, model_groups)
+        if model.get("record_rules"):
+            record_rules.append(render_record_rule(model_name))
+        
+        field_types = {"name": "Char"}
+        field_types.update((field.get("name", "field"), field.get("type", "Char")) for field in fields)
+        columns = {
+            "list": [name for name, field_type in field_types.items() if field_type not in SPEC_LIST_EXCLUDED_TYPES],
+            "search": [name for name, field_type in field_types.items() if field_type in SPEC_SEARCH_TYPES],
+        }
+        records = []
+        for view_type in model.get("views", SPEC_DEFAULT_VIEWS):
+            record = render_view_record(model_name, view_type, columns.get(view_kind(view_type), list(field_types)), version=version)
+            if record is None:
+                return f"Invalid spec: unsupported view type {view_type} for {model_name}. Supported types: {', '.join(VIEW_TYPES)}"
+            records.append(record)
+        if records:
+            view_files[f"views/{model_underscore}_views.xml"] = render_xml_document(records)
+            actions.append(render_action_xml(model_name, f"menu_{module_name}_root", version))
+    
+    security_files: dict[str, str] = {}
+    if security_groups or record_rules:
+        group_records = [render_group_record(module_name, group) for group in security_groups.values()]
+        security_files[f"security/{module_name}_security.xml"] = render_xml_document(group_records + record_rules)
+    if access_lines:
+        security_files["security/ir.model.access.csv"] = "\n".join([ACCESS_CSV_HEADER] + access_lines) + "\n"
+    if actions:
+        root_menu = f'''    <menuitem id="menu_{module_name}_root"
+              name={quoteattr(display_name)}/>'''
+        view_files[f"views/{module_name}_menus.xml"] = render_xml_document([root_menu] + actions)
+    
+    data = list(security_files) + list(view_files)
+    manifest_content = render_manifest(
+        version,
+        display_name,
+        spec.get("description", display_name),
+        spec.get("author", "Your Company"),
+        spec.get("category", "Uncategorized"),
+        spec.get("depends") or ["base"],
+        data,
+    )
+    files = {
+        "__manifest__.py": manifest_content,
+        "__init__.py": "from . import models\n",
+        "models/__init__.py": "".join(model_imports),
+        **model_files,
+        **security_files,
+        **view_files,
+    }
+    files = {f"{module_name}/{path}": content for path, content in files.items()}
+    from code_checks import validate_generated_files
+    
+    errors = validate_generated_files(files)
+    if errors:
+        return validation_report(errors)
+    doc_reference = f"odoo://docs/{version}/reference/backend"
+    
+    if output_format != "markdown":
+        extra = {"warnings": warnings} if warnings else {}
+        return generated_files(
+            "module", version, files, doc_reference, output_format, target_dir, overwrite, manifest_data=data, **extra
+        )
+    
+    output = f"# Module {module_name} (Odoo {version})\n\n"
+    output += f"Generated {len(files)} files for {len(models_spec)} models.\n\n"
+    output += "## Manifest Data Order\n\n"
+    output += "".join(f"{position}. {path}\n" for position, path in enumerate(data, 1))
+    output += "\n" + render_warnings(warnings)
+    output += "## Files\n\n"
+    for path, content in files.items():
+        language = FILE_LANGUAGES.get(path.rsplit(".", 1)[-1], "")
+        output += f"### {path}\n```{language}\n{content.rstrip()}\n```\n\n"
+    output += "## References\n"
+    output += "- Naming Conventions: odoo://conventions/module, odoo://conventions/model, odoo://conventions/view, odoo://conventions/security\n"
+    output += f"- Documentation: {doc_reference}\n"
+    output += "- Development Rules: odoo://rules/odoo-development\n"
+    
+    return output
+
+
+PROMPT_TERM = re.compile(r"@?[A-Za-z_]\w*(?:\.[A-Za-z_]\w*)*")
+PROMPT_STOPWORDS = frozenset(
+    "about above after again against because before being below between could doing during error every "
+    "false feature field fields from have having import into model models module need none odoo other "
+    "please should since some their there these they this those through true under until using which while "
+    "would return class self with when what where will without".split()
+)
+PROMPT_TERM_LIMIT = 12
+PROMPT_CONTEXT_BUDGET = 4000
+PROMPT_SNIPPET_CHARS = 900
+PROMPT_DOC_LIMIT = 3
+PROMPT_RULE_LIMIT = 2
+PROMPT_MAX_DOC_SHARE = 0.25
+
+
+def prompt_terms(text: str) -> list[tuple[str, float]]:
+    terms: dict[str, float] = {}
+    for token in PROMPT_TERM.findall(text):
+        lower = token.lower().removeprefix("self.")
+        if lower in terms or lower in PROMPT_STOPWORDS or len(lower) < 4:
+            continue
+        if "." in token or "_" in token.strip("_") or token.startswith("@") or token[1:] != token[1:].lower():
+            terms[lower] = 2.0
+            tail = token.rsplit(".", 1)[-1]
+            if tail != token and tail[:1].isupper() and tail.lower() not in PROMPT_STOPWORDS:
+                terms.setdefault(tail.lower(), 2.0)
+        elif len(lower) >= 5 and token.isalpha():
+            terms[lower] = 1.0
+    ranked = sorted(terms.items(), key=lambda item: -item[1])
+    return ranked[:PROMPT_TERM_LIMIT]
+
+
+def clip_snippet(text: str, limit: int = PROMPT_SNIPPET_CHARS) -> str:
+    text = text.strip()
+    if len(text) <= limit:
+        return text
+    cut = text.rfind("\n", 0, limit)
+    return text[:cut if cut > 0 else limit].rstrip() + "\n..."
+
+
+def doc_snippets(version: str, terms: list[tuple[str, float]], budget: int) -> list[str]:
+    index = get_doc_index(version)
+    if index is None or not terms:
+        return []
+    
+    total = len(index.docs)
+    scores: dict[int, float] = {}
+    matched: dict[int, list[tuple[float, str]]] = {}
+    for term, weight in terms:
+        if len(term) < NGRAM_SIZE:
+            continue
+        doc_ids = index.candidates(term)
+        if not doc_ids or len(doc_ids) > total * PROMPT_MAX_DOC_SHARE:
+            continue
+        score = weight * math.log(1 + total / len(doc_ids))
+        for doc_id in doc_ids:
+            scores[doc_id] = scores.get(doc_id, 0.0) + score
+            matched.setdefault(doc_id, []).append((score, term))
+    
+    snippets = []
+    for doc_id in sorted(scores, key=lambda doc_id: (-scores[doc_id], doc_id)):
+        for _, term in sorted(matched[doc_id], reverse=True):
+            lines = index.find_lines(doc_id, term, limit=1)
+            if lines:
+                break
+        else:
+            continue
+        uri = f"odoo://docs/{version}/{index.uri_path(doc_id).replace('/', '%2F')}"
+        snippet = f"### {index.uri_path(doc_id)} (line {lines[0][0]}, {uri})\n{clip_snippet(lines[0][1])}\n"
+        if len(snippet) > budget:
+            break
+        snippets.append(snippet)
+        budget -= len(snippet)
+        if len(snippets) >= PROMPT_DOC_LIMIT:
+            break
+    return snippets
+
+
+def rule_snippets(terms: list[tuple[str, float]], budget: int, titles: tuple[str, ...] = ()) -> list[str]:
+    sections = []
+    for rule_file in sorted(RULES_BASE_PATH.glob("*.mdc")):
+        rule_set = load_rule_set(rule_file.stem)
+        if rule_set is not None:
+            sections += [(rule_set.name, section) for section in rule_set.sections if section.path]
+    if not sections:
+        return []
+    
+    weights = {}
+    for term, weight in terms:
+        count = sum(1 for _, section in sections if term in section.lower)
+        if count and count <= len(sections) * PROMPT_MAX_DOC_SHARE:
+            weights[term] = weight * math.log(1 + len(sections) / count)
+    
+    def score(section: RuleSection) -> float:
+        return sum(weight for term, weight in weights.items() if term in section.lower)
+    
+    titled = set(titles)
+    ranked = sorted(
+        ((bool(titled.intersection(section.path)), score(section), position, name, section)
+         for position, (name, section) in enumerate(sections)),
+        key=lambda item: (not item[0], -item[1], item[2]),
+    )
+    snippets = []
+    for pinned, value, _, name, section in ranked[:PROMPT_RULE_LIMIT]:
+        if not pinned and value <= 0:
+            break
+        snippet = f"### {name}: {' > '.join(section.path)} (odoo://rules/{name})\n{clip_snippet(section.text)}\n"
+        if len(snippet) > budget:
+            break
+        snippets.append(snippet)
+        budget -= len(snippet)
+    return snippets
+
+
+def prompt_context(text: str, version: str, titles: tuple[str, ...] = ()) -> str:
+    terms = prompt_terms(text)
+    docs = doc_snippets(version, terms, PROMPT_CONTEXT_BUDGET * 3 // 5)
+    rules = rule_snippets(terms, PROMPT_CONTEXT_BUDGET - sum(map(len, docs)), titles)
+    if not docs and not rules:
+        return ""
+    
+    context = "\nRelevant excerpts retrieved for this request (consult these before searching further):\n"
+    if docs:
+        context += f"\n## Odoo {version} Documentation\n\n" + "\n".join(docs)
+    if rules:
+        context += "\n## Development Rules\n\n" + "\n".join(rules)
+    return context
+
+
 @mcp.prompt()
 def develop_odoo_feature(feature_description: str) -> str:
-    return f"""I need to develop a new feature for Odoo {current_version['value']}:
+    version = get_active_version()
+    context = prompt_context(feature_description, version)
+    return f"""I need to develop a new feature for Odoo {version}:
 
 Feature: {feature_description}
 
@@ -667,14 +3156,16 @@ Please help me following Odoo development guidelines:
 5. Follow Odoo best practices and coding guidelines
    - Review: get_development_guidelines("general")
    - Check: odoo://rules/odoo-development
-
+{context}
 What models, views, and logic do I need to implement this feature?
 """
 
 
 @mcp.prompt()
 def debug_odoo_error(error_message: str, context: str = "") -> str:
-    return f"""I'm encountering an error in Odoo {current_version['value']}:
+    version = get_active_version()
+    excerpts = prompt_context(f"{error_message}\n{context}", version)
+    return f"""I'm encountering an error in Odoo {version}:
 
 Error: {error_message}
 
@@ -699,7 +3190,7 @@ Please help me following Odoo debugging best practices:
 4. Explain how to prevent this error in the future
    - Follow guidelines: get_development_guidelines()
    - Review: odoo://rules/odoo-development
-
+{excerpts}
 What's causing this error and how can I fix it?
 """
 
@@ -721,7 +3212,15 @@ What changes do I need to make to upgrade this module?
 
 @mcp.prompt()
 def review_odoo_code(code: str) -> str:
-    return f"""Please review this Odoo code for version {current_version['value']} against Odoo development guidelines:
+    from code_checks import analyze_performance
+    
+    findings = [finding for finding in analyze_performance(code) if finding["check"] != "syntax-error"]
+    performance_findings = "\n".join(
+        f"     - Line {finding['line']} ({finding['check']}): {finding['message']}" for finding in findings
+    ) or "     - No loop queries, unbatched writes or computes without @api.depends detected"
+    version = get_active_version()
+    context = prompt_context(code, version, ("Performance Best Practices",) if findings else ())
+    return f"""Please review this Odoo code for version {version} against Odoo development guidelines:
 
 ```python
 {code}
@@ -744,8 +3243,8 @@ Check for compliance with Odoo standards:
    - Batch operations
    
 4. **Performance Issues**
-   - Check for N+1 queries
-   - Inefficient loops
+   - Static analysis findings (confirm each and suggest the batched rewrite):
+{performance_findings}
    - Missing indices
    
 5. **Security Concerns**
@@ -759,10 +3258,107 @@ Check for compliance with Odoo standards:
    - Clear naming
 
 Reference guidelines: odoo://rules/odoo-development
-
+{context}
 Provide specific suggestions for improvement.
 """
 
 
+STATELESS_ENV = "ODOO_MCP_STATELESS"
+
+
+def warm_up() -> None:
+    for version in ODOO_VERSIONS:
+        for mismatch in view_dialect_mismatches(version):
+            print(f"⚠ {mismatch}", file=sys.stderr)
+    get_addons_index()
+
+
+def start_warm_up() -> None:
+    with _warm_up_lock:
+        if not _warm_up["armed"]:
+            return
+        _warm_up["armed"] = False
+    threading.Thread(target=warm_up, name="warm-up", daemon=True).start()
+
+
+def create_http_app():
+    mcp.settings.stateless_http = os.environ.get(STATELESS_ENV) == "1"
+    _warm_up["armed"] = True
+    return mcp.streamable_http_app()
+
+
+def serve_http(host: str, port: int, workers: int, index_dir: Path, stateless: bool) -> None:
+    import uvicorn
+    
+    os.environ[INDEX_DIR_ENV] = str(write_index_snapshots(index_dir))
+    if stateless or workers > 1:
+        os.environ[STATELESS_ENV] = "1"
+    
+    uvicorn.run(
+        "odoo_mcp_server:create_http_app",
+        factory=True,
+        host=host,
+        port=port,
+        workers=workers,
+        app_dir=str(Path(__file__).parent),
+        log_level=mcp.settings.log_level.lower(),
+    )
+
+
+def main() -> None:
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Odoo Development MCP Server")
+    parser.add_argument("--transport", choices=["stdio", "http"], default="stdio")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=1, help="HTTP worker processes (implies --stateless when > 1)")
+    parser.add_argument("--stateless", action="store_true", help="Serve Streamable HTTP without server-side sessions")
+    parser.add_argument(
+        "--index-dir",
+        type=Path,
+        help="Where the shared documentation index snapshots are written (default: $XDG_CACHE_HOME/odoo_mcp/index)",
+    )
+    parser.add_argument("--workspace", type=Path, help="Directory the generators may write files into")
+    parser.add_argument("--extract-inbox", type=Path, help="Directory extract_documents may read documents from")
+    parser.add_argument("--addons-path", help="Comma-separated addons directories to index for model lookups")
+    parser.add_argument("--odoo-url", help="Running Odoo to query for models and fields over RPC")
+    parser.add_argument(
+        "--build-bundle",
+        nargs="?",
+        const=DOCS_BUNDLE_PATH,
+        type=Path,
+        help="Pack docs/ into a single compressed bundle and exit (default: docs.bundle)",
+    )
+    args = parser.parse_args()
+    
+    if args.workspace:
+        os.environ[WORKSPACE_ENV] = str(args.workspace)
+    if args.extract_inbox:
+        from extract_client import EXTRACT_INBOX_ENV
+        
+        os.environ[EXTRACT_INBOX_ENV] = str(args.extract_inbox)
+    if args.addons_path:
+        from addons_index import ADDONS_PATH_ENV
+        
+        os.environ[ADDONS_PATH_ENV] = args.addons_path
+    if args.odoo_url:
+        from odoo_rpc import RPC_URL_ENV
+        
+        os.environ[RPC_URL_ENV] = args.odoo_url
+    
+    if args.build_bundle:
+        stats = build_docs_bundle(DOCS_BASE_PATH, args.build_bundle)
+        print(
+            f"Bundled {stats['files']} files into {args.build_bundle}: "
+            f"{stats['raw_bytes'] / 1_048_576:.1f} MiB -> {stats['bundle_bytes'] / 1_048_576:.1f} MiB"
+        )
+    elif args.transport == "http":
+        serve_http(args.host, args.port, args.workers, args.index_dir or _cache_path("index"), args.stateless)
+    else:
+        _warm_up["armed"] = True
+        mcp.run()
+
+
 if __name__ == "__main__":
-    mcp.run()
+    main()
@@ -0,0 +1,276 @@
+"""
+Odoo RPC client for the Odoo MCP Server
+
+Talks to a running Odoo over JSON-RPC (`/jsonrpc`), XML-RPC (`/xmlrpc/2`) or
+the 19.0 JSON-2 API (`/json/2`), reusing keep-alive HTTP connections from a
+small pool. Model metadata from `fields_get` is cached with a TTL and fetched
+for several models concurrently, so schema lookups cost one round-trip per
+model at most, and none while cached.
+"""
+
+import http.client
+import itertools
+import json
+import os
+import queue
+import select
+import threading
+import time
+import xmlrpc.client
+from contextlib import contextmanager
+from typing import Any, Iterator
+from urllib.parse import urlsplit
+
+RPC_URL_ENV = "ODOO_MCP_RPC_URL"
+RPC_DB_ENV = "ODOO_MCP_RPC_DB"
+RPC_USER_ENV = "ODOO_MCP_RPC_USER"
+RPC_PASSWORD_ENV = "ODOO_MCP_RPC_PASSWORD"
+RPC_PROTOCOL_ENV = "ODOO_MCP_RPC_PROTOCOL"
+RPC_POOL_SIZE_ENV = "ODOO_MCP_RPC_POOL_SIZE"
+RPC_METADATA_TTL_ENV = "ODOO_MCP_RPC_METADATA_TTL"
+RPC_PROTOCOLS = ("jsonrpc", "xmlrpc", "json2")
+RPC_TIMEOUT = 30.0
+FIELD_ATTRIBUTES = ["string", "type", "relation", "relation_field", "required", "readonly", "store", "selection"]
+STALE_CONNECTION_ERRORS = (http.client.CannotSendRequest, BrokenPipeError, ConnectionResetError)
+
+
+class RPCError(Exception):
+    pass
+
+
+class ConnectionPool:
+    def __init__(self, url: str, size: int = 4, timeout: float = RPC_TIMEOUT) -> None:
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise RPCError(f"Unsupported Odoo URL: {url}")
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port
+        self.prefix = parts.path.rstrip("/")
+        self.size = size
+        self.timeout = timeout
+        self.created = 0
+        self._idle: queue.LifoQueue[http.client.HTTPConnection] = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+
+    def _connect(self) -> http.client.HTTPConnection:
+        self.created += 1
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.host, self.port, timeout=self.timeout)
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    @contextmanager
+    def connection(self) -> Iterator[http.client.HTTPConnection]:
+        with self._slots:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                connection = self._connect()
+            else:
+                if connection.sock is not None and select.select([connection.sock], [], [], 0)[0]:
+                    connection.close()
+                    self.created += 1
+            try:
+                yield connection
+            except BaseException:
+                connection.close()
+                raise
+            self._idle.put(connection)
+
+    def post(self, path: str, body: bytes, headers: dict[str, str]) -> tuple[int, bytes]:
+        headers = {"Content-Length": str(len(body)), **headers}
+
+        with self.connection() as connection:
+            try:
+                connection.request("POST", self.prefix + path, body, headers)
+            except STALE_CONNECTION_ERRORS:
+                connection.close()
+                self.created += 1
+                connection.request("POST", self.prefix + path, body, headers)
+            response = connection.getresponse()
+            return response.status, response.read()
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+class MetadataCache:
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._entries: dict[str, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                self._entries.pop(key, None)
+                return None
+            return entry[1]
+
+    def put(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class OdooClient:
+    def __init__(
+        self,
+        url: str,
+        db: str = "",
+        username: str = "",
+        password: str = "",
+        protocol: str = "jsonrpc",
+        pool_size: int = 4,
+        metadata_ttl: float = 300.0,
+    ) -> None:
+        if protocol not in RPC_PROTOCOLS:
+            raise RPCError(f"Unknown RPC protocol: {protocol}. Available: {', '.join(RPC_PROTOCOLS)}")
+        self.url = url
+        self.db = db
+        self.username = username
+        self.password = password
+        self.protocol = protocol
+        self.pool = ConnectionPool(url, pool_size)
+        self.metadata = MetadataCache(metadata_ttl)
+        self.requests = 0
+        self._uid: int | None = None
+        self._ids = itertools.count(1)
+        self._login_lock = threading.Lock()
+
+    def _post(self, path: str, body: bytes, headers: dict[str, str]) -> tuple[int, bytes]:
+        self.requests += 1
+        try:
+            return self.pool.post(path, body, headers)
+        except (OSError, http.client.HTTPException) as e:
+            raise RPCError(f"Cannot reach Odoo at {self.url}: {e}") from e
+
+    def call(self, service: str, method: str, *args: Any) -> Any:
+        if self.protocol == "xmlrpc":
+            body = xmlrpc.client.dumps(args, method, allow_none=True).encode("utf-8")
+            status, data = self._post(f"/xmlrpc/2/{service}", body, {"Content-Type": "text/xml"})
+            if status != 200:
+                raise RPCError(f"HTTP {status} from /xmlrpc/2/{service}")
+            try:
+                return xmlrpc.client.loads(data, use_builtin_types=True)[0][0]
+            except xmlrpc.client.Fault as e:
+                raise RPCError(e.faultString.strip().splitlines()[-1]) from e
+
+        payload = {
+            "jsonrpc": "2.0",
+            "method": "call",
+            "params": {"service": service, "method": method, "args": args},
+            "id": next(self._ids),
+        }
+        status, data = self._post("/jsonrpc", json.dumps(payload).encode("utf-8"), {"Content-Type": "application/json"})
+        if status != 200:
+            raise RPCError(f"HTTP {status} from /jsonrpc")
+        try:
+            reply = json.loads(data)
+        except ValueError as e:
+            raise RPCError(f"Invalid JSON-RPC reply from {self.url}/jsonrpc: {data[:80]!r}") from e
+        if not isinstance(reply, dict):
+            raise RPCError(f"Invalid JSON-RPC reply from {self.url}/jsonrpc: {data[:80]!r}")
+        if reply.get("error"):
+            error = reply["error"]
+            raise RPCError((error.get("data") or {}).get("message") or error.get("message", "RPC error"))
+        return reply.get("result")
+
+    @property
+    def uid(self) -> int:
+        with self._login_lock:
+            if self._uid is None:
+                uid = self.call("common", "login", self.db, self.username, self.password)
+                if not uid:
+                    raise RPCError(f"Authentication failed for {self.username} on {self.db}")
+                self._uid = uid
+        return self._uid
+
+    def execute(self, model: str, method: str, **kwargs: Any) -> Any:
+        if self.protocol != "json2":
+            return self.call("object", "execute_kw", self.db, self.uid, self.password, model, method, [], kwargs)
+
+        headers = {"Content-Type": "application/json", "Authorization": f"bearer {self.password}"}
+        if self.db:
+            headers["X-Odoo-Database"] = self.db
+        status, data = self._post(f"/json/2/{model}/{method}", json.dumps(kwargs).encode("utf-8"), headers)
+        try:
+            reply = json.loads(data) if data else None
+        except ValueError:
+            reply = None
+        if status != 200:
+            message = reply.get("message") if isinstance(reply, dict) else None
+            raise RPCError(message or f"HTTP {status} from /json/2/{model}/{method}")
+        return reply
+
+    def fields_get(self, models: list[str], refresh: bool = False) -> dict[str, dict[str, Any] | RPCError]:
+        results: dict[str, dict[str, Any] | RPCError] = {}
+        missing = []
+        for model in dict.fromkeys(models):
+            cached = None if refresh else self.metadata.get(f"fields:{model}")
+            if cached is None:
+                missing.append(model)
+            else:
+                results[model] = cached
+
+        def fetch(model: str) -> dict[str, Any] | RPCError:
+            try:
+                return self.execute(model, "fields_get", attributes=FIELD_ATTRIBUTES)
+            except RPCError as e:
+                return e
+
+        if len(missing) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=min(self.pool.size, len(missing))) as executor:
+                fetched = list(executor.map(fetch, missing))
+        else:
+            fetched = [fetch(model) for model in missing]
+        for model, fields in zip(missing, fetched):
+            if not isinstance(fields, RPCError):
+                self.metadata.put(f"fields:{model}", fields)
+            results[model] = fields
+        return {model: results[model] for model in dict.fromkeys(models)}
+
+    def existing_models(self, models: list[str]) -> set[str]:
+        key = "models:" + ",".join(sorted(set(models)))
+        cached = self.metadata.get(key)
+        if cached is None:
+            records = self.search_read("ir.model", [("model", "in", sorted(set(models)))], ["model"])
+            cached = {record["model"] for record in records}
+            self.metadata.put(key, cached)
+        return cached
+
+    def search_read(
+        self, model: str, domain: list[Any], fields: list[str], limit: int = 80, order: str = ""
+    ) -> list[dict[str, Any]]:
+        kwargs: dict[str, Any] = {"domain": domain, "fields": fields, "limit": limit}
+        if order:
+            kwargs["order"] = order
+        return self.execute(model, "search_read", **kwargs)
+
+    def close(self) -> None:
+        self.pool.close()
+
+
+def client_from_env() -> OdooClient | None:
+    url = os.environ.get(RPC_URL_ENV)
+    if not url:
+        return None
+    return OdooClient(
+        url,
+        os.environ.get(RPC_DB_ENV, ""),
+        os.environ.get(RPC_USER_ENV, "admin"),
+        os.environ.get(RPC_PASSWORD_ENV, ""),
+        os.environ.get(RPC_PROTOCOL_ENV, "jsonrpc"),
+        int(os.environ.get(RPC_POOL_SIZE_ENV, 4)),
+        float(os.environ.get(RPC_METADATA_TTL_ENV, 300)),
+    )
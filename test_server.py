@@ -65,6 +65,15 @@ def test_tools():
     result = get_current_version()
     print(f"✓ get_current_version: {result}")
     
+    from odoo_mcp_server import mcp
+    mcp.settings.stateless_http = True
+    try:
+        assert "Pass version=\"17.0\"" in set_odoo_version("17.0")
+        assert get_current_version().endswith("18.0")
+    finally:
+        mcp.settings.stateless_http = False
+    print("✓ set_odoo_version refuses to pretend in stateless mode")
+    
     from odoo_mcp_server import create_odoo_module
     result = create_odoo_module(
         module_name="test_module",
@@ -113,6 +122,1204 @@ def test_prompts():
         print(f"✓ Prompt registered: {prompt}")
 
 
+def test_session_versions():
+    print("\n=== Testing Per-Session Versions ===")
+    
+    from mcp.shared.memory import create_connected_server_and_client_session
+    
+    async def run_sessions():
+        async with create_connected_server_and_client_session(mcp._mcp_server) as first:
+            async with create_connected_server_and_client_session(mcp._mcp_server) as second:
+                await first.call_tool("set_odoo_version", {"version": "17.0"})
+                await second.call_tool("set_odoo_version", {"version": "18.0"})
+                first_version = await first.call_tool("get_current_version", {})
+                second_version = await second.call_tool("get_current_version", {})
+                return first_version.content[0].text, second_version.content[0].text
+    
+    global_before = current_version["value"]
+    first_version, second_version = asyncio.run(run_sessions())
+    assert first_version.endswith("17.0"), first_version
+    assert second_version.endswith("18.0"), second_version
+    assert current_version["value"] == global_before
+    print(f"✓ Sessions keep their own version: {first_version[-4:]} / {second_version[-4:]}")
+    print(f"✓ Global default unchanged: {global_before}")
+
+
+def test_doc_index():
+    print("\n=== Testing Documentation Index ===")
+    
+    import tempfile
+    from odoo_mcp_server import DocIndex, write_index_snapshots, encode_postings, decode_postings
+    
+    doc_ids = [0, 1, 5, 127, 128, 300, 70000]
+    assert decode_postings(encode_postings(doc_ids)) == doc_ids
+    print(f"✓ Varint postings round-trip ({len(encode_postings(doc_ids))} bytes for {len(doc_ids)} ids)")
+    
+    with tempfile.TemporaryDirectory() as index_dir:
+        write_index_snapshots(Path(index_dir))
+        index = DocIndex.load(Path(index_dir) / "19.0.idx")
+        print(f"✓ Snapshot loaded via mmap: {len(index.docs)} documents")
+        
+        files = dict((uri, DOCS_BASE_PATH / relative) for relative, uri in get_all_rst_files("19.0"))
+        candidates = index.candidates("fields.command")
+        assert candidates
+        for doc_id in candidates:
+            assert index.uri_path(doc_id) in files
+        doc_id = candidates[0]
+        assert index.text(doc_id) == files[index.uri_path(doc_id)].read_text(encoding="utf-8")
+        print(f"✓ 'fields.command' narrowed to {len(candidates)} candidate documents")
+        
+        security = next(doc_id for doc_id in range(len(index.docs)) if index.uri_path(doc_id) == "reference/backend/security")
+        lines = files["reference/backend/security"].read_text(encoding="utf-8").split("\n")
+        hits = index.find_lines(security, "ir.model.access")
+        assert 0 < len(hits) <= 3
+        for number, snippet in hits:
+            assert "**ir.model.access**" in snippet.lower()
+            assert snippet.replace("**", "") == "\n".join(lines[max(0, number - 3):number + 2]).replace("**", "")
+        print(f"✓ Snippets sliced by line offsets with highlighted span ({len(hits)} hits)")
+        
+        assert index.posting("orm") and index.posting("\x00\x00\x00") == []
+        assert index.candidates("xyzzy-no-match") == []
+        print("✓ Unknown terms produce no candidates")
+        index.close()
+
+
+def test_docs_bundle():
+    print("\n=== Testing Documentation Bundle ===")
+    
+    import os
+    import tempfile
+    import odoo_mcp_server as server
+    
+    with tempfile.TemporaryDirectory() as bundle_dir:
+        bundle_path = Path(bundle_dir) / "docs.bundle"
+        stats = server.build_docs_bundle(DOCS_BASE_PATH, bundle_path)
+        assert stats["bundle_bytes"] < stats["raw_bytes"]
+        print(f"✓ Bundled {stats['files']} files: {stats['raw_bytes']} -> {stats['bundle_bytes']} bytes")
+        
+        bundle = server.DocsBundle(bundle_path)
+        directory = server.DocsDirectory(DOCS_BASE_PATH)
+        assert sorted(bundle.list_files("19.0", ".rst")) == sorted(directory.list_files("19.0", ".rst"))
+        assert bundle.read_bytes("19.0/reference/backend/orm.rst") == directory.read_bytes("19.0/reference/backend/orm.rst")
+        assert bundle.exists("19.0/howtos") and not bundle.exists("19.0/missing")
+        print("✓ Bundle listing and contents match docs/")
+        
+        expected = (
+            server.get_documentation_index("18.0"),
+            server.get_documentation_content("18.0", "reference/cli"),
+            server.search_documentation("ir.model.access", "18.0"),
+        )
+        os.environ[server.BUNDLE_ENV] = str(bundle_path)
+        server.clear_caches()
+        try:
+            served = (
+                server.get_documentation_index("18.0"),
+                server.get_documentation_content("18.0", "reference/cli"),
+                server.search_documentation("ir.model.access", "18.0"),
+            )
+            served_from = server.get_docs_source()
+            assert isinstance(served_from, server.DocsBundle)
+        finally:
+            del os.environ[server.BUNDLE_ENV]
+            server.clear_caches()
+            bundle.close()
+        assert served == expected
+        assert served_from.buffer.closed
+        print("✓ clear_caches closes the bundle mmap")
+        print("✓ Index, content and search served from the bundle match docs/")
+    
+    assert (DOCS_BASE_PATH / "../odoo_mcp_server.py").is_file()
+    assert not server.DocsDirectory(DOCS_BASE_PATH).is_file("../odoo_mcp_server.py")
+    assert not server.get_documentation_content("19.0", "reference%2Fcli").startswith("Documentation file not found")
+    for escape in ("..%2F18.0%2Freference%2Fcli", "reference%2F..%2F..%2F18.0%2Freference%2Fcli", "..%2F..%2FREADME"):
+        assert server.get_documentation_content("19.0", escape).startswith("Documentation file not found"), escape
+    assert server.version_relative("19.0", "howtos%2F..%2Freference%2Fcli.rst") == "19.0/reference/cli.rst"
+    print("✓ Paths outside docs/ and the version's docs root are rejected")
+    
+    with tempfile.TemporaryDirectory() as cache_home:
+        previous = os.environ.get("XDG_CACHE_HOME")
+        os.environ["XDG_CACHE_HOME"] = cache_home
+        try:
+            index_dir = server._cache_path("index")
+        finally:
+            if previous is None:
+                del os.environ["XDG_CACHE_HOME"]
+            else:
+                os.environ["XDG_CACHE_HOME"] = previous
+        assert index_dir == Path(cache_home) / "odoo_mcp" / "index"
+        assert index_dir.parent.stat().st_mode & 0o777 == 0o700
+    print("✓ Default index directory is a private per-user cache directory")
+
+
+def test_assets():
+    print("\n=== Testing Documentation Assets ===")
+    
+    import odoo_mcp_server as server
+    
+    listing = server.get_documentation_assets("howtos/website_themes/pages", "19.0")
+    assert "odoo://docs/19.0/assets/howtos%2Fwebsite_themes%2Fpages%2Fheader-overlay.png" in listing
+    assert "etag `" in listing
+    print("✓ get_documentation_assets lists image URIs with etags")
+    
+    data, digest = server.load_asset("19.0", "howtos/website_themes/pages/header-overlay.png")
+    assert data.startswith(b"\x89PNG")
+    again, same_digest = server.load_asset("19.0", "howtos/website_themes/pages/header-overlay.png")
+    assert again is data and same_digest == digest
+    print(f"✓ load_asset: {len(data)} bytes, served from cache on repeat")
+    
+    contents = list(asyncio.run(server.mcp.read_resource(
+        "odoo://docs/19.0/assets/howtos%2Fwebsite_themes%2Fpages%2Fheader-overlay.png"
+    )))
+    assert contents[0].mime_type == "image/png" and contents[0].content == data
+    print("✓ odoo://docs/{version}/assets/{path}.png serves image/png")
+    
+    templates = {template.uriTemplate: template.mimeType for template in asyncio.run(server.mcp.list_resource_templates())}
+    assert templates["odoo://docs/{version}/assets/{path}.gif"] == "image/gif"
+    assert templates["odoo://docs/{version}/assets/{path}.jpeg"] == "image/jpeg"
+    print("✓ .gif and .jpeg assets are registered")
+    
+    try:
+        server.load_asset("19.0", "../odoo_mcp_server.py")
+        assert False, "Unsupported asset type was served"
+    except ValueError:
+        print("✓ Non-image paths are rejected")
+
+
+def test_compact_output():
+    print("\n=== Testing Compact JSON Output ===")
+    
+    import json
+    import odoo_mcp_server as server
+    
+    markdown = server.create_odoo_model("test.model", "Test Model", [{"name": "test_field", "type": "Char"}])
+    compact = server.create_odoo_model(
+        "test.model", "Test Model", [{"name": "test_field", "type": "Char"}], output_format="json"
+    )
+    payload = json.loads(compact)
+    assert "class TestModel(models.Model):" in payload["files"]["models/test_model.py"]
+    assert payload["refs"]["conventions"] == "odoo://conventions/model"
+    assert "Naming Convention Rules" not in compact
+    assert len(compact) < len(markdown)
+    print(f"✓ create_odoo_model: {len(markdown)} -> {len(compact)} chars")
+    
+    payload = json.loads(server.create_security_rules("test.model", "test_module", output_format="json"))
+    assert set(payload["files"]) == {"security/ir.model.access.csv", "security/test_module_security.xml"}
+    print("✓ create_security_rules returns files keyed by path")
+    
+    payload = json.loads(server.search_documentation("ir.model.access", "19.0", "json"))
+    line, text = payload["results"][0]["hits"][0]
+    assert "**ir.model.access**" in text and "\n" not in text
+    print(f"✓ search_documentation returns hits as [line, text]: {payload['results'][0]['uri']}:{line}")
+    
+    assert server.get_conventions("model") in markdown
+    assert server.create_odoo_view("test.model", "form", ["name"], output_format="yaml").startswith("Unknown output format")
+    print("✓ Boilerplate served from odoo://conventions/{kind}")
+
+
+def test_rule_sections():
+    print("\n=== Testing Rules Section Index ===")
+    
+    import os
+    import tempfile
+    import odoo_mcp_server as server
+    
+    everything = server.get_development_guidelines("all")
+    views = server.get_development_guidelines("views")
+    assert "### View Naming Convention" in views
+    assert "## Security Standards" not in views
+    assert "### Field Types and Parameters" not in views
+    assert len(views) < len(everything) / 3
+    print(f"✓ views context: {len(views)} of {len(everything)} chars")
+    
+    results = server.search_development_rules("mapped")
+    assert "Performance Best Practices > ORM Usage" in results
+    assert server.search_development_rules("no-such-rule-text").startswith("No rules found")
+    print("✓ search_development_rules finds sections by content")
+    
+    original_rules = server.RULES_BASE_PATH
+    with tempfile.TemporaryDirectory() as rules_dir:
+        rule_file = Path(rules_dir) / "odoo-development.mdc"
+        rule_file.write_text("---\nalwaysApply: true\n---\n# Rules\n\n## Security Standards\n\nOld text\n", encoding="utf-8")
+        server.RULES_BASE_PATH = Path(rules_dir)
+        try:
+            assert "Old text" in server.get_development_guidelines("security")
+            rule_file.write_text("# Rules\n\n## Security Standards\n\nNew text\n", encoding="utf-8")
+            os.utime(rule_file, ns=(0, 1))
+            assert "New text" in server.get_development_guidelines("security")
+        finally:
+            server.RULES_BASE_PATH = original_rules
+            server.clear_caches()
+    print("✓ Cached sections are re-parsed when the rule file changes")
+
+
+def test_prompt_context():
+    print("\n=== Testing Doc-Grounded Prompts ===")
+    
+    import time
+    import odoo_mcp_server as server
+    
+    terms = dict(server.prompt_terms("psycopg2.errors.UniqueViolation in @api.depends of _compute_total on sale.order"))
+    assert {"uniqueviolation", "@api.depends", "_compute_total", "sale.order"} <= set(terms), terms
+    print(f"✓ Extracted {len(terms)} terms including exception, decorator, method and model names")
+    
+    error = "ValueError: Wrong @api.depends on _compute_total of sale.order"
+    start = time.perf_counter()
+    prompt = server.debug_odoo_error(error)
+    elapsed = (time.perf_counter() - start) * 1000
+    excerpts = prompt[prompt.index("Relevant excerpts"):]
+    assert "odoo://docs/" in excerpts and "@api.depends" in excerpts
+    assert "odoo://rules/odoo-development" in excerpts
+    assert len(excerpts) <= server.PROMPT_CONTEXT_BUDGET + 200, len(excerpts)
+    print(f"✓ debug_odoo_error embeds {len(excerpts)} chars of docs and rules ({elapsed:.1f} ms including index load)")
+    
+    source = "class Order(models.Model):\n    def action_done(self):\n        for order in self:\n            order.write({'state': 'done'})\n"
+    review = server.review_odoo_code(source)
+    assert "Performance Best Practices" in review[review.index("Relevant excerpts"):]
+    assert "model" not in dict(server.prompt_terms("class Order(models.Model):"))
+    source = "class Order(models.Model):\n    def action_done(self):\n        for order in self:\n            self.env['res.partner'].search([])\n"
+    review = server.review_odoo_code(source)
+    assert "Performance Best Practices" in review[review.index("Relevant excerpts"):]
+    assert "Relevant excerpts" in server.develop_odoo_feature("Kanban view of sale.order grouped by stage")
+    assert server.prompt_context("", "19.0") == ""
+    print("✓ review_odoo_code and develop_odoo_feature embed matching rules and docs")
+
+
+def test_module_spec():
+    print("\n=== Testing Module Generation from Spec ===")
+    
+    import json
+    from odoo_mcp_server import generate_module_from_spec
+    
+    spec = {
+        "module_name": "library",
+        "display_name": "Library",
+        "models": [
+            {
+                "name": "library.book",
+                "fields": [
+                    {"name": "author_id", "type": "Many2one", "comodel_name": "res.partner"},
+                    {"name": "tag_ids", "type": "Many2many", "comodel_name": "library.tag"},
+                ],
+                "record_rules": True,
+            },
+            {"name": "library.tag", "views": ["tree"]},
+            {"name": "res.partner", "inherit": "res.partner", "fields": [{"name": "is_author", "type": "Boolean"}]},
+        ],
+    }
+    payload = json.loads(generate_module_from_spec(spec, "json"))
+    files = payload["files"]
+    assert payload["manifest_data"] == [
+        "security/library_security.xml",
+        "security/ir.model.access.csv",
+        "views/library_book_views.xml",
+        "views/library_tag_views.xml",
+        "views/library_menus.xml",
+    ]
+    assert "'views/library_menus.xml'," in files["library/__manifest__.py"]
+    assert files["library/models/__init__.py"].count("from . import") == 3
+    assert "model_res_partner" not in files["library/security/ir.model.access.csv"]
+    assert '<field name="tag_ids"/>' not in files["library/views/library_book_views.xml"].split("<form>")[0]
+    print(f"✓ generate_module_from_spec: {len(files)} files, manifest data in load order")
+    
+    access = files["library/security/ir.model.access.csv"]
+    security = files["library/security/library_security.xml"]
+    assert "base.group_manager" not in access and ",library.group_manager,1,1,1,1" in access
+    assert '<record id="group_manager" model="res.groups">' in security
+    assert security.index('id="group_manager"') < security.index('model="ir.rule"')
+    assert ",base.group_user,1,0,0,0" in access
+    print("✓ Non-core groups are declared as module-local res.groups")
+    
+    spec["groups"] = ["user", {"name": "librarian", "label": "Librarian"}, "stock.group_stock_manager"]
+    payload = json.loads(generate_module_from_spec(spec, "json"))
+    access = payload["files"]["library/security/ir.model.access.csv"]
+    assert "access_library_book_librarian,library.librarian,model_library_book,library.group_librarian," in access
+    assert "access_library_book_stock_manager,library.stock_manager,model_library_book,stock.group_stock_manager," in access
+    assert "<field name=\"name\">Librarian</field>" in payload["files"]["library/security/library_security.xml"]
+    print("✓ Spec groups can be labelled local groups or external group XML IDs")
+    
+    result = generate_module_from_spec({"module_name": "library", "models": [{"name": "a.b", "views": ["pivot"]}]})
+    assert result.startswith("Invalid spec")
+    print("✓ Unsupported view types are rejected")
+
+
+def test_workspace_writes():
+    print("\n=== Testing Workspace Writes ===")
+    
+    import ast
+    import json
+    import os
+    import tempfile
+    import odoo_mcp_server as server
+    from code_checks import validate_generated_files
+    
+    spec = {"module_name": "library", "models": [{"name": "library.book"}]}
+    assert server.generate_module_from_spec(spec, "write").startswith("Error writing files")
+    print("✓ Writing is disabled without a workspace")
+    
+    with tempfile.TemporaryDirectory() as workspace:
+        os.environ[server.WORKSPACE_ENV] = workspace
+        try:
+            diff = server.generate_module_from_spec(spec, "diff")
+            assert "+++ b/library/__manifest__.py" in diff
+            assert not (Path(workspace) / "library").exists()
+            print("✓ diff mode reports new files without writing")
+            
+            result = json.loads(server.generate_module_from_spec(spec, "write"))
+            manifest = Path(workspace) / "library" / "__manifest__.py"
+            assert manifest.is_file()
+            assert {entry["status"] for entry in result["files"]} == {"created"}
+            assert not [path for path in Path(workspace).iterdir() if path.name.startswith(".odoo_mcp_staging_")]
+            print(f"✓ write mode created {len(result['files'])} files with sha256 hashes")
+            
+            result = json.loads(server.create_security_rules("library.tag", "library", output_format="write", target_dir="library"))
+            access = (Path(workspace) / "library" / "security" / "ir.model.access.csv").read_text(encoding="utf-8")
+            assert "access_library_book_user" in access and "access_library_tag_user" in access
+            assert server.generate_module_from_spec(spec, "diff").startswith("No changes")
+            print("✓ Existing access rights are merged, unchanged files are left alone")
+            
+            views_file = Path(workspace) / "library" / "views" / "library_shelf_views.xml"
+            server.create_odoo_view("library.shelf", "form", ["name"], output_format="write", target_dir="library")
+            result = json.loads(server.create_odoo_view("library.shelf", "tree", ["name"], output_format="write", target_dir="library"))
+            views = views_file.read_text(encoding="utf-8")
+            assert result["files"][0]["status"] == "updated"
+            assert 'id="view_library_shelf_form"' in views and 'id="view_library_shelf_list"' in views, views
+            assert validate_generated_files({"views.xml": views}) == []
+            print("✓ Views written one after another are merged into the existing file by record id")
+            
+            result = server.create_odoo_view("library.shelf", "form", ["name", "code"], output_format="write", target_dir="library")
+            assert result.startswith("Error writing files: Refusing to overwrite modified files: views/library_shelf_views.xml"), result
+            assert "overwrite=True" in server.create_odoo_view(
+                "library.shelf", "form", ["name", "code"], output_format="diff", target_dir="library"
+            )
+            result = json.loads(server.create_odoo_view(
+                "library.shelf", "form", ["name", "code"], output_format="write", target_dir="library", overwrite=True
+            ))
+            views = views_file.read_text(encoding="utf-8")
+            assert result["files"][0]["status"] == "updated"
+            assert '<field name="code"/>' in views and 'id="view_library_shelf_list"' in views
+            print("✓ Conflicting records are refused unless overwrite=True")
+            
+            server.create_odoo_module("library", "Library", "Books", depends=["mail"], output_format="write")
+            manifest = ast.literal_eval((Path(workspace) / "library" / "__manifest__.py").read_text(encoding="utf-8"))
+            assert manifest["depends"] == ["base", "mail"], manifest["depends"]
+            data = manifest["data"]
+            assert data.index("security/library_security.xml") < data.index("security/ir.model.access.csv") < data.index("views/library_book_views.xml"), data
+            init = (Path(workspace) / "library" / "models" / "__init__.py").read_text(encoding="utf-8")
+            assert "from . import library_book" in init and "# Import your models here" in init
+            print("✓ Manifest depends/data and __init__ imports are merged, not replaced")
+            
+            result = server.create_odoo_model("a.b", "AB", [], output_format="write", target_dir="../outside")
+            assert result.startswith("Error writing files")
+            print("✓ Paths outside the workspace are rejected")
+        finally:
+            del os.environ[server.WORKSPACE_ENV]
+
+
+def test_addons_index():
+    print("\n=== Testing Addons Index ===")
+    
+    import os
+    import tempfile
+    import odoo_mcp_server as server
+    from addons_index import ADDONS_PATH_ENV, AddonsIndex, parse_addon_file, process_pool
+    
+    with tempfile.TemporaryDirectory() as addons_dir:
+        root = Path(addons_dir)
+        for module, source in {
+            "base": (
+                "class Partner(models.Model):\n"
+                "    _name = 'res.partner'\n"
+                "    name = fields.Char()\n"
+                "    parent_id = fields.Many2one('res.partner')\n"
+            ),
+            "library": (
+                "class Book(models.Model):\n"
+                "    _name = 'library.book'\n"
+                "    author_id = fields.Many2one(comodel_name='res.partner')\n"
+                "class EBook(models.Model):\n"
+                "    _name = 'library.ebook'\n"
+                "    _inherit = 'library.book'\n"
+                "    url = fields.Char()\n"
+                "class Partner(models.Model):\n"
+                "    _inherit = 'res.partner'\n"
+                "    book_ids = fields.One2many('library.book', 'author_id')\n"
+            ),
+        }.items():
+            (root / module / "models").mkdir(parents=True)
+            (root / module / "__manifest__.py").write_text("{'name': '%s'}\n" % module, encoding="utf-8")
+            (root / module / "models" / "models.py").write_text(source, encoding="utf-8")
+        
+        cache_file = root / "cache.json"
+        index = AddonsIndex([root], cache_file)
+        assert index.parsed_files == 2
+        assert index.inheritance_chain("library.ebook") == ["library.ebook", "library.book"]
+        assert set(index.fields("library.ebook")) == {"author_id", "url"}
+        assert index.fields("res.partner")["book_ids"]["module"] == "library"
+        print(f"✓ Indexed {len(index.models)} models from {len(index.addons)} addons")
+        
+        assert AddonsIndex([root], cache_file).parsed_files == 0
+        models_file = root / "library" / "models" / "models.py"
+        models_file.write_text(models_file.read_text(encoding="utf-8") + "    isbn = fields.Char()\n", encoding="utf-8")
+        assert index.refresh() == 1
+        assert "isbn" in index.fields("res.partner")
+        print("✓ Per-file cache reused across runs and refreshed on change")
+        
+        for module, manifest in {"z_core": "{}", "a_ext": "{'depends': ['z_core']}"}.items():
+            (root / "order" / module).mkdir(parents=True)
+            (root / "order" / module / "__manifest__.py").write_text(manifest, encoding="utf-8")
+            (root / "order" / module / "models.py").write_text(
+                "class Thing(models.Model):\n    _name = 'x.thing'\n    _inherit = ['x.thing']\n    name = fields.Char()\n",
+                encoding="utf-8",
+            )
+        assert AddonsIndex([root / "order"]).fields("x.thing")["name"]["module"] == "a_ext"
+        with process_pool(2) as pool:
+            assert pool._mp_context.get_start_method() in ("forkserver", "spawn")
+            assert list(pool.map(parse_addon_file, [str(models_file)]))[0][0]["name"] == "library.book"
+        print("✓ Field provenance follows dependency order; workers are not forked from the server")
+        
+        os.environ[ADDONS_PATH_ENV] = str(root)
+        server.clear_caches()
+        try:
+            assert "still being built" in server.get_model_info("res.partner") or server.get_addons_index()
+            server.get_addons_index(wait=True)
+            info = server.get_model_info("res.partner")
+            assert "| book_ids | One2many | library.book | library |" in info
+            assert "library.book" in server.get_model_info("library")
+            print("✓ get_model_info lists fields with their defining module")
+            
+            model = server.create_odoo_model("library.shelf", "Shelf", [
+                {"name": "book_id", "type": "Many2one", "comodel_name": "library.boook"},
+            ])
+            assert "Comodel library.boook of field book_id is not defined" in model
+            view = server.create_odoo_view("res.partner", "form", ["name", "nickname", "display_name"])
+            assert "Field nickname does not exist on res.partner" in view
+            assert "display_name does not exist" not in view
+            print("✓ Generators warn about unknown comodels and fields")
+        finally:
+            del os.environ[ADDONS_PATH_ENV]
+            server.clear_caches()
+
+
+def test_module_dependencies():
+    print("\n=== Testing Module Dependency Graph ===")
+    
+    import os
+    import tempfile
+    import odoo_mcp_server as server
+    from addons_index import ADDONS_PATH_ENV
+    
+    manifests = {
+        "base": "{'name': 'Base'}",
+        "web": "{'depends': ['base']}",
+        "mail": "{'depends': ['base', 'web']}",
+        "sale": "# comment\n{'depends': ['mail', 'uom']}",
+        "loop_a": "{'depends': ['loop_b']}",
+        "loop_b": "{'depends': ['loop_a']}",
+        "broken": "{'depends': [os.getenv('X')]}",
+    }
+    with tempfile.TemporaryDirectory() as addons_dir:
+        for module, manifest in manifests.items():
+            (Path(addons_dir) / module).mkdir()
+            (Path(addons_dir) / module / "__manifest__.py").write_text(manifest, encoding="utf-8")
+        
+        os.environ[ADDONS_PATH_ENV] = addons_dir
+        server.clear_caches()
+        try:
+            graph = server.get_addons_index(wait=True).graph
+            assert graph.closure("sale") == {"mail", "web", "base", "uom"}
+            assert graph.reverse_closure("web") == {"mail", "sale"}
+            assert graph.install_order(["sale"]) == (["base", "web", "mail", "sale"], [])
+            assert graph.cycles() == [["loop_a", "loop_b"]]
+            print("✓ Closure, reverse dependencies, install order and cycles")
+            
+            report = server.get_module_dependencies("", "check")
+            assert "- sale -> uom" in report
+            assert "loop_a -> loop_b -> loop_a" in report
+            assert "broken: ValueError" in report
+            assert "3. mail" in server.get_module_dependencies("sale", "order")
+            print("✓ get_module_dependencies reports missing modules, cycles and bad manifests")
+            
+            module = server.create_odoo_module("demo", "Demo", "Demo", depends=["base", "mail", "nope"])
+            assert "Dependency base is already implied by mail" in module
+            assert "Dependency nope is not in the indexed addons" in module
+            print("✓ create_odoo_module flags redundant and unknown dependencies")
+        finally:
+            del os.environ[ADDONS_PATH_ENV]
+            server.clear_caches()
+
+
+def test_xml_ids():
+    print("\n=== Testing XML ID Index ===")
+    
+    import os
+    import tempfile
+    import odoo_mcp_server as server
+    from addons_index import ADDONS_PATH_ENV, AddonsIndex
+    
+    files = {
+        "base": ("views/base_menus.xml", '''<odoo>
+    <menuitem id="menu_custom" name="Custom">
+        <menuitem id="menu_custom_child" name="Child"/>
+    </menuitem>
+    <record id="view_partner_form" model="ir.ui.view">
+        <field name="model">res.partner</field>
+        <field name="arch" type="xml"><form><field name="model"/></form></field>
+    </record>
+</odoo>'''),
+        "library": ("views/partner_views.xml", '''<odoo><data>
+    <record id="view_partner_form_library" model="ir.ui.view">
+        <field name="model">res.partner</field>
+        <field name="inherit_id" ref="base.view_partner_form"/>
+        <field name="arch" type="xml"><field name="name" position="after"/></field>
+    </record>
+    <record id="action_res_partner" model="ir.actions.act_window"/>
+    <template id="layout" inherit_id="web.layout"/>
+</data></odoo>'''),
+    }
+    with tempfile.TemporaryDirectory() as addons_dir:
+        root = Path(addons_dir)
+        for module, (data_file, xml) in files.items():
+            (root / module / "views").mkdir(parents=True)
+            (root / module / "__manifest__.py").write_text(f"{{'data': ['{data_file}']}}", encoding="utf-8")
+            (root / module / data_file).write_text(xml, encoding="utf-8")
+        
+        cache_file = root / "cache.json"
+        index = AddonsIndex([root], cache_file)
+        assert index.xml_id("base.menu_custom_child")["parent"] == "base.menu_custom"
+        assert index.xml_id("base.view_partner_form")["res_model"] == "res.partner"
+        assert index.view_chain("library.view_partner_form_library") == [
+            "library.view_partner_form_library", "base.view_partner_form"
+        ]
+        assert index.inheriting_views["base.view_partner_form"] == ["library.view_partner_form_library"]
+        assert index.xml_id("library.layout")["inherit_id"] == "web.layout"
+        print(f"✓ Indexed {len(index.xml_ids)} XML IDs with menu parents and view inheritance")
+        
+        assert AddonsIndex([root], cache_file).parsed_files == 0
+        views_file = root / "library" / "views" / "partner_views.xml"
+        views_file.write_text(views_file.read_text(encoding="utf-8").replace("layout", "layout2"), encoding="utf-8")
+        assert index.refresh() == 1
+        assert index.xml_id("library.layout") is None and index.xml_id("library.layout2") is not None
+        print("✓ XML files reparsed only when changed")
+        
+        os.environ[ADDONS_PATH_ENV] = str(root)
+        server.clear_caches()
+        try:
+            server.get_addons_index(wait=True)
+            info = server.get_xml_id_info("base.view_partner_form")
+            assert "## Inherited By (1)" in info and "library.view_partner_form_library (library)" in info
+            assert "| library.view_partner_form_library | base.view_partner_form | library |" in (
+                server.get_xml_id_info(model_name="res.partner")
+            )
+            assert "base.view_partner_form" in server.get_xml_id_info("partner_form")
+            print("✓ get_xml_id_info shows definitions, inheritance and model views")
+            
+            view = server.create_odoo_view("res.partner", "form", ["name"], module_name="library")
+            assert "XML ID library.action_res_partner already exists" in view
+            assert "base.menu_custom is not defined" not in view
+            os.remove(root / "base" / "views" / "base_menus.xml")
+            server.clear_caches()
+            server.get_addons_index(wait=True)
+            assert "Referenced XML ID base.menu_custom is not defined" in server.create_odoo_view("res.partner", "form", ["name"])
+            print("✓ create_odoo_view flags XML ID collisions and missing menu parents")
+        finally:
+            del os.environ[ADDONS_PATH_ENV]
+            server.clear_caches()
+
+
+def test_performance_analysis():
+    print("\n=== Testing Performance Analysis ===")
+    
+    import os
+    import tempfile
+    import odoo_mcp_server as server
+    from code_checks import CHECKS_VERSION, analyze_performance
+    
+    source = '''import re
+from odoo import api, fields, models
+
+
+class Order(models.Model):
+    _name = 'x.order'
+    total = fields.Float(compute='_compute_total', store=True)
+
+    def _compute_total(self):
+        for order in self:
+            order.total = sum(order.line_ids.mapped('amount'))
+
+    def action_done(self, ids, vals_list, stream):
+        for order in self:
+            order.partner_id.search([])
+            order.write({'state': 'done'})
+            order.sudo().message_post(body='done')
+            re.search('x', order.name)
+            stream.write(order.name)
+        for line in self.line_ids:
+            self.env['x.line'].create({'origin_id': line.id})
+        for i in range(3):
+            self.search([('sequence', '=', i)]).write({'state': 'done'})
+        for model in ('x.line', 'x.tag'):
+            self.env[model].browse(ids)
+        return len(self.search([])), [self.browse(order.id) for order in self]
+'''
+    checks = [(finding["line"], finding["check"]) for finding in analyze_performance(source)]
+    assert checks == [
+        (9, "compute-without-depends"),
+        (15, "query-in-loop"),
+        (16, "write-in-loop"),
+        (17, "sudo-in-loop"),
+        (21, "create-in-loop"),
+        (26, "len-search"),
+        (26, "query-in-loop"),
+    ], checks
+    print(f"✓ {len(checks)} ORM anti-patterns flagged, re.search, stream.write and non-recordset loops ignored")
+    
+    with tempfile.TemporaryDirectory() as work_dir:
+        module = Path(work_dir) / "demo" / "models"
+        module.mkdir(parents=True)
+        (module / "order.py").write_text(source, encoding="utf-8")
+        (module / "clean.py").write_text("def f(self):\n    return self.search([])\n", encoding="utf-8")
+        os.environ[server.INDEX_DIR_ENV] = work_dir
+        os.environ[server.WORKSPACE_ENV] = work_dir
+        server.clear_caches()
+        try:
+            report = server.analyze_odoo_performance(str(module.parent))
+            assert "7 findings in 1 of 2 files (0 cached)" in report
+            assert "- L16 `write-in-loop`" in report
+            assert '"cached":2' in server.analyze_odoo_performance(str(module.parent), "json")
+            print("✓ analyze_odoo_performance reports per file and reuses cached results")
+            
+            assert "outside the workspace" in server.analyze_odoo_performance("/")
+            assert "outside the workspace" in server.analyze_odoo_performance(f"{module}/../../..")
+            cache = server.get_check_cache()
+            assert all(key.startswith(f"performance.py:{CHECKS_VERSION}:") for key in cache.results)
+            print("✓ Paths outside the allowed roots are refused; cache keys carry the analyzer version")
+            
+            assert "Line 16 (write-in-loop)" in server.review_odoo_code(source)
+            print("✓ review_odoo_code embeds the static findings")
+        finally:
+            del os.environ[server.INDEX_DIR_ENV]
+            del os.environ[server.WORKSPACE_ENV]
+            server.clear_caches()
+
+
+def test_lint():
+    print("\n=== Testing Rules Linter ===")
+    
+    import json
+    import os
+    import tempfile
+    import odoo_mcp_server as server
+    
+    sources = {
+        "models/book.py": '''from odoo import api, fields, models
+
+
+class library_book(models.Model):
+    _name = 'library_book'
+    active = fields.Boolean()
+    done = fields.Boolean()
+    partner = fields.Many2one('res.partner')
+    tags = fields.Many2many('library.tag')
+    total = fields.Float(compute='get_total')
+
+    @api.onchange('partner')
+    @api.depends('tags')
+    def partner_changed(self):
+        pass
+
+
+class BookTag(models.Model):
+    _name = 'library.book_tag'
+''',
+        "views/book_views.xml": '''<odoo>
+    <record id="book_form" model="ir.ui.view"/>
+    <record id="base.view_partner_form" model="ir.ui.view"/>
+    <menuitem id="books" name="Books"/>
+</odoo>
+''',
+        "security/ir.model.access.csv": "id,name\nbook_user,user\naccess_book_manager,manager\n",
+    }
+    with tempfile.TemporaryDirectory() as work_dir:
+        module = Path(work_dir) / "library"
+        for name, content in sources.items():
+            (module / name).parent.mkdir(parents=True, exist_ok=True)
+            (module / name).write_text(content, encoding="utf-8")
+        os.environ[server.INDEX_DIR_ENV] = work_dir
+        os.environ[server.WORKSPACE_ENV] = work_dir
+        server.clear_caches()
+        try:
+            report = server.lint_odoo_code(str(module))
+            checks = [line.split(" ", 2)[:2] for line in report.splitlines()[:-1]]
+            assert checks == [
+                ["models/book.py:4:", "class-name"],
+                ["models/book.py:5:", "model-name"],
+                ["models/book.py:7:", "boolean-prefix"],
+                ["models/book.py:8:", "many2one-suffix"],
+                ["models/book.py:9:", "x2many-suffix"],
+                ["models/book.py:10:", "compute-prefix"],
+                ["models/book.py:14:", "decorator-order"],
+                ["models/book.py:14:", "onchange-prefix"],
+                ["security/ir.model.access.csv:2:", "access-id"],
+                ["views/book_views.xml:2:", "view-id"],
+                ["views/book_views.xml:4:", "menu-id"],
+            ], checks
+            assert report.endswith("11 violations in 3 files (0 cached)")
+            payload = json.loads(server.lint_odoo_code(str(module), "json"))
+            assert payload["cached"] == 3 and payload["violations"][0][:3] == ["models/book.py", 4, "class-name"]
+            (module / "data").mkdir()
+            (module / "data" / "tags.csv").write_text(sources["security/ir.model.access.csv"], encoding="utf-8")
+            assert server.lint_odoo_code(str(module / "data")) == "0 violations in 1 files (0 cached)"
+            print(f"✓ {len(checks)} naming violations reported, cached on the second run")
+            
+            server.generate_module_from_spec({
+                "module_name": "shelf",
+                "display_name": "Shelf",
+                "models": [{"name": "shelf.box", "fields": [{"name": "owner_id", "type": "Many2one"}]}],
+            }, output_format="write", target_dir="generated")
+            assert server.lint_odoo_code(str(Path(work_dir) / "generated")).startswith("0 violations")
+            print("✓ Generated modules pass the linter")
+            
+            assert server.lint_odoo_code().splitlines()[-1].startswith("11 violations in ")
+            assert "outside the workspace" in server.lint_odoo_code("/")
+            del os.environ[server.WORKSPACE_ENV]
+            assert "No path given and no workspace configured" in server.lint_odoo_code()
+            os.environ[server.WORKSPACE_ENV] = work_dir
+            print("✓ An empty path lints the workspace; paths outside the allowed roots are refused")
+        finally:
+            del os.environ[server.INDEX_DIR_ENV]
+            del os.environ[server.WORKSPACE_ENV]
+            server.clear_caches()
+
+
+def test_generated_validation():
+    print("\n=== Testing Generated Code Validation ===")
+    
+    import ast
+    import json
+    import odoo_mcp_server as server
+    
+    model = server.create_odoo_model("x.order", "Customer's \"Order\"", [
+        {"name": "state", "type": "Selection", "selection": [("new", "New"), ("done", "It's done")]},
+    ], output_format="json")
+    code = json.loads(model)["files"]["models/x_order.py"]
+    assert ast.parse(code).body[1].body[1].value.value == "Customer's \"Order\""
+    assert "('done', \"It's done\")" in code
+    print("✓ Quotes in descriptions and selection labels are escaped")
+    
+    result = server.create_odoo_model("x.order", "Order", [
+        {"name": "line_ids", "type": "One2many"},
+        {"name": "state", "type": "Selection", "selection": "[('draft')"},
+        {"name": "class", "type": "Char"},
+        {"name": "amount", "type": "Money"},
+    ])
+    assert result.startswith("Generated code failed validation:")
+    assert "Field line_ids (One2many) needs comodel_name and inverse_name" in result
+    assert "Field state (Selection) needs a non-empty list of (value, label) pairs" in result
+    assert "Field name 'class' is not a valid Python identifier" in result
+    assert "Field amount has unknown type Money" in result
+    print("✓ Missing relational keys, bad selections, names and types fail fast")
+    
+    view = server.create_odoo_view("x.order<", "form", ["name"])
+    assert view.startswith("Generated code failed validation:") and "views/x_order<_views.xml:" in view
+    security = server.create_security_rules("x.order", "demo", ["user,admin"])
+    assert "security/ir.model.access.csv:2: 11 columns, header has 8" in security
+    assert "Generated code failed validation" not in server.generate_module_from_spec({
+        "module_name": "demo",
+        "display_name": 'Demo "Quoted" <App>',
+        "description": 'Says """hi"""',
+        "models": [{"name": "demo.item"}],
+    })
+    print("✓ Generated XML and CSV are parsed before being returned")
+
+
+def test_view_templates():
+    print("\n=== Testing Version-Aware View Templates ===")
+    
+    import json
+    import odoo_mcp_server as server
+    
+    legacy = server.render_view_record("x.order", "list", ["name"], version="17.0")
+    assert 'id="view_x_order_tree"' in legacy and "<tree>" in legacy
+    assert 't-name="kanban-box"' in server.render_view_record("x.order", "kanban", [], version="17.0")
+    assert "tree,form" in server.render_action_xml("x.order", version="17.0")
+    current = server.render_view_record("x.order", "tree", ["name"], version="18.0")
+    assert 'id="view_x_order_list"' in current and "<list>" in current and "<tree>" not in current
+    card = server.render_view_record("x.order", "kanban", ["name", "amount"], version="19.0")
+    assert 't-name="card"' in card and '<field name="amount"/>' in card
+    assert "list,form" in server.render_action_xml("x.order", version="18.0")
+    print("✓ 17.0 emits <tree>/kanban-box, 18.0+ emits <list>/card")
+    
+    assert server._current_session() is None
+    original = server.current_version["value"]
+    server.current_version["value"] = "19.0"
+    try:
+        view = json.loads(server.create_odoo_view("x.order", "list", ["name"], output_format="json", version="17.0"))
+        assert "<tree>" in view["files"]["views/x_order_views.xml"]
+        assert "tree,form" in server.create_odoo_view("x.order", "list", ["name"], version="17.0")
+        spec = json.loads(server.generate_module_from_spec(
+            {"module_name": "demo", "models": [{"name": "demo.item", "views": ["kanban"]}]}, output_format="json", version="17.0"
+        ))
+        assert 't-name="kanban-box"' in spec["files"]["demo/views/demo_item_views.xml"]
+        assert "odoo://docs/17.0/" in server.create_odoo_model("x.order", "Order", [], version="17.0")
+        assert "<list>" in server.create_odoo_view("x.order", "list", ["name"])
+    finally:
+        server.current_version["value"] = original
+    print("✓ Generators take an explicit version without a session")
+    
+    assert all(not server.view_dialect_mismatches(version) for version in server.ODOO_VERSIONS)
+    original = server.VIEW_DIALECTS["18.0"]
+    server.VIEW_DIALECTS["18.0"] = server.VIEW_DIALECTS["17.0"]
+    try:
+        mismatches = server.view_dialect_mismatches("18.0")
+    finally:
+        server.VIEW_DIALECTS["18.0"] = original
+    assert mismatches == [
+        "Odoo 18.0 docs use <list but the templates emit <tree",
+        'Odoo 18.0 docs use t-name="card" but the templates emit t-name="kanban-box"',
+    ], mismatches
+    print("✓ Template dialects match the bundled view architecture docs")
+
+
+def test_odoo_rpc():
+    print("\n=== Testing Odoo RPC Client ===")
+    
+    import json
+    import os
+    import select
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    import odoo_mcp_server as server
+    from odoo_rpc import RPC_POOL_SIZE_ENV, RPC_PROTOCOL_ENV, RPC_URL_ENV, OdooClient, RPCError
+    
+    schema = {
+        "stub.order": {
+            "name": {"type": "char", "string": "Name", "required": True},
+            "tag_ids": {"type": "many2many", "string": "Tags", "relation": "stub.tag"},
+        },
+        "stub.tag": {"name": {"type": "char", "string": "Tag"}},
+    }
+    calls = []
+    
+    class StubOdoo(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        
+        def log_message(self, *args):
+            pass
+        
+        def reply(self, payload, status=200):
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def dispatch(self, model, method, kwargs):
+            calls.append((model, method))
+            if method == "fields_get":
+                return schema[model]
+            if model == "ir.model":
+                return [{"model": name} for name in kwargs["domain"][0][2] if name in schema]
+            return [{"id": 1, "name": "SO001"}][:kwargs["limit"]]
+        
+        def do_POST(self):
+            params = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            if self.path.startswith("/drop/"):
+                calls.append(("drop", self.path))
+                self.close_connection = True
+                return
+            if self.path.startswith("/html/"):
+                body = b"<html><body>Database manager</body></html>"
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                self.close_connection = True
+                return
+            if self.path.startswith("/json/2/"):
+                if self.headers["Authorization"] != "bearer key":
+                    return self.reply({"message": "Invalid apikey"}, 401)
+                _, _, _, model, method = self.path.split("/")
+                return self.reply(self.dispatch(model, method, params))
+            args = params["params"]["args"]
+            if params["params"]["method"] == "login":
+                return self.reply({"jsonrpc": "2.0", "id": params["id"], "result": 2})
+            result = self.dispatch(args[3], args[4], args[6])
+            self.reply({"jsonrpc": "2.0", "id": params["id"], "result": result})
+    
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StubOdoo)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{httpd.server_address[1]}"
+    try:
+        client = OdooClient(url, "db", "admin", "admin", pool_size=2)
+        fields = client.fields_get(["stub.order", "stub.tag"])
+        assert fields["stub.order"]["name"]["required"] and "name" in fields["stub.tag"]
+        requests = client.requests
+        client.fields_get(["stub.order", "stub.tag"])
+        assert client.requests == requests
+        assert client.search_read("stub.order", [], ["name"], limit=1) == [{"id": 1, "name": "SO001"}]
+        assert client.pool.created <= 2, client.pool.created
+        client.close()
+        print(f"✓ JSON-RPC: {client.requests} requests over {client.pool.created} pooled connections, fields_get cached")
+        
+        html = OdooClient(f"{url}/html")
+        for _ in range(2):
+            try:
+                html.call("common", "version")
+                raise AssertionError("HTML reply accepted")
+            except RPCError as e:
+                assert "Invalid JSON-RPC reply" in str(e), e
+            idle = html.pool._idle.queue[-1]
+            select.select([idle.sock], [], [], 5)
+        assert html.pool.created == 2
+        html.close()
+        dropped = OdooClient(f"{url}/drop")
+        try:
+            dropped.call("object", "execute_kw")
+            raise AssertionError("dropped request succeeded")
+        except RPCError as e:
+            assert "Cannot reach Odoo" in str(e), e
+        assert calls.count(("drop", "/drop/jsonrpc")) == 1
+        dropped.close()
+        print("✓ Non-JSON replies raise RPCError; closed idle connections are replaced; sent requests are not retried")
+        
+        json2 = OdooClient(url, "db", password="key", protocol="json2")
+        assert "tag_ids" in json2.fields_get(["stub.order"])["stub.order"]
+        assert json2.existing_models(["stub.tag", "nope.model"]) == {"stub.tag"}
+        assert str(OdooClient(url, protocol="json2", password="bad").fields_get(["stub.tag"])["stub.tag"]) == "Invalid apikey"
+        json2.close()
+        print("✓ JSON-2: bearer auth, model existence check and error messages")
+        
+        os.environ[RPC_URL_ENV] = url
+        server.clear_caches()
+        try:
+            assert server.view_warnings("stub.order", ["name", "missing"]) == [
+                "Field missing does not exist on stub.order in the indexed addons"
+            ]
+            warnings = server.model_warnings(
+                [{"name": "x_ids", "type": "Many2many", "comodel_name": "nope.model"},
+                 {"name": "tag_ids", "type": "Many2many", "comodel_name": "stub.tag"}],
+                inherit="stub.order",
+            )
+            assert any("Comodel nope.model" in warning for warning in warnings), warnings
+            assert not any("stub.tag" in warning for warning in warnings), warnings
+            assert "| name | char |  | yes | Name |" in server.get_odoo_fields("stub.order")
+            assert json.loads(server.odoo_search_read("stub.order", fields=["name"])) == [{"id": 1, "name": "SO001"}]
+            print("✓ Generators fall back to the live schema; get_odoo_fields and odoo_search_read query it")
+        finally:
+            del os.environ[RPC_URL_ENV]
+            server.clear_caches()
+        assert server.get_odoo_fields("stub.order").startswith("No running Odoo configured")
+        
+        for name, value in ((RPC_URL_ENV, url), (RPC_PROTOCOL_ENV, "soap")):
+            os.environ[name] = value
+        try:
+            assert server.get_odoo_fields("stub.order").startswith("Odoo RPC is unavailable: Unknown RPC protocol: soap")
+            assert server.unknown_models(["stub.order"]) == []
+            os.environ[RPC_PROTOCOL_ENV] = "jsonrpc"
+            os.environ[RPC_POOL_SIZE_ENV] = "many"
+            server.clear_caches()
+            assert "Odoo RPC is unavailable" in server.odoo_search_read("stub.order")
+            print("✓ A bad RPC protocol or pool size reports the RPC as unavailable")
+        finally:
+            for name in (RPC_URL_ENV, RPC_PROTOCOL_ENV, RPC_POOL_SIZE_ENV):
+                os.environ.pop(name, None)
+            server.clear_caches()
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_extract_client():
+    print("\n=== Testing Extract API Client ===")
+    
+    import base64
+    import json
+    import logging
+    import os
+    import tempfile
+    import threading
+    import time
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    import odoo_mcp_server as server
+    from extract_client import EXTRACT_INBOX_ENV, EXTRACT_TOKEN_ENV, ExtractClient
+    
+    uploads = {}
+    polls = {}
+    tokens = set()
+    in_flight = [0, 0]
+    lock = threading.Lock()
+    
+    class StubExtract(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        
+        def log_message(self, *args):
+            pass
+        
+        def do_POST(self):
+            assert self.headers.get("Transfer-Encoding") is None
+            params = json.loads(self.rfile.read(int(self.headers["Content-Length"])))["params"]
+            if self.path.endswith("/parse"):
+                tokens.add(params["account_token"])
+                with lock:
+                    in_flight[0] += 1
+                    in_flight[1] = max(in_flight)
+                time.sleep(0.05)
+                with lock:
+                    in_flight[0] -= 1
+                content = base64.b64decode(params["documents"][0])
+                if content.startswith(b"BAD"):
+                    result = {"status": "error_unsupported_format", "status_msg": "Unsupported file format"}
+                else:
+                    token = f"doc{len(uploads)}"
+                    uploads[token] = content
+                    result = {"status": "success", "status_msg": "Success", "document_token": token}
+            else:
+                token = params["document_token"]
+                polls[token] = polls.get(token, 0) + 1
+                result = {"status": "processing", "status_msg": "Processing"}
+                if polls[token] >= 3:
+                    total = {"selected_value": {"content": len(uploads[token])}}
+                    result = {"status": "success", "status_msg": "Success", "results": [{"total": total}]}
+            body = json.dumps({"jsonrpc": "2.0", "id": 1, "result": result}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+    
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StubExtract)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{httpd.server_address[1]}"
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for i in range(6):
+                path = Path(tmp) / f"invoice_{i}.pdf"
+                path.write_bytes(os.urandom(200_000 + i))
+                paths.append(path)
+            
+            async def run_batch():
+                async with ExtractClient("null-token", url, concurrency=2, poll_interval=0.01) as client:
+                    return await client.process_batch(paths), client.requests
+            
+            results, requests = asyncio.run(run_batch())
+            assert [result["status"] for result in results] == ["success"] * 6
+            assert sorted(uploads.values(), key=len) == [path.read_bytes() for path in paths]
+            assert in_flight[1] == 2, in_flight
+            assert requests == 6 + 6 * 3
+            assert tokens == {"null-token"}
+            print(f"✓ 6 documents streamed and polled in {requests} requests, at most {in_flight[1]} uploads at once")
+            
+            (Path(tmp) / "bad.pdf").write_bytes(b"BAD")
+            (Path(tmp) / "notes.txt").write_text("skipped")
+            os.environ[EXTRACT_TOKEN_ENV] = "token"
+            os.environ["ODOO_MCP_EXTRACT_URL"] = url
+            assert asyncio.run(server.extract_documents(tmp)).startswith("Reading documents is disabled")
+            os.environ[EXTRACT_INBOX_ENV] = tmp
+            try:
+                report = asyncio.run(server.extract_documents(tmp, output_format="json"))
+                assert "outside the workspace" in asyncio.run(server.extract_documents(__file__))
+                (Path(tmp) / "escape.pdf").symlink_to(Path(__file__).resolve())
+                assert "outside the workspace" in asyncio.run(server.extract_documents(tmp))
+                (Path(tmp) / "escape.pdf").unlink()
+            finally:
+                del os.environ[EXTRACT_TOKEN_ENV]
+                del os.environ["ODOO_MCP_EXTRACT_URL"]
+            rows = {Path(row["path"]).name: row for row in json.loads(report)}
+            assert len(rows) == 7 and "notes.txt" not in rows
+            assert rows["bad.pdf"]["status"] == "error_unsupported_format"
+            assert rows["invoice_0.pdf"]["total"] == 200_000
+            assert asyncio.run(server.extract_documents(tmp)).startswith("No Extract API token configured")
+            del os.environ[EXTRACT_INBOX_ENV]
+            print("✓ extract_documents batches the inbox, refuses paths outside it and reports per-document errors")
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_metrics():
+    print("\n=== Testing Metrics ===")
+    
+    from odoo_mcp_server import (
+        search_documentation,
+        get_metrics,
+        get_prometheus_metrics,
+        handler_stats
+    )
+    
+    search_documentation("ir.model.access", "19.0")
+    search_documentation("ir.model.access", "19.0")
+    stats = handler_stats["search_documentation"]
+    assert stats.count >= 2
+    assert stats.cache_hits >= 1
+    print(f"✓ search_documentation timed: {stats.count} calls, {stats.bytes_out} bytes")
+    
+    report = get_metrics()
+    assert "| search_documentation |" in report
+    print("✓ odoo://metrics lists search_documentation")
+    
+    prometheus = get_prometheus_metrics()
+    assert 'odoo_mcp_handler_calls_total{handler="search_documentation"}' in prometheus
+    print("✓ odoo://metrics/prometheus exports counters and quantiles")
+
+
+def test_profiling():
+    print("\n=== Testing Profiling ===")
+    
+    from odoo_mcp_server import profile_tool_call
+    
+    report = profile_tool_call("search_documentation", {"query": "fields.Command", "version": "19.0"})
+    assert "# Profile for search_documentation" in report
+    assert "Top 25 functions by cumulative time" in report
+    assert "Top 25 allocation sites" in report
+    print(f"✓ profile_tool_call: Generated {len(report)} chars")
+    
+    result = profile_tool_call("unknown_tool")
+    assert result.startswith("Unknown handler")
+    print("✓ profile_tool_call rejects unknown handlers")
+    
+    result = profile_tool_call("create_odoo_module", {"module_name": "x_mod", "output_format": "write"})
+    assert result.startswith("Profiling only runs handlers read-only"), result
+    print("✓ profile_tool_call refuses handlers that would write files")
+    
+    import threading
+    import tracemalloc
+    arguments = {"query": "ir.model.access", "version": "19.0"}
+    reports = []
+    threads = [
+        threading.Thread(target=lambda: reports.append(profile_tool_call("search_documentation", arguments)))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(reports) == 4 and all(report.startswith("# Profile") for report in reports), reports
+    assert not tracemalloc.is_tracing()
+    print("✓ Concurrent profiled calls share tracemalloc and stop it once")
+
+
+def test_startup():
+    print("\n=== Testing Startup ===")
+    
+    import subprocess
+    import sys
+    import odoo_mcp_server as server
+    
+    probe = "import sys, odoo_mcp_server; print(sorted({'addons_index', 'code_checks', 'odoo_rpc', 'extract_client'} & set(sys.modules)))"
+    loaded = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, cwd=Path(__file__).parent, check=True)
+    assert loaded.stdout.strip() == "[]", loaded.stdout
+    print("✓ Importing the server loads none of the index, check, RPC or Extract helpers")
+    
+    server._warm_up["armed"] = True
+    server.get_current_version()
+    assert not server._warm_up["armed"]
+    print("✓ Dialect check and addons index start in the background on the first request")
+
+
 def test_mcp_server():
     print("\n=== Testing MCP Server ===")
     
@@ -132,6 +1339,27 @@ async def main():
         await test_resources()
         test_tools()
         test_prompts()
+        await asyncio.to_thread(test_session_versions)
+        test_doc_index()
+        test_docs_bundle()
+        await asyncio.to_thread(test_assets)
+        test_compact_output()
+        test_rule_sections()
+        test_prompt_context()
+        test_module_spec()
+        test_workspace_writes()
+        test_addons_index()
+        test_module_dependencies()
+        test_xml_ids()
+        test_performance_analysis()
+        test_lint()
+        test_generated_validation()
+        test_view_templates()
+        test_odoo_rpc()
+        await asyncio.to_thread(test_extract_client)
+        test_metrics()
+        test_profiling()
+        test_startup()
         test_mcp_server()
         
         print("\n" + "=" * 60)